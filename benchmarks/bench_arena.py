@@ -0,0 +1,109 @@
+"""Benchmark ArenaEngine ticks as the number of snakes grows.
+
+Each snake is steered by a cheap bot that turns toward a free neighboring
+cell using the shared occupancy grid, and dead snakes are respawned so the
+snake count stays constant. For comparison, the same collision results are
+computed by a reference pairwise scan of every head against every body.
+
+Usage:
+    python benchmarks/bench_arena.py [--counts 10 100 1000] [--size 256]
+                                     [--ticks 200] [--length 8]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.snake_game.arena import ArenaEngine  # noqa: E402
+from src.snake_game.types import Direction  # noqa: E402
+
+DIRECTIONS = list(Direction)
+
+
+def steer(arena: ArenaEngine) -> None:
+    """Turn every live snake toward a free neighboring cell."""
+    occupancy = arena.occupancy
+    neighbors = arena.board.neighbors
+    for i, snake in enumerate(arena.snakes):
+        if not arena.alive[i]:
+            continue
+        head = snake.cells[0]
+        if not occupancy[neighbors[snake.direction][head]] and random.random() < 0.9:
+            continue
+        free = [d for d in DIRECTIONS
+                if d is not snake.direction.opposite()
+                and not occupancy[neighbors[d][head]]]
+        if free:
+            arena.handle_input(i, random.choice(free))
+
+
+def pairwise_crashes(arena: ArenaEngine) -> int:
+    """Count crashed heads by scanning every body for every head.
+    
+    Returns:
+        Number of heads sharing a cell with any other segment
+    """
+    live = [snake for i, snake in enumerate(arena.snakes) if arena.alive[i]]
+    crashes = 0
+    for snake in live:
+        head = snake.cells[0]
+        hits = 0
+        for other in live:
+            for cell in other.cells:
+                if cell == head:
+                    hits += 1
+        crashes += hits > 1
+    return crashes
+
+
+def run(count: int, size: int, ticks: int, length: int, seed: int):
+    """Play a match with respawning snakes.
+    
+    Returns:
+        Tuple of (ticks per second, seconds per pairwise scan, deaths)
+    """
+    random.seed(seed)
+    arena = ArenaEngine(size, size, snake_count=count, initial_length=length)
+    deaths = 0
+    elapsed = 0.0
+    for _ in range(ticks):
+        steer(arena)
+        start = time.perf_counter()
+        deaths += len(arena.tick())
+        elapsed += time.perf_counter() - start
+        for i in range(count):
+            if not arena.alive[i]:
+                arena.respawn(i)
+    
+    # Time the reference scan on the final position (it is too slow to run
+    # every tick with many snakes)
+    start = time.perf_counter()
+    pairwise_crashes(arena)
+    pairwise = time.perf_counter() - start
+    return ticks / elapsed, pairwise, deaths
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--counts', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--size', type=int, default=256)
+    parser.add_argument('--ticks', type=int, default=200)
+    parser.add_argument('--length', type=int, default=8)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    
+    print(f"{'snakes':>7}{'ticks/s':>10}{'us/snake':>10}{'deaths':>8}"
+          f"{'pairwise ms/tick':>18}")
+    for count in args.counts:
+        rate, pairwise, deaths = run(count, args.size, args.ticks,
+                                     args.length, args.seed)
+        print(f"{count:>7}{rate:>10.0f}{1e6 / rate / count:>10.2f}{deaths:>8}"
+              f"{pairwise * 1000:>18.1f}")
+
+
+if __name__ == '__main__':
+    main()
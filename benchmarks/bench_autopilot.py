@@ -0,0 +1,61 @@
+"""Benchmark autopilot ticks per second on large boards.
+
+Runs the same seeded game with the incrementally repaired distance field
+and with a full BFS rebuild every tick.
+
+Usage:
+    python benchmarks/bench_autopilot.py [--ticks N] [--size N] [--seed N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.snake_game.autopilot import Autopilot  # noqa: E402
+from src.snake_game.game_engine import GameEngine  # noqa: E402
+from src.snake_game.types import GameState  # noqa: E402
+
+
+def run(size: int, ticks: int, seed: int, incremental: bool):
+    """Play one autopilot game and time it.
+    
+    Returns:
+        Tuple of (ticks played, seconds, score, autopilot)
+    """
+    random.seed(seed)
+    engine = GameEngine(board_width=size, board_height=size)
+    autopilot = Autopilot(engine, incremental=incremental)
+    
+    played = 0
+    start = time.perf_counter()
+    while played < ticks and engine.get_state() == GameState.RUNNING:
+        autopilot.step()
+        engine.tick()
+        played += 1
+    elapsed = time.perf_counter() - start
+    return played, elapsed, engine.get_score(), autopilot
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--ticks', type=int, default=5_000)
+    parser.add_argument('--size', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    
+    print(f"board {args.size}x{args.size}, up to {args.ticks} ticks")
+    print(f"{'mode':<13}{'ticks':>8}{'ticks/s':>10}{'score':>8}"
+          f"{'rebuilds':>10}{'repairs':>9}")
+    for name, incremental in (('rebuild', False), ('incremental', True)):
+        played, elapsed, score, autopilot = run(
+            args.size, args.ticks, args.seed, incremental)
+        print(f"{name:<13}{played:>8}{played / elapsed:>10.0f}{score:>8}"
+              f"{autopilot.rebuilds:>10}{autopilot.repairs:>9}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+"""Benchmark streaming sample export against buffering a whole run.
+
+Self-play samples are generated once and then written repeatedly, so only
+the export is timed: ``stream`` appends each sample to the open shard with
+``DatasetWriter.add``, ``batch`` appends runs of samples with ``add_batch``
+and ``buffer`` keeps the whole run in memory (as the exporter used to)
+before writing it. Reports samples/s, MB/s and the peak Python memory
+traced during the export, which stays flat for the streaming modes.
+
+Usage:
+    python benchmarks/bench_dataset.py [--samples 200000] [--size 20]
+                                       [--shard-rows 65536]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from array import array
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.snake_game.autopilot import Autopilot  # noqa: E402
+from src.snake_game.dataset import DatasetWriter  # noqa: E402
+from src.snake_game.game_engine import GameEngine  # noqa: E402
+from src.snake_game.selfplay import SampleBatch, play_step  # noqa: E402
+
+# Distinct samples generated and cycled through
+POOL = 2000
+
+# Samples per add_batch call
+BATCH = 256
+
+
+def make_pool(size: int):
+    """Play self-play steps to get realistic samples.
+    
+    Returns:
+        List of (observation, action, reward, done)
+    """
+    random.seed(1)
+    rng = random.Random(1)
+    engine = GameEngine(board_width=size, board_height=size)
+    autopilot = Autopilot(engine)
+    out = bytearray(size * size)
+    pool = []
+    for _ in range(POOL):
+        action, reward, done = play_step(engine, autopilot, rng, 0.1, out)
+        pool.append((bytes(out), action, reward, done))
+    return pool
+
+
+def make_batch(pool) -> SampleBatch:
+    """Pack the first BATCH samples of the pool into one batch."""
+    samples = pool[:BATCH]
+    return SampleBatch(
+        memoryview(b''.join(sample[0] for sample in samples)),
+        bytes(sample[1] for sample in samples),
+        array('f', (sample[2] for sample in samples)),
+        bytes(sample[3] for sample in samples),
+    )
+
+
+def export(mode: str, directory: str, pool, samples: int, size: int,
+           shard_rows: int):
+    """Write samples in one mode.
+    
+    Returns:
+        Tuple of (seconds, peak traced bytes)
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    with DatasetWriter(directory, size * size, shard_rows) as writer:
+        if mode == 'stream':
+            for i in range(samples):
+                writer.add(*pool[i % POOL])
+        elif mode == 'batch':
+            batch = make_batch(pool)
+            for _ in range(samples // BATCH):
+                writer.add_batch(batch)
+        else:
+            run = [pool[i % POOL] for i in range(samples)]
+            # Copies, as samples captured during a run would be
+            run = [(bytes(bytearray(obs)), action, reward, done)
+                   for obs, action, reward, done in run]
+            for sample in run:
+                writer.add(*sample)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--samples', type=int, default=200000)
+    parser.add_argument('--size', type=int, default=20)
+    parser.add_argument('--shard-rows', type=int, default=65536)
+    args = parser.parse_args()
+    
+    pool = make_pool(args.size)
+    samples = args.samples // BATCH * BATCH
+    row_bytes = args.size * args.size + 1 + 4 + 1
+    print(f"{samples} samples of {row_bytes} bytes, "
+          f"{args.shard_rows} rows per shard")
+    print(f"{'mode':>8}{'samples/s':>12}{'MB/s':>8}{'peak MiB':>10}")
+    for mode in ('stream', 'batch', 'buffer'):
+        directory = tempfile.mkdtemp(prefix='snake-dataset-')
+        try:
+            elapsed, peak = export(mode, directory, pool, samples, args.size,
+                                   args.shard_rows)
+        finally:
+            shutil.rmtree(directory)
+        print(f"{mode:>8}{samples / elapsed:>12.0f}"
+              f"{samples * row_bytes / elapsed / 1e6:>8.1f}"
+              f"{peak / 2 ** 20:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""Benchmark spawning and eating with thousands of food items.
+
+Compares FoodManager, which samples free cells without replacement from a
+partitioned pool, against the naive approach of one ``Food.spawn`` board
+scan per item. Each row fills the board with ``count`` items, then times a
+run of eat-and-replace cycles as ``check_collisions`` would do them.
+
+Usage:
+    python benchmarks/bench_food.py [--size 500] [--counts 1000 10000]
+                                    [--eats 10000] [--length 2000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.snake_game.food import Food, FoodManager  # noqa: E402
+from src.snake_game.game_board import GameBoard  # noqa: E402
+from src.snake_game.snake import Snake  # noqa: E402
+
+# Board scans timed for the naive approach (each is O(board))
+NAIVE_SPAWNS = 20
+
+
+def naive_spawn_seconds(board: GameBoard, snake: Snake) -> float:
+    """Time ``Food.spawn``, the per-item cost of the naive approach.
+    
+    Returns:
+        Mean seconds per spawned item
+    """
+    food = Food()
+    start = time.perf_counter()
+    for _ in range(NAIVE_SPAWNS):
+        food.spawn(board, snake)
+    return (time.perf_counter() - start) / NAIVE_SPAWNS
+
+
+def run(size: int, count: int, eats: int, length: int):
+    """Fill a board with food, then eat and replace items one at a time.
+    
+    Returns:
+        Tuple of (fill seconds, seconds per eat-and-replace, naive seconds
+        per item)
+    """
+    board = GameBoard(size, size)
+    snake = Snake((size // 2, size // 2), initial_length=length, board=board)
+    occupancy = snake.occupancy
+    manager = FoodManager(board)
+    
+    start = time.perf_counter()
+    manager.spawn(count, occupancy)
+    fill = time.perf_counter() - start
+    
+    # Eat random items; the membership test stands in for check_collisions
+    targets = random.choices(range(board.size), k=eats)
+    start = time.perf_counter()
+    for cell in targets:
+        if cell in manager:
+            manager.remove(cell)
+        else:
+            manager.remove(next(iter(manager)))
+        manager.spawn(1, occupancy)
+    cycle = (time.perf_counter() - start) / eats
+    
+    assert len(manager) == count
+    return fill, cycle, naive_spawn_seconds(board, snake)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=500)
+    parser.add_argument('--counts', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--eats', type=int, default=10000)
+    parser.add_argument('--length', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    
+    random.seed(args.seed)
+    print(f"board {args.size}x{args.size}, snake length {args.length}")
+    print(f"{'items':>8}{'fill ms':>10}{'naive fill ms':>15}"
+          f"{'eat+spawn us':>14}{'naive spawn us':>16}")
+    for count in args.counts:
+        fill, cycle, naive = run(args.size, count, args.eats, args.length)
+        print(f"{count:>8}{fill * 1000:>10.2f}{naive * count * 1000:>15.0f}"
+              f"{cycle * 1e6:>14.2f}{naive * 1e6:>16.0f}")
+
+
+if __name__ == '__main__':
+    main()
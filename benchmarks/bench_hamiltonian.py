@@ -0,0 +1,69 @@
+"""Benchmark full-board games driven by the Hamiltonian solver.
+
+Plays each board size to completion (the board-full victory raised by
+Food.spawn) and reports overall throughput plus the late game, once the
+snake covers three quarters of the board.
+
+Usage:
+    python benchmarks/bench_hamiltonian.py [--sizes 10 20 30] [--no-shortcuts]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.snake_game.game_engine import GameEngine  # noqa: E402
+from src.snake_game.hamiltonian import HamiltonianSolver  # noqa: E402
+from src.snake_game.types import GameState  # noqa: E402
+
+
+def run(size: int, shortcuts: bool, seed: int):
+    """Play one game to completion.
+    
+    Returns:
+        Tuple of (engine, total ticks, seconds, late ticks, late seconds)
+    """
+    random.seed(seed)
+    engine = GameEngine(board_width=size, board_height=size)
+    solver = HamiltonianSolver(engine, shortcuts=shortcuts)
+    late_length = engine.board.size * 3 // 4
+    
+    ticks = late_ticks = 0
+    late_start = None
+    start = time.perf_counter()
+    while engine.get_state() == GameState.RUNNING:
+        solver.step()
+        engine.tick()
+        ticks += 1
+        if late_start is None and len(engine.snake.cells) >= late_length:
+            late_start = time.perf_counter()
+            late_ticks = ticks
+    end = time.perf_counter()
+    late_start = late_start or end
+    return engine, ticks, end - start, ticks - late_ticks, end - late_start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10, 20, 30])
+    parser.add_argument('--no-shortcuts', action='store_true')
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    
+    print(f"{'board':<9}{'ticks':>9}{'seconds':>9}{'ticks/s':>10}"
+          f"{'late ticks/s':>14}{'full':>6}")
+    for size in args.sizes:
+        engine, ticks, elapsed, late_ticks, late_elapsed = run(
+            size, not args.no_shortcuts, args.seed)
+        full = len(engine.snake.cells) == engine.board.size
+        late_rate = late_ticks / late_elapsed if late_elapsed else 0.0
+        print(f"{size}x{size:<6}{ticks:>9}{elapsed:>9.2f}{ticks / elapsed:>10.0f}"
+              f"{late_rate:>14.0f}{'yes' if full else 'no':>6}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark what the lazily computed state hash costs the tick.
+
+For each snake length, runs ticks on a snake that never reaches food,
+reading ``state_hash()`` never, after every tick (an O(length) rehash
+each time, as a search keying every position would) and every
+``KEYFRAME_INTERVAL`` ticks (what replay recording reads).
+
+Usage:
+    python benchmarks/bench_hash.py [--size 200] [--lengths 10 1000 30000]
+                                    [--ticks 5000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.snake_game.game_engine import GameEngine  # noqa: E402
+from src.snake_game.replay import KEYFRAME_INTERVAL  # noqa: E402
+from src.snake_game.types import Direction  # noqa: E402
+
+
+def make_engine(size: int, length: int) -> GameEngine:
+    """Build an engine whose snake fills rows and moves along the last one.
+    
+    Returns:
+        Engine with a snake of ``length`` cells heading away from its body
+    """
+    engine = GameEngine(size, size)
+    body = [((size - 1 - i) if (i // size) % 2 == 0 else i % size,
+             size - 1 - i // size) for i in range(length)]
+    # Head at the end of the bottom row; moving down wraps to the empty top
+    engine.snake.body = body
+    engine.snake.direction = Direction.DOWN
+    engine.food.place(engine.board, (size // 2, size // 2 - 1))
+    engine.foods.clear()
+    engine.rehash()
+    return engine
+
+
+def measure(size: int, length: int, ticks: int, every: int) -> float:
+    """Time ticks with a hash read every ``every`` ticks (0: never).
+    
+    Returns:
+        Microseconds per tick
+    """
+    # The head runs down the free column above the body
+    run = size - 1 - -(-length // size)
+    elapsed = 0.0
+    done = 0
+    while done < ticks:
+        engine = make_engine(size, length)
+        tick = engine.tick
+        read = engine.state_hash
+        steps = min(run, ticks - done)
+        start = time.perf_counter()
+        for step in range(done, done + steps):
+            tick()
+            if every and step % every == 0:
+                read()
+        elapsed += time.perf_counter() - start
+        done += steps
+    return elapsed / ticks * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=200)
+    parser.add_argument('--lengths', type=int, nargs='+',
+                        default=[10, 1000, 30000])
+    parser.add_argument('--ticks', type=int, default=5000)
+    args = parser.parse_args()
+    
+    print(f"board {args.size}x{args.size}, {args.ticks} ticks")
+    print(f"{'length':>8}{'no hash us':>12}{'every tick us':>15}"
+          f"{'every ' + str(KEYFRAME_INTERVAL) + ' us':>14}")
+    for length in args.lengths:
+        times = [measure(args.size, length, args.ticks, every)
+                 for every in (0, 1, KEYFRAME_INTERVAL)]
+        print(f"{length:>8}{times[0]:>12.2f}{times[1]:>15.2f}{times[2]:>14.2f}")
+
+
+if __name__ == '__main__':
+    main()
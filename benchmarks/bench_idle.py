@@ -0,0 +1,76 @@
+"""Measure what a paused game costs while nobody is typing.
+
+Runs ``src/main.py`` under a pseudo-terminal (see ``latency_pty.py``),
+starts a game, pauses it and then leaves it alone for ``--seconds``.
+Reports the CPU time the game process used and the bytes and frames it
+wrote to the terminal during that window; a paused game has nothing new
+to show, so ideally all three are zero. Linux only (CPU time is read from
+/proc).
+
+Usage:
+    python benchmarks/bench_idle.py [--seconds 5] [--difficulty 2]
+"""
+
+import argparse
+import os
+import select
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from latency_pty import FRAME_END, PtyGame  # noqa: E402
+
+
+def cpu_seconds(pid: int) -> float:
+    """Get user + system CPU time of a process from /proc."""
+    with open(f'/proc/{pid}/stat') as f:
+        fields = f.read().rsplit(')', 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf('SC_CLK_TCK')
+
+
+def collect(fd: int, seconds: float) -> bytes:
+    """Read everything written to the pty for a while."""
+    data = []
+    deadline = time.perf_counter() + seconds
+    while True:
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            break
+        if select.select([fd], [], [], remaining)[0]:
+            try:
+                data.append(os.read(fd, 65536))
+            except OSError:
+                break
+    return b''.join(data)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--seconds', type=float, default=5.0)
+    parser.add_argument('--difficulty', choices=('1', '2', '3'), default='2')
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as home:
+        game = PtyGame(dict(os.environ, HOME=home, TERM='xterm'))
+        try:
+            time.sleep(0.3)
+            game.send(args.difficulty.encode() + b'\n')
+            collect(game.fd, 0.5)
+            game.send(b'p')
+            # Let the pause take effect and its frame go out
+            collect(game.fd, 0.5)
+            
+            cpu = cpu_seconds(game.pid)
+            output = collect(game.fd, args.seconds)
+            cpu = cpu_seconds(game.pid) - cpu
+        finally:
+            game.close()
+    
+    print(f"paused for {args.seconds:.1f} s: CPU {cpu * 1000:.0f} ms, "
+          f"{len(output)} bytes, {output.count(FRAME_END)} frames written")
+
+
+if __name__ == '__main__':
+    main()
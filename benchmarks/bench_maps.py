@@ -0,0 +1,96 @@
+"""Benchmark obstacle map loading and its effect on board setup and spawning.
+
+A random map is written to a temporary file, then timed for the first
+(parsing) load and for repeated cached loads. Board construction and food
+spawning are timed on the walled board against an open board of the same
+size, to show that walls cost nothing once seeded into occupancy.
+
+Usage:
+    python benchmarks/bench_maps.py [--size 500] [--density 0.2]
+                                    [--repeat 1000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.snake_game.food import Food  # noqa: E402
+from src.snake_game.game_board import GameBoard  # noqa: E402
+from src.snake_game.game_engine import GameEngine  # noqa: E402
+from src.snake_game.level_map import load_map  # noqa: E402
+
+
+def make_map_text(size: int, density: float, seed: int) -> str:
+    """Build a random square map with a clear strip for the snake's start.
+    
+    Returns:
+        Map text with walls at roughly ``density`` of the cells
+    """
+    rng = random.Random(seed)
+    rows = []
+    for y in range(size):
+        if y == size // 2:
+            rows.append('.' * (size // 2) + 'S' + '.' * (size - size // 2 - 1))
+        else:
+            rows.append(''.join('#' if rng.random() < density else '.'
+                                for _ in range(size)))
+    return '\n'.join(rows) + '\n'
+
+
+def timed(func, repeat: int) -> float:
+    """Time a function.
+    
+    Returns:
+        Mean seconds per call
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=500)
+    parser.add_argument('--density', type=float, default=0.2)
+    parser.add_argument('--repeat', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bench.map')
+        with open(path, 'w') as f:
+            f.write(make_map_text(args.size, args.density, args.seed))
+        
+        start = time.perf_counter()
+        level_map = load_map(path)
+        first = time.perf_counter() - start
+        cached = timed(lambda: load_map(path), args.repeat)
+    
+    print(f"map {level_map.width}x{level_map.height}, "
+          f"{level_map.wall_count} walls")
+    print(f"{'first load (parse)':<24}{first * 1000:>10.2f} ms")
+    print(f"{'cached load':<24}{cached * 1e6:>10.2f} us")
+    
+    size = args.size
+    boards = max(1, args.repeat // 100)
+    print(f"{'GameBoard open':<24}"
+          f"{timed(lambda: GameBoard(size, size), boards) * 1000:>10.2f} ms")
+    print(f"{'GameBoard walled':<24}"
+          f"{timed(lambda: GameBoard(level_map=level_map), boards) * 1000:>10.2f} ms")
+    
+    random.seed(args.seed)
+    food = Food()
+    for name, engine in (('open', GameEngine(size, size)),
+                         ('walled', GameEngine(level_map=level_map))):
+        spawn = timed(lambda: food.spawn(engine.board, engine.snake), boards)
+        print(f"{'Food.spawn ' + name:<24}{spawn * 1000:>10.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+"""Benchmark MCTS rollouts and play strength.
+
+Rollout throughput is measured for the undo-based RolloutEngine and for the
+naive alternative of deep-copying a GameEngine per rollout and ticking it.
+Then a few games are played per difficulty with the bot's tick-rate based
+time budget, next to the Autopilot for reference. Finally the same searches
+run with and without a transposition table, reporting search iterations
+(tree nodes) per second, the table's hit rate and its memory.
+
+Usage:
+    python benchmarks/bench_mcts.py [--size 20] [--games 2] [--max-ticks 1000]
+                                    [--table-size 65536]
+"""
+
+import argparse
+import copy
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.snake_game.autopilot import Autopilot  # noqa: E402
+from src.snake_game.game_engine import GameEngine  # noqa: E402
+from src.snake_game.mcts import MCTSBot, RolloutEngine  # noqa: E402
+from src.snake_game.transposition import TranspositionTable  # noqa: E402
+from src.snake_game.types import Difficulty, Direction, GameState  # noqa: E402
+
+# Moves per timed rollout and seconds spent timing each approach
+HORIZON = 30
+TIMING_SECONDS = 1.0
+
+# Iterations per decision when comparing transposition tables
+SEARCH_ITERATIONS = 2000
+DIRECTIONS = list(Direction)
+
+
+def rollout_rates(size: int):
+    """Time random rollouts from a fresh game.
+    
+    Returns:
+        Tuple of (undo-based rollouts/s, deep-copy rollouts/s)
+    """
+    engine = GameEngine(size, size)
+    
+    state = RolloutEngine(engine)
+    rollouts = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < TIMING_SECONDS:
+        for _ in range(HORIZON):
+            if state.move(random.choice(DIRECTIONS)) < 0:
+                break
+        state.rewind()
+        rollouts += 1
+    undo_rate = rollouts / (time.perf_counter() - start)
+    
+    rollouts = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < TIMING_SECONDS:
+        clone = copy.deepcopy(engine)
+        for _ in range(HORIZON):
+            clone.handle_input(random.choice(DIRECTIONS))
+            clone.tick()
+            if clone.state != GameState.RUNNING:
+                break
+        rollouts += 1
+    copy_rate = rollouts / (time.perf_counter() - start)
+    return undo_rate, copy_rate
+
+
+def play(bot_factory, size: int, games: int, max_ticks: int):
+    """Play games with a bot.
+    
+    Returns:
+        Tuple of (mean score, the last bot)
+    """
+    total = 0
+    bot = None
+    for _ in range(games):
+        engine = GameEngine(size, size)
+        bot = bot_factory(engine)
+        for _ in range(max_ticks):
+            if engine.get_state() != GameState.RUNNING:
+                break
+            bot.step()
+            engine.tick()
+        total += engine.get_score()
+    return total / games, bot
+
+
+def table_rates(size: int, decisions: int, table_size: int, seed: int):
+    """Run the same fixed-budget decisions with and without a table.
+    
+    Each decision searches for ``SEARCH_ITERATIONS`` iterations from the
+    positions of one game played by the bot without a table.
+    
+    Returns:
+        Tuple of (iterations/s without, iterations/s with, the table)
+    """
+    random.seed(seed)
+    engine = GameEngine(size, size, food_seed=seed)
+    positions = []
+    bot = MCTSBot(engine, budget=60.0, max_iterations=SEARCH_ITERATIONS)
+    for _ in range(decisions):
+        if engine.get_state() != GameState.RUNNING:
+            break
+        positions.append(copy.deepcopy(engine))
+        bot.step()
+        engine.tick()
+    
+    rates = []
+    table = TranspositionTable(table_size)
+    for use_table in (False, True):
+        random.seed(seed)
+        elapsed = 0.0
+        iterations = 0
+        for position in positions:
+            bot = MCTSBot(position, budget=60.0, max_iterations=SEARCH_ITERATIONS,
+                          table=table if use_table else None)
+            bot.choose_direction()
+            elapsed += bot.search_time
+            iterations += bot.iterations
+        rates.append(iterations / elapsed)
+    return rates[0], rates[1], table
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=20)
+    parser.add_argument('--games', type=int, default=2)
+    parser.add_argument('--max-ticks', type=int, default=1000)
+    parser.add_argument('--table-size', type=int, default=1 << 16)
+    parser.add_argument('--decisions', type=int, default=40)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    
+    random.seed(args.seed)
+    undo_rate, copy_rate = rollout_rates(args.size)
+    print(f"board {args.size}x{args.size}, {HORIZON}-move random rollouts")
+    print(f"{'RolloutEngine':<16}{undo_rate:>10.0f} rollouts/s")
+    print(f"{'deepcopy engine':<16}{copy_rate:>10.0f} rollouts/s")
+    print()
+    
+    print(f"{'bot':<16}{'budget ms':>10}{'score':>8}{'iter/s':>9}"
+          f"{'moves/s':>10}{'reused':>8}")
+    score, _ = play(Autopilot, args.size, args.games, args.max_ticks)
+    print(f"{'autopilot':<16}{'-':>10}{score:>8.0f}")
+    for difficulty in Difficulty:
+        score, bot = play(lambda engine: MCTSBot(engine, difficulty),
+                          args.size, args.games, args.max_ticks)
+        print(f"{'mcts ' + difficulty.name.lower():<16}{bot.budget * 1000:>10.1f}"
+              f"{score:>8.0f}{bot.iterations / bot.search_time:>9.0f}"
+              f"{bot.rollout_moves / bot.search_time:>10.0f}{bot.reused:>8}")
+    print()
+    
+    plain, cached, table = table_rates(args.size, args.decisions,
+                                       args.table_size, args.seed)
+    print(f"{SEARCH_ITERATIONS} iterations per decision, "
+          f"{args.decisions} decisions")
+    print(f"{'no table':<16}{plain:>10.0f} nodes/s")
+    print(f"{'table':<16}{cached:>10.0f} nodes/s  ({cached / plain:.2f}x), "
+          f"hit rate {table.hit_rate:.1%}, {len(table)} entries, "
+          f"{table.nbytes / 1024:.0f} KiB, {table.replacements} replaced, "
+          f"{table.rejections} rejected")
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,98 @@
+"""Benchmark rendering cost per backend, separately from the engine.
+
+Plays the same autopilot-driven game once per backend, rendering every
+tick, and times the render calls separately from the engine and
+autopilot. The ANSI backend writes to
+/dev/null, which measures frame composition and the write call but not
+the terminal. With --display, backends report that terminal size, so
+boards larger than it are drawn through the viewport; --minimap adds a
+minimap beside it.
+
+Usage:
+    python benchmarks/bench_render.py [--ticks 2000] [--size 20] [--display 80x24]
+                                      [--minimap braille|half]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.snake_game.autopilot import Autopilot  # noqa: E402
+from src.snake_game.game_engine import GameEngine  # noqa: E402
+from src.snake_game.render_backends import (  # noqa: E402
+    AnsiBackend, MemoryBackend, NullBackend,
+)
+from src.snake_game.minimap import Minimap  # noqa: E402
+from src.snake_game.renderer import Renderer  # noqa: E402
+from src.snake_game.types import GameState  # noqa: E402
+
+
+def run(size: int, ticks: int, backend, minimap: str, seed: int):
+    """Play a game, rendering every tick.
+    
+    Returns:
+        Tuple of (engine seconds, render seconds)
+    """
+    random.seed(seed)
+    engine = GameEngine(board_width=size, board_height=size)
+    renderer = Renderer(
+        backend=backend,
+        minimap=Minimap(engine.board, glyphs=minimap) if minimap else None,
+    )
+    autopilot = Autopilot(engine)
+    clock = time.perf_counter
+    engine_time = render_time = 0.0
+    for _ in range(ticks):
+        start = clock()
+        if engine.get_state() != GameState.RUNNING:
+            engine.restart()
+        autopilot.step()
+        engine.tick()
+        rendered = clock()
+        renderer.render(engine)
+        end = clock()
+        engine_time += rendered - start
+        render_time += end - rendered
+    return engine_time, render_time
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--ticks', type=int, default=2000)
+    parser.add_argument('--size', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--display', default=None,
+                        help='terminal size as COLUMNSxROWS (default: unbounded)')
+    parser.add_argument('--minimap', choices=('braille', 'half'), default=None)
+    args = parser.parse_args()
+    display = None
+    if args.display:
+        try:
+            display = tuple(int(n) for n in args.display.lower().split('x'))
+        except ValueError:
+            display = ()
+        if len(display) != 2:
+            parser.error('--display must look like 80x24')
+    
+    print(f"{'backend':<10}{'frames/s':>10}{'us/frame':>10}{'engine ticks/s':>16}")
+    with open(os.devnull, 'w') as devnull:
+        backends = {
+            'null': NullBackend(),
+            'memory': MemoryBackend(max_frames=1),
+            'ansi': AnsiBackend(devnull),
+        }
+        for name, backend in backends.items():
+            backend.get_size = lambda: display
+            engine_time, render_time = run(
+                args.size, args.ticks, backend, args.minimap, args.seed)
+            print(f"{name:<10}{args.ticks / render_time:>10.0f}"
+                  f"{render_time / args.ticks * 1e6:>10.1f}"
+                  f"{args.ticks / engine_time:>16.0f}")
+
+
+if __name__ == '__main__':
+    main()
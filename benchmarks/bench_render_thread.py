@@ -0,0 +1,107 @@
+"""Benchmark the game loop against a slow terminal, with and without a render thread.
+
+Runs the game loop of ``main.py`` (autopilot input, tick, render, sleep to
+the next tick) against a backend whose writes block for ``--write-ms``,
+like a congested terminal. Without a thread the renderer's frame skipping
+limits the damage, but every frame it does draw holds up the loop; with a
+``ThreadedBackend`` the loop only publishes frames. Reports how long the
+loop spent per tick outside its sleep, how many ticks ran late, and
+frames published versus displayed.
+
+Usage:
+    python benchmarks/bench_render_thread.py [--ticks 80] [--tick-rate 16]
+                                             [--write-ms 80] [--size 20]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.snake_game.autopilot import Autopilot  # noqa: E402
+from src.snake_game.game_engine import GameEngine  # noqa: E402
+from src.snake_game.render_backends import (  # noqa: E402
+    MemoryBackend, ThreadedBackend,
+)
+from src.snake_game.renderer import Renderer  # noqa: E402
+from src.snake_game.types import GameState  # noqa: E402
+
+
+class SlowBackend(MemoryBackend):
+    """Keeps frames, blocking on each write like a slow terminal."""
+    
+    def __init__(self, delay: float):
+        super().__init__(max_frames=1)
+        self.delay = delay
+    
+    def present(self, lines) -> None:
+        time.sleep(self.delay)
+        super().present(lines)
+
+
+def run(threaded: bool, ticks: int, tick_rate: int, delay: float, size: int):
+    """Run the loop for a number of ticks.
+    
+    Returns:
+        Tuple of (mean busy ms per tick, worst busy ms, late ticks,
+        frames published, frames displayed)
+    """
+    random.seed(1)
+    engine = GameEngine(board_width=size, board_height=size)
+    autopilot = Autopilot(engine)
+    slow = SlowBackend(delay)
+    backend = ThreadedBackend(slow) if threaded else slow
+    tick_duration = 1.0 / tick_rate
+    renderer = Renderer(backend=backend, frame_budget=0.5 * tick_duration)
+    
+    busy = []
+    for _ in range(ticks):
+        start = time.perf_counter()
+        if engine.get_state() != GameState.RUNNING:
+            engine.restart()
+        autopilot.step()
+        engine.tick()
+        renderer.render(engine)
+        elapsed = time.perf_counter() - start
+        busy.append(elapsed)
+        if elapsed < tick_duration:
+            time.sleep(tick_duration - elapsed)
+    
+    if threaded:
+        backend.close()
+        published, displayed = backend.published, backend.displayed
+    else:
+        published = renderer.frames_rendered + renderer.frames_dropped
+        displayed = slow.frame_count
+    late = sum(1 for elapsed in busy if elapsed > tick_duration)
+    return (sum(busy) / ticks * 1000, max(busy) * 1000, late,
+            published, displayed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--ticks', type=int, default=80)
+    parser.add_argument('--tick-rate', type=int, default=16)
+    parser.add_argument('--write-ms', type=float, default=80.0)
+    parser.add_argument('--size', type=int, default=20)
+    args = parser.parse_args()
+    
+    print(f"{args.ticks} ticks at {args.tick_rate} Hz, "
+          f"{args.write_ms:.0f} ms per frame write")
+    print(f"{'mode':>10}{'busy ms':>10}{'worst ms':>10}{'late':>6}"
+          f"{'published':>11}{'displayed':>11}")
+    for threaded in (False, True):
+        mean, worst, late, published, displayed = run(
+            threaded, args.ticks, args.tick_rate, args.write_ms / 1000,
+            args.size,
+        )
+        mode = 'thread' if threaded else 'serial'
+        print(f"{mode:>10}{mean:>10.2f}{worst:>10.2f}{late:>6}"
+              f"{published:>11}{displayed:>11}")
+
+
+if __name__ == '__main__':
+    main()
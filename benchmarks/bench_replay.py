@@ -0,0 +1,107 @@
+"""Benchmark archiving many games and seeking into them.
+
+Records autopilot games (with random turns mixed in) into one replay
+archive, then restores random (game, tick) positions. Each seek reads one
+index entry, binary-searches the game's keyframes and replays at most one
+keyframe interval, so its cost should not grow with the game length or the
+number of games; replaying from tick 0 is shown for comparison.
+
+Usage:
+    python benchmarks/bench_replay.py [--games 200] [--size 20]
+                                      [--interval 256] [--seeks 500]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.snake_game.autopilot import Autopilot  # noqa: E402
+from src.snake_game.game_engine import GameEngine  # noqa: E402
+from src.snake_game.replay import (  # noqa: E402
+    GameRecorder, ReplayArchive, ReplayWriter,
+)
+from src.snake_game.types import Direction, GameState  # noqa: E402
+
+# Longest game recorded
+MAX_TICKS = 20000
+
+
+def record(writers, seed: int, size: int, interval: int) -> int:
+    """Play one game and archive it with and without keyframes.
+    
+    Returns:
+        Ticks played
+    """
+    rng = random.Random(seed)
+    engine = GameEngine(size, size, food_seed=seed)
+    autopilot = Autopilot(engine)
+    recorders = (GameRecorder(engine, keyframe_interval=interval),
+                 GameRecorder(engine, keyframe_interval=MAX_TICKS + 1))
+    directions = list(Direction)
+    while engine.state == GameState.RUNNING and engine.tick_count < MAX_TICKS:
+        if rng.random() < 0.02:
+            engine.handle_input(rng.choice(directions))
+        else:
+            autopilot.step()
+        engine.tick()
+        for recorder in recorders:
+            recorder.capture()
+    for writer, recorder in zip(writers, recorders):
+        writer.add(recorder)
+    return engine.tick_count
+
+
+def seek_seconds(path: str, targets) -> float:
+    """Time restoring each (game, tick) target from an archive.
+    
+    Returns:
+        Mean seconds per restore
+    """
+    with ReplayArchive(path) as archive:
+        start = time.perf_counter()
+        for game, tick in targets:
+            archive.restore(game, tick)
+        return (time.perf_counter() - start) / len(targets)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--games', type=int, default=200)
+    parser.add_argument('--size', type=int, default=20)
+    parser.add_argument('--interval', type=int, default=256)
+    parser.add_argument('--seeks', type=int, default=500)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    
+    random.seed(args.seed)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'games.rpl')
+        # Same games with only the first and last keyframes: every seek
+        # replays from tick 0
+        plain_path = os.path.join(directory, 'plain.rpl')
+        start = time.perf_counter()
+        with ReplayWriter(path) as writer, ReplayWriter(plain_path) as plain:
+            ticks = [record((writer, plain), args.seed + game, args.size,
+                            args.interval)
+                     for game in range(args.games)]
+        elapsed = time.perf_counter() - start
+        size = os.path.getsize(path)
+        print(f"{args.games} games, {sum(ticks)} ticks recorded in "
+              f"{elapsed:.2f}s; archive {size / 1024:.0f} KiB "
+              f"({size / sum(ticks):.1f} bytes/tick), without keyframes "
+              f"{os.path.getsize(plain_path) / 1024:.0f} KiB")
+        
+        targets = [(game, random.randint(0, ticks[game]))
+                   for game in random.choices(range(args.games), k=args.seeks)]
+        seek = seek_seconds(path, targets)
+        replay = seek_seconds(plain_path, targets)
+    print(f"{'keyframe seek us':>18}{'replay from 0 us':>18}")
+    print(f"{seek * 1e6:>18.1f}{replay * 1e6:>18.1f}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""Benchmark the rewind buffer against a deep copy of the engine per tick.
+
+Plays an autopilot game through a ``RewindBuffer``, then rewinds and
+fast-forwards the whole history. Reports the recording overhead per tick,
+the cost of stepping back and forth, and memory per tick next to what
+keeping a ``copy.deepcopy`` of the engine for every tick would take.
+
+Usage:
+    python benchmarks/bench_rewind.py [--size 40] [--ticks 5000]
+                                      [--capacity 4096] [--food 1]
+"""
+
+import argparse
+import copy
+import os
+import pickle
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.snake_game.autopilot import Autopilot  # noqa: E402
+from src.snake_game.game_engine import GameEngine  # noqa: E402
+from src.snake_game.rewind import RewindBuffer  # noqa: E402
+from src.snake_game.types import GameState  # noqa: E402
+
+# Engine copies timed and measured for the naive approach
+NAIVE_COPIES = 20
+
+
+def play(engine: GameEngine, ticks: int, buffer=None) -> float:
+    """Play up to ``ticks`` autopilot ticks, through the buffer if given.
+    
+    Returns:
+        Seconds per tick, not counting the autopilot
+    """
+    autopilot = Autopilot(engine)
+    tick = buffer.tick if buffer is not None else engine.tick
+    clock = time.perf_counter
+    played = 0
+    elapsed = 0.0
+    while played < ticks and engine.state == GameState.RUNNING:
+        autopilot.step()
+        start = clock()
+        tick()
+        elapsed += clock() - start
+        played += 1
+    return elapsed / max(played, 1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=40)
+    parser.add_argument('--ticks', type=int, default=5000)
+    parser.add_argument('--capacity', type=int, default=4096)
+    parser.add_argument('--food', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    
+    random.seed(args.seed)
+    plain = play(GameEngine(args.size, args.size, food_count=args.food),
+                 args.ticks)
+    
+    random.seed(args.seed)
+    engine = GameEngine(args.size, args.size, food_count=args.food)
+    buffer = RewindBuffer(engine, capacity=args.capacity)
+    recorded = play(engine, args.ticks, buffer)
+    history = buffer.behind
+    
+    start = time.perf_counter()
+    buffer.rewind(history)
+    back = (time.perf_counter() - start) / history
+    start = time.perf_counter()
+    buffer.fast_forward(history)
+    forward = (time.perf_counter() - start) / history
+    
+    start = time.perf_counter()
+    for _ in range(NAIVE_COPIES):
+        copy.deepcopy(engine)
+    naive = (time.perf_counter() - start) / NAIVE_COPIES
+    naive_bytes = len(pickle.dumps(engine.snake.cells)) + len(
+        pickle.dumps((bytes(engine.snake.occupancy), bytes(engine.foods.mask))))
+    
+    print(f"board {args.size}x{args.size}, {history} ticks kept, "
+          f"snake length {len(engine.snake.cells)}")
+    print(f"{'':>14}{'us/tick':>10}{'bytes/tick':>12}")
+    print(f"{'plain tick':>14}{plain * 1e6:>10.2f}{'':>12}")
+    print(f"{'record':>14}{(recorded - plain) * 1e6:>10.2f}"
+          f"{buffer.nbytes / buffer.capacity:>12.0f}")
+    print(f"{'rewind':>14}{back * 1e6:>10.2f}{'':>12}")
+    print(f"{'fast-forward':>14}{forward * 1e6:>10.2f}{'':>12}")
+    print(f"{'deepcopy':>14}{naive * 1e6:>10.2f}{naive_bytes:>12}"
+          f"  (state bytes only, a lower bound)")
+
+
+if __name__ == '__main__':
+    main()
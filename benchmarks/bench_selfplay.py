@@ -0,0 +1,135 @@
+"""Benchmark self-play sample throughput against the number of workers.
+
+For each worker count, workers play autopilot games with random moves
+mixed in and hand every sample (observation, action, reward, done) to the
+parent, either through shared-memory rings (``SelfPlayPipeline``) or by
+pickling lists of samples through a ``multiprocessing.Queue``. The parent
+touches each batch's rewards, so both paths deliver readable samples.
+Reports samples/s, the parent's CPU time per sample (what receiving costs
+the consumer, whatever the core count) and how often producers or the
+consumer had to wait.
+
+Usage:
+    python benchmarks/bench_selfplay.py [--workers 1 2 4] [--samples 20000]
+                                        [--size 10] [--capacity 4096]
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.snake_game.autopilot import Autopilot  # noqa: E402
+from src.snake_game.game_engine import GameEngine  # noqa: E402
+from src.snake_game.selfplay import (SelfPlayPipeline,  # noqa: E402
+                                     play_step)
+
+# Samples per pickled message
+CHUNK = 256
+
+EPSILON = 0.1
+
+
+def produce_pickled(queue, samples: int, size: int, seed: int) -> None:
+    """Play games and send samples through a queue in pickled chunks."""
+    random.seed(seed)
+    rng = random.Random(seed)
+    engine = GameEngine(board_width=size, board_height=size)
+    autopilot = Autopilot(engine)
+    out = bytearray(size * size)
+    chunk = []
+    for _ in range(samples):
+        action, reward, done = play_step(engine, autopilot, rng, EPSILON, out)
+        chunk.append((bytes(out), action, reward, done))
+        if len(chunk) == CHUNK:
+            queue.put(chunk)
+            chunk = []
+    queue.put(chunk)
+    queue.put(None)
+
+
+def run_pickled(workers: int, samples: int, size: int):
+    """Collect samples through a queue.
+    
+    Returns:
+        Tuple of (samples per second, consumer CPU microseconds per sample)
+    """
+    queue = multiprocessing.Queue(maxsize=64)
+    processes = [multiprocessing.Process(target=produce_pickled,
+                                         args=(queue, samples, size, i))
+                 for i in range(workers)]
+    start = time.perf_counter()
+    for process in processes:
+        process.start()
+    cpu = time.process_time()
+    done = 0
+    count = 0
+    total = 0.0
+    while done < workers:
+        chunk = queue.get()
+        if chunk is None:
+            done += 1
+            continue
+        count += len(chunk)
+        total += sum(sample[2] for sample in chunk)
+    cpu = time.process_time() - cpu
+    elapsed = time.perf_counter() - start
+    for process in processes:
+        process.join()
+    assert count == workers * samples
+    return count / elapsed, cpu / count * 1e6
+
+
+def run_shared(workers: int, samples: int, size: int, capacity: int):
+    """Collect samples through shared-memory rings.
+    
+    Returns:
+        Tuple of (samples per second, consumer CPU microseconds per sample,
+        producer stalls, consumer waits)
+    """
+    start = time.perf_counter()
+    with SelfPlayPipeline(workers, samples, board_size=size,
+                          capacity=capacity, epsilon=EPSILON) as pipeline:
+        cpu = time.process_time()
+        count = 0
+        total = 0.0
+        for batch in pipeline.batches():
+            count += len(batch)
+            total += sum(batch.rewards)
+        cpu = time.process_time() - cpu
+        elapsed = time.perf_counter() - start
+        stalls = pipeline.stalls
+    assert count == workers * samples
+    return count / elapsed, cpu / count * 1e6, stalls, pipeline.waits
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--samples', type=int, default=20000,
+                        help="samples per worker")
+    parser.add_argument('--size', type=int, default=10)
+    parser.add_argument('--capacity', type=int, default=4096)
+    args = parser.parse_args()
+    
+    print(f"board {args.size}x{args.size}, {args.samples} samples per worker, "
+          f"{os.cpu_count()} CPUs")
+    print(f"{'workers':>8}{'shared/s':>12}{'pickled/s':>12}"
+          f"{'shared cpu us':>15}{'pickled cpu us':>16}"
+          f"{'stalls':>9}{'waits':>9}")
+    for workers in args.workers:
+        shared, shared_cpu, stalls, waits = run_shared(
+            workers, args.samples, args.size, args.capacity
+        )
+        pickled, pickled_cpu = run_pickled(workers, args.samples, args.size)
+        print(f"{workers:>8}{shared:>12.0f}{pickled:>12.0f}"
+              f"{shared_cpu:>15.2f}{pickled_cpu:>16.2f}"
+              f"{stalls:>9}{waits:>9}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+"""Benchmark the per-tick cost of GameEngine.
+
+Compares the packed-cell engine against a reference model of the original
+tuple-based tick (tuple heads, post-hoc wrap-around, body slice for the
+self-collision check) and reports time and transient memory per tick.
+Time is the best of several runs, since a busy host only adds to it;
+memory is the traced peak minus current around single ticks, less the
+same figure for an empty call (what measuring costs).
+
+Usage:
+    python benchmarks/bench_tick.py [--ticks N] [--size N] [--length N]
+                                    [--repeats N]
+"""
+
+import argparse
+import itertools
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.snake_game.game_engine import GameEngine  # noqa: E402
+from src.snake_game.types import Direction, GameState  # noqa: E402
+
+
+class TupleTickModel:
+    """Reference model of the original tuple-based engine tick."""
+    
+    def __init__(self, width: int, height: int, length: int):
+        self.width = width
+        self.height = height
+        self.direction = Direction.RIGHT
+        self.body = [(width // 2 - i, height // 2) for i in range(length)]
+        self.food = (0, 0)
+        self.grow_pending = False
+    
+    def move(self, new_direction: Direction) -> None:
+        if new_direction != self.direction.opposite():
+            self.direction = new_direction
+        dx, dy = self.direction.value
+        head_x, head_y = self.body[0]
+        self.body.insert(0, (head_x + dx, head_y + dy))
+        if not self.grow_pending:
+            self.body.pop()
+    
+    def tick(self) -> None:
+        self.move(self.direction)
+        
+        head_x, head_y = self.body[0]
+        wrapped = False
+        if head_x < 0:
+            head_x = self.width - 1
+            wrapped = True
+        elif head_x >= self.width:
+            head_x = 0
+            wrapped = True
+        if head_y < 0:
+            head_y = self.height - 1
+            wrapped = True
+        elif head_y >= self.height:
+            head_y = 0
+            wrapped = True
+        if wrapped:
+            self.body[0] = (head_x, head_y)
+        
+        head = self.body[0]
+        if head in self.body[1:]:
+            raise RuntimeError("unexpected self collision")
+        if head == self.food:
+            raise RuntimeError("unexpected food")
+
+
+def make_engine(size: int, length: int) -> GameEngine:
+    """Create an engine whose snake never meets food while moving right."""
+    engine = GameEngine(board_width=size, board_height=size)
+    y = size // 2
+    engine.snake.body = [(size // 2 - i, y) for i in range(length)]
+    while engine.food.get_position()[1] == y:
+        engine.food.spawn(engine.board, engine.snake)
+    engine.rehash()
+    return engine
+
+
+def transient_bytes(call, sample: int) -> float:
+    """Mean traced peak minus current around single calls."""
+    tracemalloc.start()
+    transient = 0
+    for _ in itertools.repeat(None, sample):
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        call()
+        _, peak = tracemalloc.get_traced_memory()
+        transient += peak - current
+    tracemalloc.stop()
+    return transient / sample
+
+
+def measure(tick, ticks: int, repeats: int):
+    """Time ``tick`` and measure transient memory allocated per call.
+    
+    Returns:
+        Tuple of (microseconds per tick, transient bytes per tick)
+    """
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in itertools.repeat(None, ticks):
+            tick()
+        best = min(best, time.perf_counter() - start)
+    
+    sample = min(ticks, 10_000)
+    transient = (transient_bytes(tick, sample)
+                 - transient_bytes(lambda: None, sample))
+    return best / ticks * 1e6, transient
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--ticks', type=int, default=200_000)
+    parser.add_argument('--size', type=int, default=20)
+    parser.add_argument('--length', type=int, default=15)
+    parser.add_argument('--repeats', type=int, default=5)
+    args = parser.parse_args()
+    if not 0 < args.length < args.size:
+        parser.error("--length must be positive and shorter than --size")
+    
+    engine = make_engine(args.size, args.length)
+    packed_us, packed_bytes = measure(engine.tick, args.ticks, args.repeats)
+    assert engine.get_state() == GameState.RUNNING
+    
+    model = TupleTickModel(args.size, args.size, args.length)
+    tuple_us, tuple_bytes = measure(model.tick, args.ticks, args.repeats)
+    
+    print(f"board {args.size}x{args.size}, length {args.length}, "
+          f"{args.ticks} ticks")
+    print(f"{'model':<10}{'us/tick':>10}{'bytes/tick':>12}")
+    print(f"{'tuple':<10}{tuple_us:>10.3f}{tuple_bytes:>12.1f}")
+    print(f"{'packed':<10}{packed_us:>10.3f}{packed_bytes:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
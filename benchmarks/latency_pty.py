@@ -0,0 +1,180 @@
+"""Measure input-to-display latency of the real game loop under a pty.
+
+Runs ``src/main.py`` once per difficulty inside a pseudo-terminal with
+``SNAKE_LATENCY_LOG`` set, types a key script (turns that never reverse,
+so every key changes the snake's heading), then quits. Two views of the
+latency are reported per tick rate:
+
+- internal: the game's own stage histograms (queued, tick, render,
+  total), written by ``LatencyTracker``; they start when the game reads
+  the key, so time spent waiting for the loop to wake up is not included
+- external: from writing a key into the pty until the next complete frame
+  (its bottom border) arrives on the pty, i.e. what a terminal would see
+
+HOME is pointed at a temporary directory so the real high score file is
+left alone. Unix only.
+
+Usage:
+    python benchmarks/latency_pty.py [--keys 40] [--interval 0.15]
+"""
+
+import argparse
+import json
+import os
+import pty
+import select
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.snake_game.latency import LatencyHistogram  # noqa: E402
+from src.snake_game.types import Difficulty  # noqa: E402
+
+MAIN = os.path.join(os.path.dirname(__file__), '..', 'src', 'main.py')
+
+# Menu choices for each difficulty
+CHOICES = {Difficulty.EASY: b'1\n', Difficulty.MEDIUM: b'2\n', Difficulty.HARD: b'3\n'}
+
+# Starting heading is RIGHT; each key turns without ever reversing
+KEY_SCRIPT = (b'w', b'd', b's', b'd')
+
+# Bottom-right border character, ending every frame
+FRAME_END = '╝'.encode()
+
+
+class PtyGame:
+    """A game process running under a pseudo-terminal."""
+    
+    def __init__(self, env: dict):
+        """Start the game.
+        
+        Args:
+            env: Environment for the child process
+        """
+        self.pid, self.fd = pty.fork()
+        if self.pid == 0:
+            os.execve(sys.executable, [sys.executable, MAIN], env)
+        self.frames = 0
+        self._tail = b''
+    
+    def drain(self, timeout: float) -> float:
+        """Read output until ``timeout`` seconds pass without a new frame.
+        
+        Args:
+            timeout: Seconds to wait for the next frame
+        
+        Returns:
+            perf_counter time at which the first new frame completed, or
+            None if no frame arrived in time
+        """
+        deadline = time.perf_counter() + timeout
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return None
+            if not select.select([self.fd], [], [], remaining)[0]:
+                return None
+            try:
+                data = os.read(self.fd, 65536)
+            except OSError:
+                return None
+            if not data:
+                return None
+            
+            # Keep a short tail so a border split across reads is found
+            found = (self._tail + data).count(FRAME_END) - self._tail.count(FRAME_END)
+            self._tail = data[-len(FRAME_END):]
+            if found:
+                self.frames += found
+                return time.perf_counter()
+    
+    def send(self, data: bytes) -> None:
+        """Type bytes into the terminal.
+        
+        Args:
+            data: Bytes to write
+        """
+        os.write(self.fd, data)
+    
+    def close(self) -> None:
+        """Quit the game and reap the process."""
+        self.send(b'q')
+        end = time.perf_counter() + 2.0
+        while time.perf_counter() < end:
+            if self.drain(0.1) is None:
+                pid, _ = os.waitpid(self.pid, os.WNOHANG)
+                if pid:
+                    break
+        else:
+            os.kill(self.pid, 9)
+            os.waitpid(self.pid, 0)
+        os.close(self.fd)
+
+
+def measure(difficulty: Difficulty, keys: int, interval: float):
+    """Play one scripted game and collect both latency views.
+    
+    Returns:
+        Tuple of (internal report dict, external LatencyHistogram)
+    """
+    with tempfile.TemporaryDirectory() as home:
+        log = os.path.join(home, 'latency.json')
+        env = dict(os.environ, HOME=home, SNAKE_LATENCY_LOG=log, TERM='xterm')
+        game = PtyGame(env)
+        external = LatencyHistogram()
+        try:
+            time.sleep(0.3)
+            game.send(CHOICES[difficulty])
+            game.drain(1.0)
+            
+            for i in range(keys):
+                # Let the current frame go by so the next one is fresh
+                game.drain(interval)
+                sent = time.perf_counter()
+                game.send(KEY_SCRIPT[i % len(KEY_SCRIPT)])
+                # The first frame may already be in flight; the key shows
+                # up by the frame after at the latest
+                shown = game.drain(1.0)
+                if shown is not None:
+                    external.record((shown - sent) * 1000)
+        finally:
+            game.close()
+        
+        with open(log) as f:
+            internal = json.load(f)
+    return internal, external
+
+
+def describe(name: str, summary: dict) -> str:
+    """Format one histogram summary as a table row."""
+    if not summary['count']:
+        return f"  {name:<10}{'no samples':>10}"
+    return (f"  {name:<10}{summary['count']:>6}{summary['mean_ms']:>9.1f}"
+            f"{summary['p50_ms']:>9.1f}{summary['p90_ms']:>9.1f}"
+            f"{summary['p99_ms']:>9.1f}{summary['max_ms']:>9.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--keys', type=int, default=40,
+                        help='keys typed per difficulty')
+    parser.add_argument('--interval', type=float, default=0.15,
+                        help='seconds between keys')
+    args = parser.parse_args()
+    
+    for difficulty in Difficulty:
+        internal, external = measure(difficulty, args.keys, args.interval)
+        tick_rate = difficulty.get_tick_rate()
+        print(f"{difficulty.name} ({tick_rate} Hz, tick {1000 / tick_rate:.1f} ms)")
+        print(f"  {'stage':<10}{'n':>6}{'mean':>9}{'p50':>9}{'p90':>9}"
+              f"{'p99':>9}{'max':>9}   (ms)")
+        for stage, summary in internal.get(str(tick_rate), {}).items():
+            print(describe(stage, summary))
+        print(describe('external', external.to_dict()))
+        print()
+
+
+if __name__ == '__main__':
+    main()
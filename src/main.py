@@ -1,12 +1,41 @@
 """Main entry point for the Snake Game."""
 
-import sys
+import os
 import time
+from snake_game.events import EventType
 from snake_game.game_engine import GameEngine
 from snake_game.input_handler import InputHandler
+from snake_game.render_backends import ThreadedBackend, create_backend
 from snake_game.renderer import Renderer
 from snake_game.types import GameState, Difficulty
 from snake_game.high_score import HighScoreManager
+from snake_game.latency import LatencyTracker
+from snake_game.level_map import load_map
+from snake_game.minimap import Minimap
+from snake_game.rewind import RewindBuffer
+
+# Set to a file path to record input-to-display latency histograms there
+LATENCY_LOG_ENV = 'SNAKE_LATENCY_LOG'
+
+# Render backend name: ansi (default), curses or null
+RENDERER_ENV = 'SNAKE_RENDERER'
+
+# Set to 1 to write frames from a render thread, so the game loop never
+# waits on the terminal (default: write from the game loop)
+RENDER_THREAD_ENV = 'SNAKE_RENDER_THREAD'
+
+# Minimap glyphs beside the board: braille or half (default: no minimap)
+MINIMAP_ENV = 'SNAKE_MINIMAP'
+
+# Path to an obstacle map file (default: open board)
+MAP_ENV = 'SNAKE_MAP'
+
+# Seconds of play kept for rewinding with B/F while paused or after a
+# crash (default: no rewind)
+REWIND_ENV = 'SNAKE_REWIND'
+
+# Fraction of a tick a frame write may take before frames are skipped
+RENDER_BUDGET_FRACTION = 0.5
 
 
 def select_difficulty() -> Difficulty:
@@ -33,37 +62,43 @@ def select_difficulty() -> Difficulty:
         return Difficulty.MEDIUM
 
 
-def wait_for_input(timeout=0.1):
-    """Wait for keyboard input with platform-specific handling.
-    
-    Args:
-        timeout: Maximum time to wait in seconds
-        
-    Returns:
-        Input character or None
-    """
-    try:
-        import select
-        # Unix-like systems
-        if select.select([sys.stdin], [], [], timeout)[0]:
-            return sys.stdin.read(1)
-    except (ImportError, OSError):
-        # Windows or non-Unix systems - use basic approach
-        # Note: This is a simplified version for the game to run
-        pass
-    return None
-
-
 def main():
     """Run the snake game."""
     # Select difficulty level
     difficulty = select_difficulty()
     
+    # Optional latency instrumentation
+    latency_log = os.environ.get(LATENCY_LOG_ENV)
+    latency = None
+    if latency_log:
+        latency = LatencyTracker(tick_rate=difficulty.get_tick_rate())
+    
     # Initialize game components
-    engine = GameEngine()
-    input_handler = InputHandler()
-    renderer = Renderer()
+    map_path = os.environ.get(MAP_ENV)
+    engine = GameEngine(level_map=load_map(map_path) if map_path else None)
+    input_handler = InputHandler(latency=latency)
+    minimap_glyphs = os.environ.get(MINIMAP_ENV)
+    backend = create_backend(os.environ.get(RENDERER_ENV, 'ansi'))
+    threaded = os.environ.get(RENDER_THREAD_ENV) == '1'
+    if threaded:
+        # Frames are flushed by the thread, so it reports them to the tracker
+        backend = ThreadedBackend(backend, latency=latency)
+    renderer = Renderer(
+        backend=backend,
+        minimap=Minimap(engine.board, glyphs=minimap_glyphs) if minimap_glyphs else None,
+        latency=None if threaded else latency,
+        frame_budget=RENDER_BUDGET_FRACTION / difficulty.get_tick_rate(),
+    )
     high_score_manager = HighScoreManager()
+    rewind_seconds = os.environ.get(REWIND_ENV)
+    rewind = None
+    if rewind_seconds:
+        capacity = max(1, int(float(rewind_seconds) * difficulty.get_tick_rate()))
+        rewind = RewindBuffer(engine, capacity=capacity)
+    
+    # Save the high score as soon as a game ends
+    engine.subscribe(lambda event: high_score_manager.save(event.value),
+                     EventType.GAME_OVER)
     
     # Configure terminal
     input_handler.configure_terminal()
@@ -73,12 +108,16 @@ def main():
         running = True
         tick_rate = difficulty.get_tick_rate()
         tick_duration = 1.0 / tick_rate
+        # Whether the pause screen must be drawn before waiting for a key
+        pause_stale = True
         
         while running:
             start_time = time.time()
             
             if engine.get_state() == GameState.RUNNING:
-                # Process input
+                pause_stale = True
+                
+                # Drain pending keys; apply at most one queued direction per tick
                 direction = input_handler.get_input()
                 if direction:
                     engine.handle_input(direction)
@@ -93,42 +132,54 @@ def main():
                         engine.toggle_pause()
                 
                 # Update game state
-                engine.tick()
+                if rewind is not None:
+                    rewind.tick()
+                else:
+                    engine.tick()
+                if latency is not None:
+                    latency.tick_completed()
                 
-                # Render
+                # Render (skipped while the terminal is backpressured)
                 renderer.render(engine, high_score_manager.get_high_score())
                 
             elif engine.get_state() == GameState.PAUSED:
-                # Render paused state
-                renderer.render(engine, high_score_manager.get_high_score())
+                # Nothing changes while paused: draw once, then sleep on input
+                if pause_stale:
+                    renderer.render(engine, high_score_manager.get_high_score())
+                    pause_stale = False
                 
-                # Wait for unpause or quit
-                char = wait_for_input(0.1)
-                if char:
-                    if input_handler.should_quit(char):
-                        running = False
-                        break
-                    elif input_handler.should_pause(char):
-                        engine.toggle_pause()
+                # Wait for unpause, rewind or quit
+                # (None: input ended, so nothing could ever resume the game)
+                char = input_handler.wait_for_char(None)
+                if char is None or input_handler.should_quit(char):
+                    running = False
+                    break
+                elif input_handler.should_pause(char):
+                    engine.toggle_pause()
+                elif rewind is not None and input_handler.should_rewind(char):
+                    pause_stale = rewind.rewind(tick_rate) > 0
+                elif rewind is not None and input_handler.should_fast_forward(char):
+                    pause_stale = rewind.fast_forward(tick_rate) > 0
                 
             elif engine.get_state() == GameState.GAME_OVER:
-                # Save high score
-                high_score_manager.save(engine.get_score())
-                
                 # Display game over screen
                 renderer.display_game_over(engine.get_score())
                 
-                # Wait for restart or quit
+                # Wait for restart or quit; the screen stays as drawn
                 while engine.get_state() == GameState.GAME_OVER:
-                    # Check for input using helper function
-                    char = wait_for_input(0.1)
-                    if char:
-                        if input_handler.should_quit(char):
-                            running = False
-                            break
-                        elif input_handler.should_restart(char):
-                            engine.restart()
-                            break
+                    char = input_handler.wait_for_char(None)
+                    if char is None or input_handler.should_quit(char):
+                        running = False
+                        break
+                    elif input_handler.should_restart(char):
+                        engine.restart()
+                        break
+                    elif rewind is not None and input_handler.should_rewind(char):
+                        # Back to before the crash, paused
+                        rewind.rewind(tick_rate)
+                        engine.pause()
+                        pause_stale = True
+                        break
             
             # Maintain tick rate
             elapsed = time.time() - start_time
@@ -143,8 +194,14 @@ def main():
         # Restore terminal
         input_handler.restore_terminal()
         renderer.clear_screen()
+        renderer.backend.close()
+        if latency is not None:
+            latency.write_json(latency_log)
         print("Thanks for playing!")
         print(f"High Score: {high_score_manager.get_high_score()}")
+        if threaded:
+            print(f"Frames: {backend.published} published, "
+                  f"{backend.displayed} displayed")
 
 
 if __name__ == "__main__":
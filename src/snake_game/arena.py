@@ -0,0 +1,226 @@
+"""ArenaEngine for matches with many snakes on one board."""
+
+import random
+from itertools import islice
+from typing import TYPE_CHECKING, List, Optional, Tuple
+from .food import FoodManager
+from .game_board import GameBoard
+from .game_engine import FOOD_SCORE
+from .snake import Snake
+from .types import Cell, Collision, Direction, GameState
+
+if TYPE_CHECKING:
+    from .level_map import LevelMap
+
+# Placement attempts per snake before the board counts as too crowded
+MAX_PLACEMENT_ATTEMPTS = 100
+
+
+class ArenaEngine:
+    """Runs a match between many snakes on one wrapping board.
+    
+    All snakes share one occupancy grid, which acts as a spatial hash keyed
+    by packed cell: after every snake has moved, a head cell counted more
+    than once is a crash. Only the crashed snakes are examined further to
+    tell head-to-head, head-to-body and self collisions apart, so a tick
+    costs O(snakes) rather than a pairwise scan of bodies. Crashes are
+    resolved simultaneously: snakes meeting head to head all die, and a
+    snake may move into a cell another snake's tail leaves on the same tick.
+    """
+    
+    def __init__(self, board_width: int = 40, board_height: int = 40,
+                 snake_count: int = 4, initial_length: int = 3,
+                 food_count: Optional[int] = None,
+                 level_map: Optional['LevelMap'] = None):
+        """Initialize the arena.
+        
+        Args:
+            board_width: Width of the game board (default: 40)
+            board_height: Height of the game board (default: 40)
+            snake_count: Number of snakes (default: 4)
+            initial_length: Initial length of every snake (default: 3)
+            food_count: Food items kept on the board (default: one per snake)
+            level_map: Optional obstacle map; its size overrides the board
+                width and height
+        
+        Raises:
+            ValueError: If there are no snakes or they do not fit the board
+        """
+        if snake_count < 1:
+            raise ValueError("An arena needs at least one snake")
+        self.board = GameBoard(board_width, board_height, level_map=level_map)
+        self.snake_count = snake_count
+        self.initial_length = initial_length
+        self.food_count = food_count if food_count is not None else snake_count
+        self.restart()
+    
+    def restart(self) -> None:
+        """Restart the match with freshly placed snakes and food."""
+        self.occupancy = bytearray(self.board.walls)
+        self._heads = bytearray(self.board.size)
+        self.snakes: List[Snake] = []
+        self.alive: List[bool] = []
+        self.scores: List[int] = []
+        self.deaths: List[Optional[Collision]] = []
+        self.foods = FoodManager(self.board)
+        self.state = GameState.RUNNING
+        self.tick_count = 0
+        
+        for _ in range(self.snake_count):
+            self.snakes.append(self._place_snake())
+            self.alive.append(True)
+            self.scores.append(0)
+            self.deaths.append(None)
+        self._alive_count = self.snake_count
+        self._fill_food()
+    
+    def handle_input(self, index: int, direction: Direction) -> None:
+        """Queue a direction change for one snake.
+        
+        Args:
+            index: Index of the snake
+            direction: New direction to move
+        """
+        if self.state == GameState.RUNNING and self.alive[index]:
+            snake = self.snakes[index]
+            if direction != snake.direction.opposite():
+                snake.direction = direction
+    
+    def tick(self) -> List[Tuple[int, Collision]]:
+        """Move every snake, resolve crashes and eat food.
+        
+        Returns:
+            (snake index, collision kind) for each snake that died this tick
+        """
+        if self.state != GameState.RUNNING:
+            return []
+        self.tick_count += 1
+        
+        snakes = self.snakes
+        alive = [i for i, is_alive in enumerate(self.alive) if is_alive]
+        heads = self._heads
+        for i in alive:
+            snake = snakes[i]
+            snake.move(snake.direction)
+            heads[snake.cells[0]] += 1
+        
+        occupancy = self.occupancy
+        crashed: List[Tuple[int, Collision]] = []
+        eaten = 0
+        for i in alive:
+            snake = snakes[i]
+            head = snake.cells[0]
+            if occupancy[head] > 1:
+                crashed.append((i, self._classify(snake, head)))
+            elif head in self.foods:
+                self.foods.remove(head)
+                snake.grow()
+                self.scores[i] += FOOD_SCORE
+                eaten += 1
+        for i in alive:
+            heads[snakes[i].cells[0]] = 0
+        
+        # Remove crashed snakes only after every crash has been classified
+        for i, collision in crashed:
+            self.alive[i] = False
+            self.deaths[i] = collision
+            snakes[i].body = []
+        self._alive_count -= len(crashed)
+        
+        if eaten:
+            self._fill_food()
+        if self._alive_count == 0 or (self.snake_count > 1 and self._alive_count == 1):
+            self.state = GameState.GAME_OVER
+        return crashed
+    
+    def respawn(self, index: int) -> None:
+        """Bring a dead snake back at a random free spot.
+        
+        Args:
+            index: Index of the snake
+        
+        Raises:
+            ValueError: If no free spot is found
+        """
+        if self.alive[index]:
+            return
+        self.snakes[index] = self._place_snake()
+        self.alive[index] = True
+        self.deaths[index] = None
+        self._alive_count += 1
+        if self.state == GameState.GAME_OVER:
+            self.state = GameState.RUNNING
+    
+    def alive_count(self) -> int:
+        """Get the number of snakes still in the match.
+        
+        Returns:
+            Number of live snakes
+        """
+        return self._alive_count
+    
+    def get_state(self) -> GameState:
+        """Get the current game state.
+        
+        Returns:
+            Current GameState
+        """
+        return self.state
+    
+    def get_score(self, index: int) -> int:
+        """Get one snake's score.
+        
+        Args:
+            index: Index of the snake
+        
+        Returns:
+            The snake's score
+        """
+        return self.scores[index]
+    
+    def _classify(self, snake: Snake, head: Cell) -> Collision:
+        """Tell what a crashed snake ran into.
+        
+        Args:
+            snake: The crashed snake
+            head: Its head cell
+        
+        Returns:
+            The kind of collision
+        """
+        if self.board.walls[head]:
+            return Collision.WALL
+        if self._heads[head] > 1:
+            return Collision.HEAD_TO_HEAD
+        if head in islice(snake.cells, 1, None):
+            return Collision.SELF
+        return Collision.BODY
+    
+    def _place_snake(self) -> Snake:
+        """Create a snake laid straight on free cells, away from food.
+        
+        Returns:
+            The new snake, registered in the shared occupancy grid
+        
+        Raises:
+            ValueError: If no free spot is found
+        """
+        board = self.board
+        for _ in range(MAX_PLACEMENT_ATTEMPTS):
+            direction = random.choice(list(Direction))
+            x = random.randrange(board.width)
+            y = random.randrange(board.height)
+            dx, dy = direction.value
+            cells = {
+                board.to_cell(x - i * dx, y - i * dy)
+                for i in range(self.initial_length)
+            }
+            if len(cells) == self.initial_length and not any(
+                    self.occupancy[cell] or cell in self.foods for cell in cells):
+                return Snake((x, y), self.initial_length, direction,
+                             board=board, occupancy=self.occupancy)
+        raise ValueError("Arena is too crowded to place another snake")
+    
+    def _fill_food(self) -> None:
+        """Spawn food until ``food_count`` items are on the board."""
+        self.foods.spawn(self.food_count - len(self.foods), self.occupancy)
@@ -0,0 +1,245 @@
+"""Autopilot that steers the snake along shortest paths to the food."""
+
+import heapq
+from collections import deque
+from typing import TYPE_CHECKING, List, Optional
+from .types import Cell, Direction, Position
+
+if TYPE_CHECKING:
+    from .game_engine import GameEngine
+
+
+class Autopilot:
+    """Steers a GameEngine's snake toward the food on the wrapping board.
+    
+    The autopilot keeps a BFS distance field rooted at the food cell, with
+    snake-occupied cells treated as blocked. Between food spawns only the
+    head and tail cells change each tick, so the field is repaired locally:
+    the new head cell is blocked (re-deriving distances only for the cells
+    whose shortest paths ran through it) and the freed tail cell is opened
+    (propagating any shorter distances outward). The field is rebuilt from
+    scratch only when the food moves or the snake changes unexpectedly.
+    """
+    
+    def __init__(self, engine: 'GameEngine', incremental: bool = True):
+        """Initialize the autopilot.
+        
+        Args:
+            engine: The game engine to steer
+            incremental: Repair the distance field between ticks instead of
+                rebuilding it every tick (default: True)
+        """
+        self.engine = engine
+        self.incremental = incremental
+        
+        # Counters for benchmarks and debugging
+        self.rebuilds = 0
+        self.repairs = 0
+        
+        self._snake = None
+        self._target: Optional[Cell] = None
+        self._head: Optional[Cell] = None
+        self._tail: Optional[Cell] = None
+        self._dist: List[int] = []
+        self._unreachable = 0
+    
+    def step(self) -> Direction:
+        """Choose a direction and feed it to ``GameEngine.handle_input``.
+        
+        Returns:
+            The direction chosen
+        """
+        direction = self.choose_direction()
+        self.engine.handle_input(direction)
+        return direction
+    
+    def choose_direction(self) -> Direction:
+        """Choose the next direction for the snake.
+        
+        Picks the non-reversing move into a free cell that is closest to the
+        food. If the food is unreachable, any free cell is preferred over a
+        blocked one, keeping the current direction when possible.
+        
+        Returns:
+            The direction to move in
+        """
+        self._sync()
+        
+        snake = self.engine.snake
+        head = snake.cells[0]
+        occupancy = snake.occupancy
+        dist = self._dist
+        neighbors = self.engine.board.neighbors
+        current = snake.direction
+        reverse = current.opposite()
+        
+        best = current
+        best_dist = self._unreachable + 1
+        for direction in (current, Direction.UP, Direction.DOWN,
+                          Direction.LEFT, Direction.RIGHT):
+            if direction is reverse:
+                continue
+            cell = neighbors[direction][head]
+            if occupancy[cell]:
+                continue
+            if dist[cell] < best_dist:
+                best = direction
+                best_dist = dist[cell]
+        return best
+    
+    def path_to_food(self) -> List[Position]:
+        """Get the current shortest path from the head to the food.
+        
+        Returns:
+            Positions from the cell after the head up to the food, or an
+            empty list if the food is unreachable
+        """
+        self._sync()
+        
+        board = self.engine.board
+        dist = self._dist
+        cell = self.engine.snake.cells[0]
+        path: List[Position] = []
+        best = min(dist[table[cell]] for table in board.neighbor_tables)
+        while 0 <= best < self._unreachable:
+            cell = next(
+                table[cell] for table in board.neighbor_tables
+                if dist[table[cell]] == best
+            )
+            path.append(board.to_position(cell))
+            best -= 1
+        return path
+    
+    def _sync(self) -> None:
+        """Bring the distance field up to date with the engine."""
+        snake = self.engine.snake
+        cells = snake.cells
+        target = self.engine.food.get_cell()
+        
+        one_step = (
+            self.incremental
+            and snake is self._snake
+            and target == self._target
+            and len(cells) > 1
+            and cells[1] == self._head
+        )
+        if not one_step:
+            if (snake is not self._snake or cells[0] != self._head
+                    or target != self._target):
+                self._rebuild()
+            return
+        
+        # Snake advanced one cell since the last sync
+        self.repairs += 1
+        self._block(cells[0])
+        if self._tail != cells[-1] and not snake.occupancy[self._tail]:
+            self._open(self._tail)
+        self._head = cells[0]
+        self._tail = cells[-1]
+    
+    def _rebuild(self) -> None:
+        """Recompute the distance field from scratch with a BFS."""
+        self.rebuilds += 1
+        
+        board = self.engine.board
+        snake = self.engine.snake
+        occupancy = snake.occupancy
+        tables = board.neighbor_tables
+        unreachable = board.size
+        
+        self._snake = snake
+        self._target = target = self.engine.food.get_cell()
+        self._head = snake.cells[0]
+        self._tail = snake.cells[-1]
+        self._unreachable = unreachable
+        self._dist = dist = [unreachable] * board.size
+        
+        if target is None:
+            return
+        dist[target] = 0
+        queue = deque([target])
+        while queue:
+            cell = queue.popleft()
+            next_dist = dist[cell] + 1
+            for table in tables:
+                neighbor = table[cell]
+                if dist[neighbor] == unreachable and not occupancy[neighbor]:
+                    dist[neighbor] = next_dist
+                    queue.append(neighbor)
+    
+    def _block(self, cell: Cell) -> None:
+        """Mark a cell as blocked and repair distances that depended on it.
+        
+        Args:
+            cell: The newly occupied cell
+        """
+        dist = self._dist
+        unreachable = self._unreachable
+        if dist[cell] == unreachable:
+            return
+        
+        tables = self.engine.board.neighbor_tables
+        occupancy = self.engine.snake.occupancy
+        
+        # Invalidate every cell left without a parent one step closer to the
+        # food. FIFO order handles one distance level at a time, so all
+        # invalidations on a level are known before the next level is checked.
+        invalidated = [cell]
+        queue = deque([(cell, dist[cell])])
+        dist[cell] = unreachable
+        while queue:
+            parent, parent_dist = queue.popleft()
+            child_dist = parent_dist + 1
+            for table in tables:
+                child = table[parent]
+                if dist[child] != child_dist:
+                    continue
+                if any(dist[t[child]] == parent_dist for t in tables):
+                    continue
+                dist[child] = unreachable
+                invalidated.append(child)
+                queue.append((child, child_dist))
+        
+        # Re-derive invalidated cells from their still-valid neighbors
+        heap = []
+        for stale in invalidated:
+            if occupancy[stale]:
+                continue
+            best = min(dist[table[stale]] for table in tables)
+            if best < unreachable:
+                heap.append((best + 1, stale))
+        heapq.heapify(heap)
+        while heap:
+            stale_dist, stale = heapq.heappop(heap)
+            if dist[stale] <= stale_dist:
+                continue
+            dist[stale] = stale_dist
+            for table in tables:
+                neighbor = table[stale]
+                if dist[neighbor] > stale_dist + 1 and not occupancy[neighbor]:
+                    heapq.heappush(heap, (stale_dist + 1, neighbor))
+    
+    def _open(self, cell: Cell) -> None:
+        """Mark a cell as free and propagate any shorter distances from it.
+        
+        Args:
+            cell: The newly freed cell
+        """
+        dist = self._dist
+        tables = self.engine.board.neighbor_tables
+        occupancy = self.engine.snake.occupancy
+        
+        best = min(dist[table[cell]] for table in tables) + 1
+        if best >= dist[cell]:
+            return
+        dist[cell] = best
+        
+        queue = deque([cell])
+        while queue:
+            current = queue.popleft()
+            next_dist = dist[current] + 1
+            for table in tables:
+                neighbor = table[current]
+                if dist[neighbor] > next_dist and not occupancy[neighbor]:
+                    dist[neighbor] = next_dist
+                    queue.append(neighbor)
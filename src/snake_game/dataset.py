@@ -0,0 +1,330 @@
+"""Streaming export of gameplay samples to sharded ``.npy`` files.
+
+Layout of a dataset directory::
+
+    manifest.json           fields, shard size and the list of shards
+    observations-00000.npy  (rows, cells) uint8, one byte per board cell
+    actions-00000.npy       (rows,) uint8, index into ``replay.DIRECTIONS``
+    rewards-00000.npy       (rows,) little-endian float32
+    dones-00000.npy         (rows,) uint8, 1 where the game ended
+    observations-00001.npy  ...
+
+Every file is a plain version 1.0 ``.npy`` array, so readers can map it
+with ``numpy.load(path, mmap_mode='r')`` (or ``read_header`` and
+``mmap`` without NumPy). Rows are appended to the open shard's files as
+they arrive; when a shard is full its headers are rewritten with the final
+row count and the manifest is replaced, so memory use does not depend on
+the run length and a crash loses at most the open shard. Reopening a
+directory reads only the manifest and continues with a new shard.
+"""
+
+import ast
+import json
+import os
+import random
+import struct
+import sys
+from array import array
+from typing import TYPE_CHECKING, BinaryIO, Dict, List, Tuple
+from .autopilot import Autopilot
+from .selfplay import play_step
+
+if TYPE_CHECKING:
+    from .game_engine import GameEngine
+    from .selfplay import SampleBatch
+
+MANIFEST = 'manifest.json'
+VERSION = 1
+
+# Rows per shard (default)
+SHARD_ROWS = 65536
+
+# Bytes of every header we write; large enough for any shape we patch in
+HEADER_SIZE = 128
+
+# Field name, dtype and bytes per value
+FIELDS: Tuple[Tuple[str, str, int], ...] = (
+    ('observations', '|u1', 1),
+    ('actions', '|u1', 1),
+    ('rewards', '<f4', 4),
+    ('dones', '|u1', 1),
+)
+
+_MAGIC = b'\x93NUMPY'
+_FLOAT = struct.Struct('<f')
+
+
+def npy_header(descr: str, shape: Tuple[int, ...]) -> bytes:
+    """Build a ``HEADER_SIZE``-byte ``.npy`` version 1.0 header.
+    
+    Args:
+        descr: NumPy dtype string, e.g. ``'|u1'``
+        shape: Array shape
+    
+    Returns:
+        The header, padded so the data starts at ``HEADER_SIZE``
+    
+    Raises:
+        ValueError: If the header does not fit
+    """
+    text = "{'descr': %r, 'fortran_order': False, 'shape': %r, }" % (
+        descr, tuple(shape)
+    )
+    padding = HEADER_SIZE - len(_MAGIC) - 4 - len(text) - 1
+    if padding < 0:
+        raise ValueError(f"Shape {shape} does not fit an .npy header")
+    text += ' ' * padding + '\n'
+    return _MAGIC + b'\x01\x00' + struct.pack('<H', len(text)) + text.encode('latin1')
+
+
+def read_header(path: str) -> Tuple[str, Tuple[int, ...], int]:
+    """Read the header of an ``.npy`` file.
+    
+    Args:
+        path: File to read
+    
+    Returns:
+        Tuple of (dtype string, shape, offset of the data)
+    
+    Raises:
+        ValueError: If the file is not a C-ordered ``.npy`` array
+    """
+    with open(path, 'rb') as f:
+        prefix = f.read(len(_MAGIC) + 2)
+        if prefix[:len(_MAGIC)] != _MAGIC:
+            raise ValueError(f"Not an .npy file: {path}")
+        if prefix[-2] == 1:
+            (length,) = struct.unpack('<H', f.read(2))
+        else:
+            (length,) = struct.unpack('<I', f.read(4))
+        header = ast.literal_eval(f.read(length).decode('latin1'))
+        if header['fortran_order']:
+            raise ValueError(f"Fortran-ordered arrays are not supported: {path}")
+        return header['descr'], tuple(header['shape']), f.tell()
+
+
+def read_manifest(directory: str) -> dict:
+    """Load a dataset's manifest.
+    
+    Args:
+        directory: Dataset directory
+    
+    Returns:
+        The manifest; ``shards`` lists the complete shards with their
+        ``rows`` and ``files`` (by field name, relative to the directory)
+    """
+    with open(os.path.join(directory, MANIFEST)) as f:
+        return json.load(f)
+
+
+class DatasetWriter:
+    """Appends samples to a sharded ``.npy`` dataset.
+    
+    Attributes:
+        directory: Dataset directory
+        obs_size: Bytes per observation
+        shard_rows: Rows per shard
+        shards: Manifest entries of the complete shards
+    """
+    
+    def __init__(self, directory: str, obs_size: int,
+                 shard_rows: int = SHARD_ROWS):
+        """Create a dataset, or open one to append to.
+        
+        Args:
+            directory: Dataset directory (created if missing)
+            obs_size: Bytes per observation (board cells)
+            shard_rows: Rows per shard (default: 65536)
+        
+        Raises:
+            ValueError: If obs_size or shard_rows is not positive, or an
+                existing dataset has a different observation size
+        """
+        if obs_size < 1 or shard_rows < 1:
+            raise ValueError("Observation size and shard rows must be positive")
+        self.directory = directory
+        self.obs_size = obs_size
+        self.shard_rows = shard_rows
+        self.shards: List[dict] = []
+        os.makedirs(directory, exist_ok=True)
+        if os.path.exists(os.path.join(directory, MANIFEST)):
+            manifest = read_manifest(directory)
+            if manifest['fields']['observations']['shape'] != [obs_size]:
+                raise ValueError(
+                    f"Dataset {directory} holds observations of "
+                    f"{manifest['fields']['observations']['shape']} bytes"
+                )
+            self.shards = manifest['shards']
+        self._rows_before = sum(shard['rows'] for shard in self.shards)
+        
+        # Files of the open shard, in FIELDS order, and its row count
+        self._files: List[BinaryIO] = []
+        self._rows = 0
+    
+    def __len__(self) -> int:
+        """Rows written, including the open shard."""
+        return self._rows_before + self._rows
+    
+    def __enter__(self) -> 'DatasetWriter':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def add(self, observation, action: int, reward: float, done: bool) -> None:
+        """Append one sample.
+        
+        Args:
+            observation: ``obs_size`` bytes (any bytes-like object)
+            action: Direction index
+            reward: Reward of the move
+            done: Whether the move ended the game
+        
+        Raises:
+            ValueError: If the observation has the wrong size
+        """
+        if len(observation) != self.obs_size:
+            raise ValueError(
+                f"Observation has {len(observation)} bytes, expected {self.obs_size}"
+            )
+        if not self._files:
+            self._open_shard()
+        observations, actions, rewards, dones = self._files
+        observations.write(observation)
+        actions.write(bytes((action,)))
+        rewards.write(_FLOAT.pack(reward))
+        dones.write(b'\x01' if done else b'\x00')
+        self._rows += 1
+        if self._rows == self.shard_rows:
+            self._close_shard()
+    
+    def add_batch(self, batch: 'SampleBatch') -> None:
+        """Append a batch of samples, e.g. from ``SelfPlayPipeline``.
+        
+        Args:
+            batch: Samples with ``observations`` of shape (count, obs_size)
+                and ``actions``, ``rewards`` (float32) and ``dones`` of
+                length count; NumPy arrays or memoryviews
+        
+        Raises:
+            ValueError: If the observations have the wrong size
+        """
+        count = len(batch)
+        columns = [memoryview(batch.observations).cast('B'),
+                   memoryview(batch.actions).cast('B'),
+                   _little_floats(batch.rewards),
+                   memoryview(batch.dones).cast('B')]
+        if len(columns[0]) != count * self.obs_size:
+            raise ValueError(f"Batch observations are not {self.obs_size} bytes")
+        sizes = [width * (self.obs_size if name == 'observations' else 1)
+                 for name, _, width in FIELDS]
+        done = 0
+        while done < count:
+            if not self._files:
+                self._open_shard()
+            rows = min(count - done, self.shard_rows - self._rows)
+            for file, column, size in zip(self._files, columns, sizes):
+                file.write(column[done * size:(done + rows) * size])
+            done += rows
+            self._rows += rows
+            if self._rows == self.shard_rows:
+                self._close_shard()
+    
+    def close(self) -> None:
+        """Finish the open shard, if any."""
+        if self._files:
+            self._close_shard()
+    
+    def _open_shard(self) -> None:
+        """Create the files of the next shard with zero-row headers."""
+        index = len(self.shards)
+        for name, descr, _ in FIELDS:
+            file = open(self._path(name, index), 'wb')
+            file.write(npy_header(descr, self._shape(name, 0)))
+            # A reader (or a crash) sees a valid empty array from the start
+            file.flush()
+            self._files.append(file)
+        self._rows = 0
+    
+    def _close_shard(self) -> None:
+        """Patch the shard's headers with its row count and list it."""
+        index = len(self.shards)
+        for file, (name, descr, _) in zip(self._files, FIELDS):
+            file.seek(0)
+            file.write(npy_header(descr, self._shape(name, self._rows)))
+            file.close()
+        self._files = []
+        self.shards.append({
+            'rows': self._rows,
+            'files': {name: os.path.basename(self._path(name, index))
+                      for name, _, _ in FIELDS},
+        })
+        self._rows_before += self._rows
+        self._rows = 0
+        self._write_manifest()
+    
+    def _write_manifest(self) -> None:
+        """Replace the manifest in one step, so readers never see it partial."""
+        manifest = {
+            'version': VERSION,
+            'fields': {name: {'dtype': descr,
+                              'shape': list(self._shape(name, 0)[1:])}
+                       for name, descr, _ in FIELDS},
+            'shard_rows': self.shard_rows,
+            'rows': self._rows_before,
+            'shards': self.shards,
+        }
+        path = os.path.join(self.directory, MANIFEST)
+        with open(path + '.tmp', 'w') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(path + '.tmp', path)
+    
+    def _path(self, name: str, index: int) -> str:
+        return os.path.join(self.directory, f"{name}-{index:05d}.npy")
+    
+    def _shape(self, name: str, rows: int) -> Tuple[int, ...]:
+        return (rows, self.obs_size) if name == 'observations' else (rows,)
+
+
+def record_self_play(writer: DatasetWriter, engine: 'GameEngine',
+                     samples: int, seed: int = 0,
+                     epsilon: float = 0.1) -> Dict[str, int]:
+    """Stream autopilot self-play on an engine into a dataset.
+    
+    Args:
+        writer: Dataset to append to; its observation size must match the
+            engine's board
+        engine: Game to play; restarted after every game over
+        samples: Number of samples to write
+        seed: Seed of the exploration moves (default: 0)
+        epsilon: Probability of a random move (default: 0.1)
+    
+    Returns:
+        Counts of ``samples`` written and ``games`` finished
+    """
+    rng = random.Random(seed)
+    autopilot = Autopilot(engine)
+    out = bytearray(engine.board.size)
+    games = 0
+    for _ in range(samples):
+        action, reward, done = play_step(engine, autopilot, rng, epsilon, out)
+        writer.add(out, action, reward, done)
+        games += done
+    return {'samples': samples, 'games': games}
+
+
+def _little_floats(values) -> memoryview:
+    """View float32 values as little-endian bytes.
+    
+    Args:
+        values: Buffer of native float32 values
+    
+    Returns:
+        Byte view, copied only on big-endian hosts
+    """
+    view = memoryview(values).cast('B')
+    if sys.byteorder == 'little':
+        return view
+    swapped = array('f', view.tobytes())
+    swapped.byteswap()
+    return memoryview(swapped).cast('B')
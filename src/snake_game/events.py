@@ -0,0 +1,64 @@
+"""Typed events emitted by GameEngine to registered listeners."""
+
+from enum import Enum
+from typing import Any, Callable, Optional
+from .types import Cell
+
+
+class EventType(Enum):
+    """Enumeration for the changes a GameEngine reports."""
+    MOVED = "moved"
+    WRAPPED = "wrapped"
+    GREW = "grew"
+    ATE_FOOD = "ate_food"
+    COLLIDED = "collided"
+    PAUSED = "paused"
+    RESUMED = "resumed"
+    GAME_OVER = "game_over"
+    RESTARTED = "restarted"
+
+
+class Event:
+    """One change in a game.
+    
+    The meaning of ``cell`` and ``value`` depends on the event type:
+    
+    - MOVED: new head cell; the Direction moved in
+    - WRAPPED: new head cell; the Direction moved in
+    - GREW: head cell; the new snake length
+    - ATE_FOOD: the food cell; the new score
+    - COLLIDED: head cell; the Collision kind
+    - GAME_OVER: head cell; the final score
+    - PAUSED, RESUMED, RESTARTED: no cell; no value
+    
+    Attributes:
+        type: What happened
+        tick: Engine tick count when it happened
+        cell: Packed cell it happened at, if any
+        value: Type-specific detail, if any
+    """
+    
+    __slots__ = ('type', 'tick', 'cell', 'value')
+    
+    def __init__(self, type: EventType, tick: int, cell: Optional[Cell] = None,
+                 value: Any = None):
+        """Initialize the event.
+        
+        Args:
+            type: What happened
+            tick: Engine tick count when it happened
+            cell: Packed cell it happened at, if any
+            value: Type-specific detail, if any
+        """
+        self.type = type
+        self.tick = tick
+        self.cell = cell
+        self.value = value
+    
+    def __repr__(self) -> str:
+        return (f"Event({self.type.name}, tick={self.tick}, cell={self.cell}, "
+                f"value={self.value!r})")
+
+
+# Callback invoked with each event a listener subscribed to
+Listener = Callable[[Event], None]
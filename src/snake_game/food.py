@@ -1,13 +1,17 @@
-"""Food class for managing food spawning and position."""
+"""Food classes for managing food spawning and positions."""
 
 import random
-from typing import Optional, TYPE_CHECKING
-from .types import Position
+from array import array
+from typing import Iterator, List, Optional, TYPE_CHECKING
+from .types import Cell, Position
 
 if TYPE_CHECKING:
     from .game_board import GameBoard
     from .snake import Snake
 
+# Random tries per wanted cell in a seeded draw before scanning the board
+SEEDED_ATTEMPTS = 8
+
 
 class Food:
     """Manages food position and spawning logic."""
@@ -15,6 +19,7 @@ class Food:
     def __init__(self):
         """Initialize food with no position."""
         self._position: Optional[Position] = None
+        self._cell: Optional[Cell] = None
     
     def get_position(self) -> Optional[Position]:
         """Get the current food position.
@@ -24,33 +29,277 @@ class Food:
         """
         return self._position
     
+    def get_cell(self) -> Optional[Cell]:
+        """Get the packed cell of the current food position.
+        
+        Returns:
+            Current food cell or None if not spawned
+        """
+        return self._cell
+    
     def spawn(self, board: 'GameBoard', snake: 'Snake') -> None:
         """Spawn food at a random valid empty position.
         
         Args:
             board: The game board
             snake: The snake (to avoid placing food on it)
-            
+        
         Raises:
             RuntimeError: If no valid position is available (board full)
         """
-        # Get all valid positions on the board
-        all_positions = [
-            (x, y)
-            for x in range(board.width)
-            for y in range(board.height)
-        ]
+        occupancy = self._snake_occupancy(board, snake)
         
-        # Filter out positions occupied by snake
-        snake_positions = set(snake.get_body())
-        valid_positions = [
-            pos for pos in all_positions 
-            if pos not in snake_positions
+        # Collect all cells not occupied by the snake (walls never qualify)
+        valid_cells = [
+            cell for cell in board.open_cells
+            if not occupancy[cell]
         ]
         
         # Check if any valid position exists
-        if not valid_positions:
+        if not valid_cells:
             raise RuntimeError("No valid position for food spawn - board is full!")
         
         # Randomly select a position
-        self._position = random.choice(valid_positions)
+        self._cell = random.choice(valid_cells)
+        self._position = board.to_position(self._cell)
+    
+    def place(self, board: 'GameBoard', position: Position) -> None:
+        """Place food at a specific position.
+        
+        Args:
+            board: The game board
+            position: Position to place the food at (wrapped onto the board)
+        """
+        self._cell = board.to_cell(position[0], position[1])
+        self._position = board.to_position(self._cell)
+    
+    @staticmethod
+    def _snake_occupancy(board: 'GameBoard', snake: 'Snake') -> bytearray:
+        """Get the snake's occupancy in the packing of the given board.
+        
+        Args:
+            board: The game board
+            snake: The snake
+        
+        Returns:
+            Per-cell occupancy of the snake on the board
+        """
+        if snake.board.get_dimensions() == board.get_dimensions():
+            return snake.occupancy
+        
+        # Snake lives on a differently sized board; repack its positions
+        occupancy = bytearray(board.walls)
+        for x, y in snake.get_body():
+            if board.is_valid_position(x, y):
+                occupancy[board.to_cell(x, y)] = 1
+        return occupancy
+
+
+class FoodManager:
+    """Holds many food items on one board.
+    
+    Every open (non-wall) cell lives in one pool array, partitioned into
+    cells without food followed by cells with food, and each cell knows its
+    slot in the pool. Adding or removing an item swaps it across the
+    partition in O(1), and membership is a lookup in a per-cell mask.
+    
+    Spawning runs a partial Fisher-Yates shuffle over the food-free part of
+    the pool, keeping the cells the snakes do not occupy. That draws a
+    uniform sample without replacement in O(k) expected steps while the
+    board is mostly free (and never more than one pass over the pool), where
+    repeated ``Food.spawn`` calls would scan the whole board per item.
+    
+    Attributes:
+        board: The game board
+        mask: Per-cell food membership (1 = food), read-only
+    """
+    
+    def __init__(self, board: 'GameBoard'):
+        """Initialize an empty food manager.
+        
+        Args:
+            board: The game board
+        """
+        self.board = board
+        self.mask = bytearray(board.size)
+        self._pool = array('i', board.open_cells)
+        self._slot = array('i', [-1]) * board.size
+        for slot, cell in enumerate(self._pool):
+            self._slot[cell] = slot
+        
+        # Pool slots from here on hold food
+        self._free = len(self._pool)
+    
+    def __len__(self) -> int:
+        """Number of food items."""
+        return len(self._pool) - self._free
+    
+    def __contains__(self, cell: Cell) -> bool:
+        """Check whether a cell holds food."""
+        return self.mask[cell] == 1
+    
+    def __iter__(self) -> Iterator[Cell]:
+        """Iterate over the food cells, in no particular order."""
+        return iter(self._pool[self._free:])
+    
+    def positions(self) -> List[Position]:
+        """Get the positions of all food items.
+        
+        Returns:
+            Food positions, in no particular order
+        """
+        to_position = self.board.to_position
+        return [to_position(cell) for cell in self]
+    
+    def newest(self, count: int) -> List[Cell]:
+        """Get the items added most recently, newest first.
+        
+        Only valid while no item has been removed since they were added.
+        
+        Args:
+            count: Number of items wanted
+        
+        Returns:
+            Up to ``count`` food cells
+        """
+        return list(self._pool[self._free:self._free + count])
+    
+    def add(self, cell: Cell) -> None:
+        """Put food on a cell (no-op if it already has food).
+        
+        Args:
+            cell: Packed cell index
+        
+        Raises:
+            ValueError: If the cell is a wall
+        """
+        if self.mask[cell]:
+            return
+        if self._slot[cell] < 0:
+            raise ValueError(f"Cannot place food on wall cell {cell}")
+        self._free -= 1
+        self._swap(self._slot[cell], self._free)
+        self.mask[cell] = 1
+    
+    def remove(self, cell: Cell) -> None:
+        """Take the food off a cell.
+        
+        Args:
+            cell: Packed cell index
+        
+        Raises:
+            KeyError: If the cell has no food
+        """
+        if not self.mask[cell]:
+            raise KeyError(cell)
+        self._swap(self._slot[cell], self._free)
+        self._free += 1
+        self.mask[cell] = 0
+    
+    def clear(self) -> None:
+        """Remove every food item."""
+        for cell in self:
+            self.mask[cell] = 0
+        self._free = len(self._pool)
+    
+    def sample(self, count: int, occupancy: bytearray, exclude: Cell = -1,
+               rng: Optional[random.Random] = None) -> List[Cell]:
+        """Pick distinct random cells that have neither food nor a snake.
+        
+        Only the order of the food-free pool changes; no food is added.
+        Because the result depends on that order, reproducible draws pass
+        ``rng``: cells are then drawn from ``board.open_cells`` by rejection
+        (a scan of the board only once random tries keep missing), so the
+        result depends only on the generator, the occupancy and the food.
+        
+        Args:
+            count: Number of cells wanted
+            occupancy: Per-cell snake occupancy (walls may be included)
+            exclude: A further cell to skip, e.g. food kept elsewhere
+            rng: Seeded generator for a pool-order independent draw
+        
+        Returns:
+            Up to ``count`` cells, fewer only if the board runs out of room
+        """
+        if rng is not None:
+            return self._sample_seeded(count, occupancy, exclude, rng)
+        pool = self._pool
+        slot = self._slot
+        chosen: List[Cell] = []
+        end = self._free
+        while len(chosen) < count and end:
+            # Swap a random candidate to the end of the unvisited range
+            pick = random.randrange(end)
+            end -= 1
+            cell = pool[pick]
+            last = pool[end]
+            pool[pick] = last
+            slot[last] = pick
+            pool[end] = cell
+            slot[cell] = end
+            if not occupancy[cell] and cell != exclude:
+                chosen.append(cell)
+        return chosen
+    
+    def spawn(self, count: int, occupancy: bytearray, exclude: Cell = -1,
+              rng: Optional[random.Random] = None) -> List[Cell]:
+        """Add food on distinct random cells that have neither food nor a snake.
+        
+        Args:
+            count: Number of items to add
+            occupancy: Per-cell snake occupancy (walls may be included)
+            exclude: A further cell to skip, e.g. food kept elsewhere
+            rng: Seeded generator for a reproducible draw (see ``sample``)
+        
+        Returns:
+            The new food cells, fewer than ``count`` only if the board runs
+            out of room
+        """
+        cells = self.sample(count, occupancy, exclude, rng)
+        for cell in cells:
+            self.add(cell)
+        return cells
+    
+    def _sample_seeded(self, count: int, occupancy: bytearray, exclude: Cell,
+                       rng: random.Random) -> List[Cell]:
+        """Draw cells independently of the pool order.
+        
+        Args:
+            count: Number of cells wanted
+            occupancy: Per-cell snake occupancy (walls may be included)
+            exclude: A further cell to skip
+            rng: Generator to draw from
+        
+        Returns:
+            Up to ``count`` cells, fewer only if the board runs out of room
+        """
+        open_cells = self.board.open_cells
+        mask = self.mask
+        chosen: List[Cell] = []
+        taken = set()
+        attempts = count * SEEDED_ATTEMPTS
+        while len(chosen) < count and attempts:
+            attempts -= 1
+            cell = open_cells[rng.randrange(len(open_cells))]
+            if not (occupancy[cell] or mask[cell] or cell == exclude
+                    or cell in taken):
+                chosen.append(cell)
+                taken.add(cell)
+        
+        # Crowded board: draw the rest from an ordered scan of the free cells
+        if len(chosen) < count:
+            free = [cell for cell in open_cells
+                    if not (occupancy[cell] or mask[cell] or cell == exclude
+                            or cell in taken)]
+            chosen.extend(rng.sample(free, min(count - len(chosen), len(free))))
+        return chosen
+    
+    def _swap(self, i: int, j: int) -> None:
+        """Swap two pool slots."""
+        pool = self._pool
+        a = pool[i]
+        b = pool[j]
+        pool[i] = b
+        pool[j] = a
+        self._slot[b] = i
+        self._slot[a] = j
@@ -1,21 +1,96 @@
 """GameBoard class for managing the game grid."""
 
-from typing import Tuple
-from .types import Position
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+from .types import Cell, Direction, Position
+
+if TYPE_CHECKING:
+    from .level_map import LevelMap
+
+
+@lru_cache(maxsize=16)
+def _build_neighbor_tables(width: int, height: int) -> Tuple[List[Cell], ...]:
+    """Build the wrap-around next-cell table for each direction.
+    
+    Tables are cached per board size and shared between boards, so they
+    must be treated as read-only.
+    
+    Args:
+        width: Board width in cells
+        height: Board height in cells
+    
+    Returns:
+        One list per Direction (in definition order), indexed by cell
+    """
+    size = width * height
+    cells = list(range(size))
+    tables = []
+    for direction in Direction:
+        dx, dy = direction.value
+        tables.append([
+            cells[((cell // width + dy) % height) * width + (cell % width + dx) % width]
+            for cell in cells
+        ])
+    return tuple(tables)
 
 
 class GameBoard:
-    """Manages the game board grid and boundary validation."""
+    """Manages the game board grid and boundary validation.
+    
+    Internally every cell is addressed by a packed integer
+    ``cell = y * width + x``. Tuples are only produced at the public API
+    boundary, and those come from a precomputed table so converting back
+    never allocates.
+    
+    A board loaded from a ``LevelMap`` has static walls. The wall mask is
+    copied into every snake's occupancy grid, so collision checks, food
+    spawning and pathfinding see walls as occupied cells at no extra cost
+    per tick; ``open_cells`` lists the cells food may ever spawn on.
+    """
     
-    def __init__(self, width: int = 20, height: int = 20):
+    def __init__(self, width: int = 20, height: int = 20,
+                 level_map: Optional['LevelMap'] = None):
         """Initialize the game board with specified dimensions.
         
         Args:
             width: Board width in cells (default: 20)
             height: Board height in cells (default: 20)
+            level_map: Obstacle map; its size overrides width and height
         """
+        if level_map is not None:
+            width, height = level_map.width, level_map.height
         self.width = width
         self.height = height
+        self.size = width * height
+        self.level_map = level_map
+        
+        # Wall mask indexed by cell (1 = wall) and the cells that are not walls
+        if level_map is not None:
+            self.walls = level_map.walls
+            self.open_cells: Sequence[Cell] = level_map.open_cells
+        else:
+            self.walls = bytes(self.size)
+            self.open_cells = range(self.size)
+        
+        # Position tuple for every packed cell, indexed by cell
+        self._positions: List[Position] = [
+            (x, y)
+            for y in range(height)
+            for x in range(width)
+        ]
+        
+        # Packed offset of a single step in each direction (before wrapping)
+        self.neighbor_deltas: Dict[Direction, int] = {
+            direction: direction.value[1] * width + direction.value[0]
+            for direction in Direction
+        }
+        
+        # Next cell for every cell and direction, wrap-around applied.
+        # Plain lists of shared int objects, so a lookup never allocates.
+        self.neighbor_tables = _build_neighbor_tables(width, height)
+        self.neighbors: Dict[Direction, List[Cell]] = dict(
+            zip(Direction, self.neighbor_tables)
+        )
     
     def is_valid_position(self, x: int, y: int) -> bool:
         """Check if a position is within board boundaries.
@@ -23,12 +98,24 @@ class GameBoard:
         Args:
             x: X coordinate
             y: Y coordinate
-            
+        
         Returns:
             True if position is valid, False otherwise
         """
         return 0 <= x < self.width and 0 <= y < self.height
     
+    def is_wall(self, x: int, y: int) -> bool:
+        """Check if a position is a wall.
+        
+        Args:
+            x: X coordinate (wrapped onto the board)
+            y: Y coordinate (wrapped onto the board)
+        
+        Returns:
+            True if the position is a wall
+        """
+        return bool(self.walls[self.to_cell(x, y)])
+    
     def get_dimensions(self) -> Tuple[int, int]:
         """Get the board dimensions.
         
@@ -36,3 +123,41 @@ class GameBoard:
             Tuple of (width, height)
         """
         return (self.width, self.height)
+    
+    def to_cell(self, x: int, y: int) -> Cell:
+        """Pack a coordinate pair into a cell index.
+        
+        Coordinates outside the board are wrapped onto it, matching the
+        wrap-around movement rules.
+        
+        Args:
+            x: X coordinate
+            y: Y coordinate
+        
+        Returns:
+            Packed cell index
+        """
+        return (y % self.height) * self.width + (x % self.width)
+    
+    def to_position(self, cell: Cell) -> Position:
+        """Unpack a cell index into a position tuple.
+        
+        Args:
+            cell: Packed cell index
+        
+        Returns:
+            Position of the cell (shared, precomputed tuple)
+        """
+        return self._positions[cell]
+    
+    def next_cell(self, cell: Cell, direction: Direction) -> Cell:
+        """Get the cell one step away in a direction, wrapping at the edges.
+        
+        Args:
+            cell: Packed cell index to move from
+            direction: Direction to step in
+        
+        Returns:
+            Packed index of the neighboring cell
+        """
+        return self.neighbors[direction][cell]
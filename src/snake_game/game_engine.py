@@ -1,45 +1,133 @@
 """GameEngine class for managing game state and rules."""
 
+import random
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+from .events import Event, EventType, Listener
 from .game_board import GameBoard
 from .snake import Snake
-from .food import Food
-from .types import Direction, GameState, Position
+from .food import Food, FoodManager
+from .types import Cell, Collision, Direction, GameState
+from .zobrist import zobrist_keys
+
+if TYPE_CHECKING:
+    from .level_map import LevelMap
+
+# Points scored per food item eaten
+FOOD_SCORE = 10
+
+# Bound once for tick(): looking a member up on an Enum class allocates on
+# Python 3.11
+_RUNNING = GameState.RUNNING
+
+# Events emitted by the move itself; ticks only check for them when one has
+# listeners
+MOVE_EVENTS = frozenset((EventType.MOVED, EventType.WRAPPED, EventType.GREW))
+
+
+def collision_at(board: GameBoard, occupancy: bytearray,
+                 head: Cell) -> Optional[Collision]:
+    """Apply the collision rule to a head that has just moved.
+    
+    The head is counted in the occupancy grid before the tail leaves, and
+    walls are pre-counted, so any count above one is a crash. Shared by
+    ``GameEngine`` and the search bots' rollout engines.
+    
+    Args:
+        board: The game board
+        occupancy: Per-cell segment counts after the move
+        head: The new head cell
+    
+    Returns:
+        What the head crashed into, or None if the move is safe
+    """
+    if occupancy[head] <= 1:
+        return None
+    return Collision.WALL if board.walls[head] else Collision.SELF
 
 
 class GameEngine:
-    """Orchestrates game logic, state management, and rule enforcement."""
+    """Orchestrates game logic, state management, and rule enforcement.
+    
+    Listeners registered with ``subscribe`` receive an ``Event`` for each
+    change (moves, food, growth, collisions, pauses, restarts), so callers
+    need not poll and diff ``get_state()``/``get_score()``. Events are only
+    built for types that have listeners; unless a movement event (moved,
+    wrapped, grew) has one, a tick pays a single flag check.
     
-    def __init__(self, board_width: int = 20, board_height: int = 20):
+    ``state_hash()`` identifies the position (snake, food, direction and
+    pending growth) with a Zobrist hash, for desync checks and as a key for
+    search caches. Ticks only mark it stale; it is recomputed when asked
+    for, so games nobody hashes pay nothing for it.
+    """
+    
+    def __init__(self, board_width: int = 20, board_height: int = 20,
+                 level_map: Optional['LevelMap'] = None, food_count: int = 1,
+                 food_seed: Optional[int] = None):
         """Initialize the game engine.
         
         Args:
             board_width: Width of the game board (default: 20)
             board_height: Height of the game board (default: 20)
+            level_map: Optional obstacle map; its size overrides the board
+                width and height
+            food_count: Food items kept on the board (default: 1). ``food``
+                is one of them; the rest are held in ``foods``.
+            food_seed: Make food placement reproducible. Each spawn draws
+                from a generator seeded with this and ``spawn_count``, so a
+                game restored from a snapshot spawns the same food.
+        
+        Raises:
+            ValueError: If food_count is not positive or the snake's starting
+                cells overlap a wall
         """
-        self.board = GameBoard(board_width, board_height)
+        if food_count < 1:
+            raise ValueError("Food count must be positive")
+        self.board = GameBoard(board_width, board_height, level_map=level_map)
+        self.zobrist = zobrist_keys(self.board.size)
         
-        # Initialize snake at center of board
-        center_x = board_width // 2
-        center_y = board_height // 2
-        self.snake = Snake((center_x, center_y), initial_length=3)
+        # Listeners per event type; only types with listeners have a key
+        self._listeners: Dict[EventType, Tuple[Listener, ...]] = {}
+        # Whether any movement event has listeners (ticks take the slow path)
+        self._observe_moves = False
+        self.tick_count = 0
         
+        # Initialize snake at the map's start, or the center of the board
+        self.snake = self._new_snake()
+        
+        self.food_count = food_count
+        self.food_seed = food_seed
+        self.spawn_count = 0
         self.food = Food()
+        self.foods = FoodManager(self.board)
         self.score = 0
         self.state = GameState.RUNNING
         
+        # What the snake crashed into, once a crash has ended the game
+        self.collision: Optional[Collision] = None
+        
+        # Zobrist hash of the snake and food, recomputed when stale
+        self._cells_hash = 0
+        self._hash_stale = True
+        
         # Spawn initial food
-        self.food.spawn(self.board, self.snake)
+        self._spawn_food()
     
     def tick(self) -> None:
         """Process one game update tick.
         
         This moves the snake, checks collisions, and updates game state.
         """
-        if self.state != GameState.RUNNING:
+        if self.state is not _RUNNING:
             return
+        self.tick_count += 1
+        self._hash_stale = True
         
         # Move snake in current direction
-        self.snake.move(self.snake.direction)
+        if self._observe_moves:
+            self._move_observed()
+        else:
+            snake = self.snake
+            snake.move(snake.direction)
         
         # Check collisions
         self.check_collisions()
@@ -56,50 +144,113 @@ class GameEngine:
                 self.snake.direction = direction
     
     def check_collisions(self) -> None:
-        """Check for all collision types and update game state accordingly."""
-        head = self.snake.get_head_position()
-        head_x, head_y = head
-        
-        # Wrap around walls (no game over on wall collision)
-        wrapped = False
-        
-        # Wrap x coordinate (left/right walls)
-        if head_x < 0:
-            head_x = self.board.width - 1
-            wrapped = True
-        elif head_x >= self.board.width:
-            head_x = 0
-            wrapped = True
-        
-        # Wrap y coordinate (top/bottom walls)
-        if head_y < 0:
-            head_y = self.board.height - 1
-            wrapped = True
-        elif head_y >= self.board.height:
-            head_y = 0
-            wrapped = True
-        
-        # Update snake head with wrapped position
-        if wrapped:
-            self.snake.body[0] = (head_x, head_y)
-            head = (head_x, head_y)
+        """Check for all collision types and update game state accordingly.
+        
+        Wrap-around at the board edges is applied by ``Snake.move`` on the
+        board's packed cells, so leaving the board never ends the game. Map
+        walls are counted in the snake's occupancy grid, so running into one
+        is caught by the same check as running into the body.
+        """
+        head = self.snake.get_head_cell()
         
         # Check self collision
-        if self.snake.collides_with_self():
+        collision = collision_at(self.board, self.snake.occupancy, head)
+        if collision is not None:
             self.state = GameState.GAME_OVER
+            self.collision = collision
+            self._emit(EventType.COLLIDED, head, self.collision)
+            self._emit(EventType.GAME_OVER, head, self.score)
             return
         
         # Check food collision
-        if head == self.food.get_position():
-            self.score += 10
-            self.snake.grow()
+        if head == self.food.get_cell():
+            self._eat(head)
             
-            # Spawn new food
-            try:
-                self.food.spawn(self.board, self.snake)
-            except RuntimeError:
-                # Board is full - victory condition
+            # Spawn new food; no food left means the board is full (victory)
+            if not self._spawn_food():
                 self.state = GameState.GAME_OVER
+                self._emit(EventType.GAME_OVER, head, self.score)
+        elif head in self.foods:
+            self.foods.remove(head)
+            self._eat(head)
+            self._spawn_food()
+    
+    def subscribe(self, listener: Listener, *types: EventType) -> None:
+        """Register a listener for events.
+        
+        Listeners are called synchronously, in subscription order, from the
+        engine method that caused the change. Subscribing again for a type
+        the listener already has is a no-op.
+        
+        Args:
+            listener: Callable taking an Event
+            *types: Event types to receive (default: all)
+        """
+        for event_type in types or EventType:
+            listeners = self._listeners.get(event_type, ())
+            if listener not in listeners:
+                self._listeners[event_type] = listeners + (listener,)
+        self._observe_moves = not self._listeners.keys().isdisjoint(MOVE_EVENTS)
+    
+    def unsubscribe(self, listener: Listener, *types: EventType) -> None:
+        """Remove a listener.
+        
+        Safe to call from inside a listener; the event being dispatched is
+        still delivered to the listeners registered when it was emitted.
+        
+        Args:
+            listener: Previously subscribed callable
+            *types: Event types to stop receiving (default: all)
+        """
+        for event_type in types or EventType:
+            listeners = tuple(
+                other for other in self._listeners.get(event_type, ())
+                if other != listener
+            )
+            if listeners:
+                self._listeners[event_type] = listeners
+            else:
+                self._listeners.pop(event_type, None)
+        self._observe_moves = not self._listeners.keys().isdisjoint(MOVE_EVENTS)
+    
+    def state_hash(self) -> int:
+        """Get the Zobrist hash of the current position.
+        
+        Covers the snake's cells, head and tail, every food cell, the
+        direction and pending growth (not the score or tick count). Equal
+        positions hash equally across engines and processes; snakes on the
+        same cells with the same ends but a different path between them do
+        too (see ``ZobristKeys``).
+        
+        The snake and food part is recomputed in O(length + food) on the
+        first call after a tick and cached until the next one. Code that
+        edits the snake or food directly must call ``rehash`` afterwards.
+        
+        Returns:
+            64-bit hash
+        """
+        snake = self.snake
+        keys = self.zobrist
+        if self._hash_stale:
+            value = keys.body_hash(snake.cells) ^ keys.food_hash(self.foods)
+            food = self.food.get_cell()
+            if food is not None:
+                value ^= keys.food[food]
+            self._cells_hash = value
+            self._hash_stale = False
+        value = self._cells_hash ^ keys.direction[snake.direction]
+        if snake.grow_pending:
+            value ^= keys.grow
+        return value
+    
+    def rehash(self) -> int:
+        """Recompute the position hash from scratch.
+        
+        Returns:
+            The new ``state_hash()``
+        """
+        self._hash_stale = True
+        return self.state_hash()
     
     def get_state(self) -> GameState:
         """Get the current game state.
@@ -119,23 +270,126 @@ class GameEngine:
     
     def restart(self) -> None:
         """Restart the game with fresh state."""
-        center_x = self.board.width // 2
-        center_y = self.board.height // 2
-        self.snake = Snake((center_x, center_y), initial_length=3)
+        self.snake = self._new_snake()
         self.food = Food()
+        self.foods.clear()
         self.score = 0
         self.state = GameState.RUNNING
-        self.food.spawn(self.board, self.snake)
+        self.collision = None
+        self.tick_count = 0
+        self._spawn_food()
+        self._hash_stale = True
+        self._emit(EventType.RESTARTED)
+    
+    def _new_snake(self) -> Snake:
+        """Create a snake at the starting position.
+        
+        Returns:
+            A snake at the map's start marker, or the center of the board
+        
+        Raises:
+            ValueError: If the snake's starting cells overlap a wall
+        """
+        board = self.board
+        start = None
+        if board.level_map is not None:
+            start = board.level_map.start
+        if start is None:
+            start = (board.width // 2, board.height // 2)
+        
+        snake = Snake(start, initial_length=3, board=board)
+        if any(board.walls[cell] for cell in snake.cells):
+            raise ValueError(f"Snake start {start} overlaps a wall")
+        return snake
+    
+    def _eat(self, cell: Cell) -> None:
+        """Score the food on a cell and grow the snake.
+        
+        Args:
+            cell: The food cell
+        """
+        self.score += FOOD_SCORE
+        self.snake.grow()
+        self._emit(EventType.ATE_FOOD, cell, self.score)
+    
+    def _move_observed(self) -> None:
+        """Move the snake and emit the movement events."""
+        snake = self.snake
+        board = self.board
+        direction = snake.direction
+        old_x, old_y = board.to_position(snake.cells[0])
+        old_length = len(snake.cells)
+        
+        snake.move(direction)
+        head = snake.cells[0]
+        
+        # Direction may differ from the requested one after a rejected reversal
+        direction = snake.direction
+        self._emit(EventType.MOVED, head, direction)
+        dx, dy = direction.value
+        if board.to_position(head) != (old_x + dx, old_y + dy):
+            self._emit(EventType.WRAPPED, head, direction)
+        if len(snake.cells) > old_length:
+            self._emit(EventType.GREW, head, len(snake.cells))
+    
+    def _emit(self, event_type: EventType, cell: Optional[Cell] = None,
+              value: object = None) -> None:
+        """Deliver an event to its listeners, if there are any.
+        
+        Args:
+            event_type: What happened
+            cell: Packed cell it happened at, if any
+            value: Type-specific detail, if any
+        """
+        listeners = self._listeners.get(event_type)
+        if listeners:
+            event = Event(event_type, self.tick_count, cell, value)
+            for listener in listeners:
+                listener(event)
+    
+    def _spawn_food(self) -> bool:
+        """Top the board up to ``food_count`` food items.
+        
+        ``food`` is respawned first if it was eaten; when no free cell is
+        left for it, one of the other items takes its place.
+        
+        Returns:
+            False if there is no food left anywhere
+        """
+        board = self.board
+        foods = self.foods
+        occupancy = self.snake.occupancy
+        rng = None
+        if self.food_seed is not None:
+            rng = random.Random((self.food_seed << 32) | self.spawn_count)
+        self.spawn_count += 1
+        
+        primary = self.food.get_cell()
+        if primary is None or occupancy[primary]:
+            cells = foods.sample(1, occupancy, rng=rng)
+            if not cells and len(foods):
+                cells = [min(foods)]
+                foods.remove(cells[0])
+            if not cells:
+                return False
+            primary = cells[0]
+            self.food.place(board, board.to_position(primary))
+        
+        foods.spawn(self.food_count - 1 - len(foods), occupancy,
+                    exclude=primary, rng=rng)
+        return True
     
     def pause(self) -> None:
         """Pause the game."""
         if self.state == GameState.RUNNING:
             self.state = GameState.PAUSED
+            self._emit(EventType.PAUSED)
     
     def unpause(self) -> None:
         """Unpause the game."""
         if self.state == GameState.PAUSED:
             self.state = GameState.RUNNING
+            self._emit(EventType.RESUMED)
     
     def toggle_pause(self) -> None:
         """Toggle between paused and running states."""
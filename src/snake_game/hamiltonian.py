@@ -0,0 +1,178 @@
+"""Hamiltonian-cycle solver that plays until the board is full."""
+
+from array import array
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Tuple
+from .types import Cell, Direction
+
+if TYPE_CHECKING:
+    from .game_engine import GameEngine
+
+
+@lru_cache(maxsize=16)
+def hamiltonian_cycle(width: int, height: int) -> Tuple[array, array]:
+    """Build a Hamiltonian cycle over a wrapping board.
+    
+    Rows are swept back and forth over columns 1..width-1, then column 0 is
+    climbed back to the start. On odd heights the last row ends at the right
+    edge and reaches column 0 through the wrap-around, so every board size
+    has a cycle. Results are cached per size and must be treated as
+    read-only.
+    
+    Args:
+        width: Board width in cells
+        height: Board height in cells
+    
+    Returns:
+        Tuple of (order, index): ``order[i]`` is the i-th cell on the cycle
+        and ``index[cell]`` is the cell's position on the cycle
+    """
+    if width == 1:
+        cells = list(range(height))
+    else:
+        cells = []
+        for y in range(height):
+            columns = range(1, width) if y % 2 == 0 else range(width - 1, 0, -1)
+            cells.extend(y * width + x for x in columns)
+        cells.extend(y * width for y in range(height - 1, -1, -1))
+    
+    order = array('i', cells)
+    index = array('i', bytes(order.itemsize * len(cells)))
+    for position, cell in enumerate(order):
+        index[cell] = position
+    return order, index
+
+
+class HamiltonianSolver:
+    """Steers a GameEngine's snake around a Hamiltonian cycle.
+    
+    Following the cycle never collides, so the snake eventually fills the
+    board. While the snake is short, the solver takes shortcuts: it may skip
+    ahead along the cycle toward the food, as long as it lands in the free
+    stretch between head and tail and leaves a safety gap before the tail.
+    """
+    
+    def __init__(self, engine: 'GameEngine', shortcuts: bool = True,
+                 shortcut_limit: float = 0.5, safety_gap: int = 3):
+        """Initialize the solver.
+        
+        Args:
+            engine: The game engine to steer
+            shortcuts: Allow skipping ahead along the cycle (default: True)
+            shortcut_limit: Stop taking shortcuts once the snake covers this
+                fraction of the board (default: 0.5)
+            safety_gap: Minimum free cells to keep ahead of the tail after
+                a shortcut (default: 3)
+        
+        Raises:
+            ValueError: If the board is narrower than 4 cells, where the
+                starting snake fills a whole row and cannot be aligned
+        """
+        if engine.board.width < 4:
+            raise ValueError("Hamiltonian solver needs a board at least 4 cells wide")
+        self.engine = engine
+        self.shortcuts = shortcuts
+        self.shortcut_limit = shortcut_limit
+        self.safety_gap = safety_gap
+        
+        self._snake = None
+        self._index: Optional[array] = None
+        self._order: Optional[array] = None
+    
+    def step(self) -> Direction:
+        """Choose a direction and feed it to ``GameEngine.handle_input``.
+        
+        Returns:
+            The direction chosen
+        """
+        direction = self.choose_direction()
+        self.engine.handle_input(direction)
+        return direction
+    
+    def choose_direction(self) -> Direction:
+        """Choose the next direction for the snake.
+        
+        Returns:
+            The direction to move in
+        
+        Raises:
+            ValueError: If the snake's body cannot be laid along the cycle
+        """
+        snake = self.engine.snake
+        if snake is not self._snake:
+            self._align(snake)
+        index = self._index
+        size = len(index)
+        
+        cells = snake.cells
+        head = cells[0]
+        head_index = index[head]
+        target = self._order[(head_index + 1) % size]
+        
+        food = self.engine.food.get_cell()
+        length = len(cells)
+        if (self.shortcuts and food is not None
+                and length < size * self.shortcut_limit):
+            to_food = (index[food] - head_index) % size
+            to_tail = (index[cells[-1]] - head_index) % size
+            limit = min(to_food, to_tail - self.safety_gap - 1)
+            best = 1
+            occupancy = snake.occupancy
+            for table in self.engine.board.neighbor_tables:
+                cell = table[head]
+                ahead = (index[cell] - head_index) % size
+                if best < ahead <= limit and not occupancy[cell]:
+                    best = ahead
+                    target = cell
+        
+        neighbors = self.engine.board.neighbors
+        for direction in Direction:
+            if neighbors[direction][head] == target:
+                return direction
+        return snake.direction
+    
+    def _align(self, snake) -> None:
+        """Place the cycle so the snake's body lies along it.
+        
+        The cached cycle is shifted horizontally and, if needed, traversed
+        backwards until the body occupies consecutive cycle positions
+        ending at the head.
+        
+        Args:
+            snake: The snake to align with
+        
+        Raises:
+            ValueError: If the board has walls or no shift or orientation
+                fits the body
+        """
+        board = self.engine.board
+        if board.level_map is not None and board.level_map.wall_count:
+            raise ValueError("Hamiltonian cycle needs a board without walls")
+        width = board.width
+        order, index = hamiltonian_cycle(width, board.height)
+        size = len(order)
+        cells = list(snake.cells)
+        
+        def shifted(cell: Cell, shift: int) -> int:
+            x = cell % width
+            return index[cell - x + (x - shift) % width]
+        
+        for shift in range(width):
+            head_index = shifted(cells[0], shift)
+            for step in (1, -1):
+                if not all(shifted(cell, shift) == (head_index - step * i) % size
+                           for i, cell in enumerate(cells)):
+                    continue
+                
+                self._index = array('i', (
+                    shifted(cell, shift) if step == 1
+                    else size - 1 - shifted(cell, shift)
+                    for cell in range(size)
+                ))
+                self._order = array('i', bytes(index.itemsize * size))
+                for cell, position in enumerate(self._index):
+                    self._order[position] = cell
+                self._snake = snake
+                return
+        
+        raise ValueError("Snake body does not lie along the Hamiltonian cycle")
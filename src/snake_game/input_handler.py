@@ -1,20 +1,191 @@
 """InputHandler class for capturing and processing user input."""
 
+import codecs
+import os
 import sys
 import select
-from typing import Optional
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Deque, List, Optional, Tuple
 from .types import Direction
 
+if TYPE_CHECKING:
+    from .latency import LatencyTracker
 
-class InputHandler:
-    """Handles user input from keyboard."""
+# Map keys to directions
+KEY_MAP = {
+    'w': Direction.UP,
+    'W': Direction.UP,
+    's': Direction.DOWN,
+    'S': Direction.DOWN,
+    'a': Direction.LEFT,
+    'A': Direction.LEFT,
+    'd': Direction.RIGHT,
+    'D': Direction.RIGHT,
+}
+
+# Final bytes of arrow-key escape sequences (CSI "ESC [" or SS3 "ESC O")
+ARROW_MAP = {
+    'A': Direction.UP,
+    'B': Direction.DOWN,
+    'C': Direction.RIGHT,
+    'D': Direction.LEFT,
+}
+
+# Second bytes of Windows extended keys (after b'\xe0' or b'\x00')
+WINDOWS_ARROW_MAP = {
+    b'H': Direction.UP,
+    b'P': Direction.DOWN,
+    b'K': Direction.LEFT,
+    b'M': Direction.RIGHT,
+}
+
+# Upper bound on bytes drained per poll, so a flood cannot stall a tick
+MAX_READ_BYTES = 4096
+
+# Upper bound on buffered non-direction keys; the oldest are dropped
+MAX_QUEUED_CHARS = 16
+
+# Seconds a blocking wait gives the rest of an escape sequence to arrive
+# before a pending ESC counts as the ESC key
+ESCAPE_TIMEOUT = 0.05
+
+# Seconds between key checks while waiting on a console without select()
+CONSOLE_POLL_INTERVAL = 0.05
+
+
+class KeyParser:
+    """Incremental parser turning raw terminal text into key commands.
+    
+    Escape sequences may be split across reads; an incomplete sequence is
+    kept until more text arrives. A lone ESC is only reported once a read
+    comes back empty, since it may be the start of an arrow key.
+    """
     
     def __init__(self):
-        """Initialize the input handler."""
+        """Initialize the parser with no pending text."""
+        self._pending = ''
+    
+    def feed(self, text: str) -> List[object]:
+        """Parse newly read text.
+        
+        Args:
+            text: Decoded characters read from the terminal
+        
+        Returns:
+            Parsed commands in order: Direction for movement keys, the raw
+            character (str) for any other key
+        """
+        data = self._pending + text
+        self._pending = ''
+        commands: List[object] = []
+        i = 0
+        while i < len(data):
+            char = data[i]
+            if char != '\x1b':
+                commands.append(KEY_MAP.get(char, char))
+                i += 1
+                continue
+            
+            end = self._sequence_end(data, i)
+            if end is None:
+                # Incomplete escape sequence - wait for the rest
+                self._pending = data[i:]
+                break
+            if end == i + 1:
+                commands.append(char)
+            else:
+                direction = ARROW_MAP.get(data[end - 1])
+                if direction is not None:
+                    commands.append(direction)
+            i = end
+        return commands
+    
+    @property
+    def pending(self) -> bool:
+        """Whether part of an escape sequence is waiting for the rest."""
+        return bool(self._pending)
+    
+    def flush(self) -> List[object]:
+        """Resolve pending text once no more input is arriving.
+        
+        Returns:
+            Commands for the pending text (a lone ESC becomes an ESC key)
+        """
+        pending = self._pending
+        self._pending = ''
+        if not pending:
+            return []
+        # Only a prefix of an escape sequence can be pending
+        return ['\x1b'] + self.feed(pending[1:])
+    
+    @staticmethod
+    def _sequence_end(data: str, start: int) -> Optional[int]:
+        """Find the end of the escape sequence starting at ``start``.
+        
+        Returns:
+            Index just past the sequence (``start + 1`` for a lone ESC), or
+            None if more text is needed to decide
+        """
+        if start + 1 >= len(data):
+            return None
+        introducer = data[start + 1]
+        if introducer == 'O':
+            # SS3 sequence: ESC O <final>
+            return start + 3 if start + 2 < len(data) else None
+        if introducer != '[':
+            return start + 1
+        
+        # CSI sequence: ESC [ <parameters> <final byte in @..~>
+        i = start + 2
+        while i < len(data):
+            if '@' <= data[i] <= '~':
+                return i + 1
+            i += 1
+        return None
+
+
+class InputHandler:
+    """Handles user input from keyboard.
+    
+    Each poll drains every byte waiting on the terminal, so several keys
+    pressed within one tick are all seen. Movement keys go into a bounded
+    queue and are handed out one per tick; other keys (pause, quit, ...)
+    are available immediately through ``get_last_char``.
+    
+    A movement key equal to the last one still queued is dropped: applying
+    it would not change the direction, it would only hold back the keys
+    after it by a tick (and key repeat produces long runs of one key). So
+    a double tap queued within one tick counts once, while the same key
+    pressed again after the first was handed out is queued.
+    """
+    
+    def __init__(self, fd: Optional[int] = None, max_queued: int = 4,
+                 latency: Optional['LatencyTracker'] = None):
+        """Initialize the input handler.
+        
+        Args:
+            fd: File descriptor to read from (default: standard input)
+            max_queued: Maximum movement keys buffered between ticks; the
+                oldest are dropped beyond this (default: 4)
+            latency: Optional tracker timestamping movement keys when read
+        """
+        self._fd = fd
+        self.latency = latency
         self._configured = False
         self._old_settings = None
         self._last_non_direction_char = None  # Buffer for P, Q, etc.
         
+        self._parser = KeyParser()
+        self._decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+        # Queued movement keys with their read timestamps (if tracked)
+        self._directions: Deque[Tuple[Direction, Optional[float]]] = deque(
+            maxlen=max_queued
+        )
+        self._chars: Deque[str] = deque(maxlen=MAX_QUEUED_CHARS)
+        # Set once no more input can arrive (end of file, or no console)
+        self._at_eof = False
+        
         # Try to import termios for Unix systems
         try:
             import termios
@@ -26,12 +197,25 @@ class InputHandler:
             # Fall back for non-Unix systems
             self._unix_terminal = False
     
+    @property
+    def at_eof(self) -> bool:
+        """Whether input has ended, so waiting for a key would never return."""
+        return self._at_eof
+    
+    def fileno(self) -> int:
+        """Get the file descriptor input is read from.
+        
+        Returns:
+            The input file descriptor
+        """
+        return self._fd if self._fd is not None else sys.stdin.fileno()
+    
     def configure_terminal(self) -> None:
         """Configure terminal for raw input (Unix only)."""
         if self._unix_terminal and not self._configured:
             try:
-                self._old_settings = self._termios.tcgetattr(sys.stdin)
-                self._tty.setcbreak(sys.stdin.fileno())
+                self._old_settings = self._termios.tcgetattr(self.fileno())
+                self._tty.setcbreak(self.fileno())
                 self._configured = True
             except Exception:
                 # If configuration fails, continue without it
@@ -42,81 +226,164 @@ class InputHandler:
         if self._unix_terminal and self._configured and self._old_settings:
             try:
                 self._termios.tcsetattr(
-                    sys.stdin, 
-                    self._termios.TCSADRAIN, 
+                    self.fileno(),
+                    self._termios.TCSADRAIN,
                     self._old_settings
                 )
                 self._configured = False
             except Exception:
                 pass
     
-    def get_input(self) -> Optional[Direction]:
-        """Get user input and convert to direction.
+    def poll(self) -> None:
+        """Drain all pending input without blocking and queue the keys."""
+        if self._unix_terminal:
+            commands = self._read_unix()
+        else:
+            commands = self._read_windows()
         
-        Returns:
-            Direction if valid input received, None otherwise
-        """
-        char = None
+        if not commands:
+            return
+        read_time = self.latency.key_read() if self.latency else None
         
-        # Check if input is available (non-blocking)
-        if self._unix_terminal:
-            # Use select for non-blocking input on Unix
-            if select.select([sys.stdin], [], [], 0)[0]:
-                char = sys.stdin.read(1)
+        for command in commands:
+            if isinstance(command, Direction):
+                # A repeat of the queued key is a no-op; keep one
+                if not self._directions or self._directions[-1][0] != command:
+                    self._directions.append((command, read_time))
             else:
-                return None
-        else:
-            # For non-Unix, try to read without blocking
+                self._chars.append(command)
+    
+    def _read_unix(self) -> List[object]:
+        """Read every available byte from the input descriptor.
+        
+        Returns:
+            Parsed commands
+        """
+        fd = self.fileno()
+        chunks = []
+        total = 0
+        while total < MAX_READ_BYTES:
             try:
-                import msvcrt
-                if msvcrt.kbhit():
-                    char = msvcrt.getch().decode('utf-8')
-                else:
-                    return None
-            except ImportError:
-                # No way to do non-blocking input
-                return None
+                if not select.select([fd], [], [], 0)[0]:
+                    break
+                chunk = os.read(fd, MAX_READ_BYTES - total)
+            except (OSError, ValueError):
+                break
+            if not chunk:
+                self._at_eof = True
+                break
+            chunks.append(chunk)
+            total += len(chunk)
         
-        # Handle no input received
-        if char is None:
-            return None
+        if not chunks:
+            # Nothing new arrived - a pending lone ESC is a real ESC
+            return self._parser.flush()
+        return self._parser.feed(self._decoder.decode(b''.join(chunks)))
+    
+    def _read_windows(self) -> List[object]:
+        """Read every available key from the Windows console.
+        
+        Returns:
+            Parsed commands
+        """
+        try:
+            import msvcrt
+        except ImportError:
+            # No way to do non-blocking input
+            return []
+        
+        commands: List[object] = []
+        while msvcrt.kbhit():
+            key = msvcrt.getch()
+            if key in (b'\xe0', b'\x00'):
+                direction = WINDOWS_ARROW_MAP.get(msvcrt.getch())
+                if direction is not None:
+                    commands.append(direction)
+                continue
+            commands.extend(self._parser.feed(key.decode('utf-8', 'ignore')))
+        commands.extend(self._parser.flush())
+        return commands
+    
+    def get_input(self) -> Optional[Direction]:
+        """Get the next queued direction, reading any pending input first.
+        
+        Call once per tick: one direction is returned per call, so quick
+        sequences (e.g. up then left) are applied on consecutive ticks.
+        Non-direction keys are made available through ``get_last_char``.
         
-        # Map keys to directions
-        key_map = {
-            'w': Direction.UP,
-            'W': Direction.UP,
-            's': Direction.DOWN,
-            'S': Direction.DOWN,
-            'a': Direction.LEFT,
-            'A': Direction.LEFT,
-            'd': Direction.RIGHT,
-            'D': Direction.RIGHT,
-        }
-        
-        # Handle arrow keys (escape sequences on Unix)
-        if char == '\x1b':  # ESC character
-            # Read the next two characters for arrow keys
-            if self._unix_terminal:
-                next_chars = sys.stdin.read(2)
-                if next_chars == '[A':
-                    return Direction.UP
-                elif next_chars == '[B':
-                    return Direction.DOWN
-                elif next_chars == '[C':
-                    return Direction.RIGHT
-                elif next_chars == '[D':
-                    return Direction.LEFT
-            # ESC key for quit - store it so main loop can see it
-            self._last_non_direction_char = char
+        Returns:
+            Next queued Direction, or None if no movement key is waiting
+        """
+        self.poll()
+        if self._chars and self._last_non_direction_char is None:
+            self._last_non_direction_char = self._chars.popleft()
+        if not self._directions:
             return None
+        direction, read_time = self._directions.popleft()
+        if read_time is not None:
+            self.latency.key_applied(read_time)
+        return direction
+    
+    def wait_for_char(self, timeout: Optional[float]) -> Optional[str]:
+        """Wait for a non-direction key, discarding movement keys.
         
-        direction = key_map.get(char)
-        if direction:
-            return direction
+        Used while the game is paused or over, where only control keys
+        matter. Movement keys do not end the wait, so an idle screen can
+        block here until a key needs handling.
         
-        # Not a direction key - store it for pause/quit checking
-        self._last_non_direction_char = char
-        return None
+        Args:
+            timeout: Maximum time to wait in seconds (None waits forever)
+        
+        Returns:
+            The key pressed, or None if the timeout expired or input ended
+            (``at_eof``); with no timeout, None always means input ended
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        self._last_non_direction_char = None
+        while True:
+            if not self._chars:
+                remaining = None
+                if deadline is not None:
+                    remaining = max(0.0, deadline - time.monotonic())
+                if self._parser.pending:
+                    remaining = (ESCAPE_TIMEOUT if remaining is None
+                                 else min(remaining, ESCAPE_TIMEOUT))
+                if self._at_eof or not self._wait_readable(remaining):
+                    self._at_eof = True
+                    self._directions.clear()
+                    return None
+            self.poll()
+            self._directions.clear()
+            if self._chars:
+                return self._chars.popleft()
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+    
+    def _wait_readable(self, timeout: Optional[float]) -> bool:
+        """Block until input may be available.
+        
+        Args:
+            timeout: Maximum time to wait in seconds (None waits forever)
+        
+        Returns:
+            False if input cannot be waited on (closed, or no console)
+        """
+        if self._unix_terminal:
+            try:
+                select.select([self.fileno()], [], [], timeout)
+            except (OSError, ValueError):
+                return False
+            return True
+        try:
+            import msvcrt
+        except ImportError:
+            return False
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not msvcrt.kbhit():
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            time.sleep(CONSOLE_POLL_INTERVAL)
+        return True
     
     def get_last_char(self) -> Optional[str]:
         """Get the last non-direction character that was read.
@@ -136,7 +403,7 @@ class InputHandler:
         
         Args:
             char: Character to check
-            
+        
         Returns:
             True if quit key pressed
         """
@@ -147,7 +414,7 @@ class InputHandler:
         
         Args:
             char: Character to check
-            
+        
         Returns:
             True if restart key pressed
         """
@@ -158,8 +425,30 @@ class InputHandler:
         
         Args:
             char: Character to check
-            
+        
         Returns:
             True if pause key pressed
         """
         return char in ('p', 'P')
+    
+    def should_rewind(self, char: str) -> bool:
+        """Check if user wants to step back in a paused or ended game.
+        
+        Args:
+            char: Character to check
+        
+        Returns:
+            True if rewind key pressed
+        """
+        return char in ('b', 'B')
+    
+    def should_fast_forward(self, char: str) -> bool:
+        """Check if user wants to step forward again after a rewind.
+        
+        Args:
+            char: Character to check
+        
+        Returns:
+            True if fast-forward key pressed
+        """
+        return char in ('f', 'F')
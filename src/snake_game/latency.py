@@ -0,0 +1,187 @@
+"""Input-to-display latency instrumentation."""
+
+import json
+import time
+from bisect import bisect_left
+from collections import deque
+from typing import Callable, Deque, Dict, Optional, Tuple
+
+# Upper bucket bounds in milliseconds; the last bucket is open-ended
+BUCKET_BOUNDS_MS = (1, 2, 5, 10, 20, 35, 50, 75, 100, 150, 200, 300, 500, 1000)
+
+# Stages a keypress passes through, measured from the previous stage
+STAGES = ('queued', 'tick', 'render', 'total')
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of latencies in milliseconds."""
+    
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self.counts = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms: Optional[float] = None
+        self.max_ms: Optional[float] = None
+    
+    def record(self, latency_ms: float) -> None:
+        """Add one latency sample.
+        
+        Args:
+            latency_ms: Latency in milliseconds
+        """
+        self.counts[bisect_left(BUCKET_BOUNDS_MS, latency_ms)] += 1
+        self.count += 1
+        self.total_ms += latency_ms
+        if self.min_ms is None or latency_ms < self.min_ms:
+            self.min_ms = latency_ms
+        if self.max_ms is None or latency_ms > self.max_ms:
+            self.max_ms = latency_ms
+    
+    def percentile(self, fraction: float) -> Optional[float]:
+        """Estimate a percentile as the upper bound of its bucket.
+        
+        Args:
+            fraction: Percentile as a fraction (e.g. 0.99)
+        
+        Returns:
+            Upper bound in milliseconds (the maximum for the open-ended
+            bucket), or None if the histogram is empty
+        """
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for bucket, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                if bucket < len(BUCKET_BOUNDS_MS):
+                    return min(float(BUCKET_BOUNDS_MS[bucket]), self.max_ms)
+                return self.max_ms
+        return self.max_ms
+    
+    def to_dict(self) -> dict:
+        """Summarize the histogram for reports.
+        
+        Returns:
+            Dictionary of counts, bucket bounds and summary statistics
+        """
+        return {
+            'count': self.count,
+            'mean_ms': self.total_ms / self.count if self.count else None,
+            'min_ms': self.min_ms,
+            'max_ms': self.max_ms,
+            'p50_ms': self.percentile(0.5),
+            'p90_ms': self.percentile(0.9),
+            'p99_ms': self.percentile(0.99),
+            'bucket_bounds_ms': list(BUCKET_BOUNDS_MS),
+            'bucket_counts': list(self.counts),
+        }
+
+
+class LatencyTracker:
+    """Follows keypresses from terminal read to the frame that shows them.
+    
+    Stages, each timed from the previous one:
+    
+    - queued: read by ``InputHandler`` until handed to the game loop
+    - tick: handed over until the next ``GameEngine.tick`` completes
+    - render: tick until ``Renderer`` flushes the frame reflecting it
+    - total: read until flush
+    
+    Histograms are kept separately per tick rate, since the tick interval
+    dominates the expected latency.
+    
+    Attributes:
+        ticks: Ticks completed so far; a frame drawn after tick N reflects
+            the keys of ticks up to N (see ``frame_flushed``)
+    """
+    
+    def __init__(self, tick_rate: int = 0,
+                 clock: Callable[[], float] = time.perf_counter):
+        """Initialize the tracker.
+        
+        Args:
+            tick_rate: Current tick rate in Hz, used to group histograms
+            clock: Monotonic clock returning seconds
+        """
+        self.tick_rate = tick_rate
+        self._clock = clock
+        self._applied: Deque[Tuple[float, float]] = deque()
+        # (read, applied, tick time, tick number) of keys awaiting a frame
+        self._ticked: Deque[Tuple[float, float, float, int]] = deque()
+        self.ticks = 0
+        self.histograms: Dict[int, Dict[str, LatencyHistogram]] = {}
+    
+    def key_read(self) -> float:
+        """Timestamp keys just read from the terminal.
+        
+        Returns:
+            Read timestamp to pass back to ``key_applied``
+        """
+        return self._clock()
+    
+    def key_applied(self, read_time: float) -> None:
+        """Record that a key read at ``read_time`` was handed to the engine.
+        
+        Args:
+            read_time: Timestamp returned by ``key_read``
+        """
+        self._applied.append((read_time, self._clock()))
+    
+    def tick_completed(self) -> None:
+        """Record that a tick applying all handed-over keys completed."""
+        self.ticks += 1
+        if not self._applied:
+            return
+        now = self._clock()
+        while self._applied:
+            read_time, applied_time = self._applied.popleft()
+            self._ticked.append((read_time, applied_time, now, self.ticks))
+    
+    def frame_flushed(self, through: Optional[int] = None) -> None:
+        """Record that a frame reflecting ticked keys was flushed.
+        
+        Args:
+            through: Last tick (a ``ticks`` value) the frame reflects, for
+                frames displayed after later ticks already completed (e.g.
+                by a render thread); keys of later ticks keep waiting for
+                their own frame (default: every ticked key)
+        """
+        ticked = self._ticked
+        if not ticked or (through is not None and ticked[0][3] > through):
+            return
+        now = self._clock()
+        stages = self.histograms.get(self.tick_rate)
+        if stages is None:
+            stages = {stage: LatencyHistogram() for stage in STAGES}
+            self.histograms[self.tick_rate] = stages
+        while ticked and (through is None or ticked[0][3] <= through):
+            read_time, applied_time, tick_time, _ = ticked.popleft()
+            stages['queued'].record((applied_time - read_time) * 1000)
+            stages['tick'].record((tick_time - applied_time) * 1000)
+            stages['render'].record((now - tick_time) * 1000)
+            stages['total'].record((now - read_time) * 1000)
+    
+    def report(self) -> dict:
+        """Summarize all histograms.
+        
+        Returns:
+            Mapping of tick rate (as a string) to per-stage summaries
+        """
+        return {
+            str(tick_rate): {
+                stage: histogram.to_dict()
+                for stage, histogram in stages.items()
+            }
+            for tick_rate, stages in sorted(self.histograms.items())
+        }
+    
+    def write_json(self, path: str) -> None:
+        """Write the report to a JSON file.
+        
+        Args:
+            path: Destination file path
+        """
+        with open(path, 'w') as f:
+            json.dump(self.report(), f, indent=2)
@@ -0,0 +1,133 @@
+"""Static obstacle maps loaded into a GameBoard."""
+
+import os
+from array import array
+from functools import lru_cache
+from itertools import compress
+from typing import Optional
+from .types import Cell, Position
+
+# Wall character in map files
+WALL = ord('#')
+
+# Characters allowed in a map row: wall, floor ('.' or space), start
+MAP_CHARS = b'#. S'
+
+# Byte translation tables: map characters to a wall mask (wall -> 1),
+# and a wall mask to an open-cell mask (0 <-> 1)
+_WALL_MASK = bytes(1 if byte == WALL else 0 for byte in range(256))
+_INVERT_MASK = bytes((1, 0)) + bytes(254)
+
+
+class LevelMap:
+    """A parsed obstacle map.
+    
+    Attributes:
+        width: Map width in cells
+        height: Map height in cells
+        walls: Wall mask indexed by packed cell (1 = wall), read-only
+        open_cells: Packed cells that are not walls, ascending, read-only
+        start: Head position marked with 'S', or None
+    """
+    
+    def __init__(self, width: int, height: int, walls: bytes,
+                 start: Optional[Position] = None):
+        """Initialize the map.
+        
+        Args:
+            width: Map width in cells
+            height: Map height in cells
+            walls: Wall mask of ``width * height`` bytes (1 = wall)
+            start: Head position marked with 'S', or None
+        """
+        self.width = width
+        self.height = height
+        self.walls = bytes(walls)
+        self.open_cells = array('i', compress(
+            range(width * height), self.walls.translate(_INVERT_MASK)
+        ))
+        self.start = start
+    
+    @property
+    def wall_count(self) -> int:
+        """Number of wall cells."""
+        return len(self.walls) - len(self.open_cells)
+    
+    def is_wall(self, cell: Cell) -> bool:
+        """Check whether a cell is a wall.
+        
+        Args:
+            cell: Packed cell index
+        
+        Returns:
+            True if the cell is a wall
+        """
+        return bool(self.walls[cell])
+
+
+def parse_map(text: str) -> LevelMap:
+    """Parse a map from text.
+    
+    Each line is a row of the board: '#' is a wall, '.' or a space is floor
+    and 'S' marks where the snake's head starts (facing right, so the cells
+    to its left must be free). Trailing empty lines are ignored; a trailing
+    row of spaces is a row of floor.
+    
+    Args:
+        text: Map text
+    
+    Returns:
+        The parsed map
+    
+    Raises:
+        ValueError: If the map is empty, rows differ in width, a row has an
+            unknown character, or more than one start is marked
+    """
+    rows = text.encode().splitlines()
+    while rows and not rows[-1]:
+        rows.pop()
+    if not rows:
+        raise ValueError("Map is empty")
+    
+    width = len(rows[0])
+    start = None
+    for y, row in enumerate(rows):
+        if len(row) != width:
+            raise ValueError(f"Map row {y + 1} is {len(row)} wide, expected {width}")
+        if row.translate(None, MAP_CHARS):
+            raise ValueError(f"Map row {y + 1} has characters other than {MAP_CHARS!r}")
+        x = row.find(b'S')
+        if x >= 0:
+            if start is not None or row.find(b'S', x + 1) >= 0:
+                raise ValueError("Map marks more than one start")
+            start = (x, y)
+    
+    walls = b''.join(rows).translate(_WALL_MASK)
+    return LevelMap(width, len(rows), walls, start)
+
+
+def load_map(path: str) -> LevelMap:
+    """Load a map file, parsing it only once.
+    
+    Parsed maps are cached by path and modification time, so loading the
+    same unchanged file again is free and an edited file is re-read.
+    
+    Args:
+        path: Path to the map file
+    
+    Returns:
+        The parsed map, shared between callers (treat as read-only)
+    
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the map is malformed
+    """
+    path = os.path.realpath(path)
+    return _load_map_cached(path, os.stat(path).st_mtime_ns)
+
+
+@lru_cache(maxsize=16)
+def _load_map_cached(path: str, mtime_ns: int) -> LevelMap:
+    """Parse a map file; cached per path and modification time."""
+    with open(path, encoding='utf-8') as f:
+        return parse_map(f.read())
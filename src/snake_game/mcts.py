@@ -0,0 +1,528 @@
+"""Monte Carlo tree search bot built on a lightweight rollout engine."""
+
+import math
+import random
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Callable, List, Optional, Set, Tuple
+from .game_engine import FOOD_SCORE, collision_at
+from .transposition import NO_MOVE, TranspositionTable
+from .types import Cell, Difficulty, Direction
+
+if TYPE_CHECKING:
+    from .game_engine import GameEngine
+
+# Search directions; a node's children are indexed like this tuple
+DIRECTIONS = tuple(Direction)
+
+# Outcomes of RolloutEngine.move
+DIED = -1
+MOVED = 0
+ATE = 1
+
+# Random cells tried when replacing eaten food inside a rollout
+RESPAWN_ATTEMPTS = 8
+
+# Per-step discount on food eaten further in the future
+FOOD_DISCOUNT = 0.9
+
+# Chance a rollout move heads for the food instead of a random safe cell
+FOOD_BIAS = 0.75
+
+# Weight of the end-of-rollout closeness to the food
+DISTANCE_WEIGHT = 0.1
+
+# Multiplier mixing a node's depth into its transposition key
+_DEPTH_KEY = 0x9E3779B97F4A7C15
+_MASK = (1 << 64) - 1
+
+
+class RolloutEngine:
+    """A game's state that plays moves and takes them back cheaply.
+    
+    Moves follow ``GameEngine``'s rules: the head enters its cell before the
+    tail leaves, ``collision_at`` decides crashes, and food grows the snake
+    and scores ``FOOD_SCORE``. Eaten main food is replaced by a random free
+    cell; other food items are simply used up. Every move pushes an undo
+    record, so a search can play down the tree and through a rollout and
+    then rewind to the root in O(moves) without ever copying the board.
+    Unless disabled, a Zobrist hash of the position is kept the same way as
+    the engine's; ``state_hash()`` equals ``GameEngine.state_hash()`` for
+    the same position.
+    """
+    
+    def __init__(self, engine: 'GameEngine', hashed: bool = True):
+        """Copy the current state of a game.
+        
+        Args:
+            engine: The game to copy
+            hashed: Maintain ``state_hash()`` (default: True); searches
+                without a transposition table skip the cost
+        """
+        board = engine.board
+        snake = engine.snake
+        self.board = board
+        self.occupancy = bytearray(snake.occupancy)
+        self.cells = deque(snake.cells)
+        self.direction = snake.direction
+        self.grow_pending = snake.grow_pending
+        self.food = engine.food.get_cell()
+        self.score = engine.score
+        self.alive = True
+        self._neighbors = board.neighbors
+        self._extras = engine.foods.mask
+        self._eaten: Set[Cell] = set()
+        self._undo: List[Tuple] = []
+        
+        # Position hash without the direction and growth keys
+        self._keys = engine.zobrist if hashed else None
+        self._hash = 0
+        if hashed:
+            self._hash = engine.state_hash() ^ engine.zobrist.direction[self.direction]
+            if self.grow_pending:
+                self._hash ^= engine.zobrist.grow
+    
+    @property
+    def depth(self) -> int:
+        """Number of moves played since the copy (or since the last rewind)."""
+        return len(self._undo)
+    
+    def state_hash(self) -> int:
+        """Get the Zobrist hash of the current position.
+        
+        Returns:
+            64-bit hash
+        
+        Raises:
+            ValueError: If the engine was created with ``hashed=False``
+        """
+        keys = self._keys
+        if keys is None:
+            raise ValueError("RolloutEngine was created without hashing")
+        value = self._hash ^ keys.direction[self.direction]
+        if self.grow_pending:
+            value ^= keys.grow
+        return value
+    
+    def is_safe(self, direction: Direction) -> bool:
+        """Check whether a move would survive.
+        
+        Args:
+            direction: Direction to move in
+        
+        Returns:
+            True if the move does not crash
+        """
+        cell = self._neighbors[direction][self.cells[0]]
+        if not self.occupancy[cell]:
+            return True
+        # The tail leaves in the same move unless the snake is growing
+        return cell == self.cells[-1] and not self.grow_pending
+    
+    def is_food(self, cell: Cell) -> bool:
+        """Check whether a cell holds food in this line of play.
+        
+        Args:
+            cell: Packed cell index
+        
+        Returns:
+            True if the cell has uneaten food
+        """
+        return cell == self.food or (self._extras[cell] == 1
+                                     and cell not in self._eaten)
+    
+    def move(self, direction: Direction) -> int:
+        """Play one tick.
+        
+        Args:
+            direction: Direction to move in (a reversal keeps the current one)
+        
+        Returns:
+            ``DIED``, ``ATE`` or ``MOVED``
+        """
+        if direction is self.direction.opposite():
+            direction = self.direction
+        cells = self.cells
+        occupancy = self.occupancy
+        keys = self._keys
+        value = self._hash
+        head = self._neighbors[direction][cells[0]]
+        cells.appendleft(head)
+        occupancy[head] += 1
+        tail = -1
+        if not self.grow_pending:
+            tail = cells.pop()
+            occupancy[tail] -= 1
+        if keys is not None:
+            self._hash ^= keys.head[cells[1]] ^ keys.enter[head]
+            if tail >= 0:
+                self._hash ^= keys.body[tail] ^ keys.tail[tail] ^ keys.tail[cells[-1]]
+        self._undo.append((self.direction, self.grow_pending, tail,
+                           self.food, self.score, self.alive, value))
+        self.direction = direction
+        self.grow_pending = False
+        
+        if collision_at(self.board, occupancy, head) is not None:
+            self.alive = False
+            return DIED
+        if head == self.food:
+            self.food = self._respawn()
+            if keys is not None:
+                self._hash ^= keys.food[head]
+                if self.food is not None:
+                    self._hash ^= keys.food[self.food]
+        elif self._extras[head] and head not in self._eaten:
+            self._eaten.add(head)
+            if keys is not None:
+                self._hash ^= keys.food[head]
+        else:
+            return MOVED
+        self.grow_pending = True
+        self.score += FOOD_SCORE
+        return ATE
+    
+    def undo(self) -> None:
+        """Take back the last move."""
+        (self.direction, self.grow_pending, tail,
+         food, score, self.alive, self._hash) = self._undo.pop()
+        cells = self.cells
+        occupancy = self.occupancy
+        head = cells.popleft()
+        occupancy[head] -= 1
+        if tail >= 0:
+            cells.append(tail)
+            occupancy[tail] += 1
+        # Scoring without replacing the main food means an extra was eaten
+        if score != self.score and food == self.food:
+            self._eaten.discard(head)
+        self.food = food
+        self.score = score
+    
+    def rewind(self, depth: int = 0) -> None:
+        """Take back moves until ``depth`` moves remain.
+        
+        Args:
+            depth: Number of moves to keep
+        """
+        while len(self._undo) > depth:
+            self.undo()
+    
+    def _respawn(self) -> Optional[Cell]:
+        """Pick a random free cell for new food.
+        
+        Returns:
+            A free cell, or None if a few random tries found none
+        """
+        open_cells = self.board.open_cells
+        occupancy = self.occupancy
+        for _ in range(RESPAWN_ATTEMPTS):
+            cell = random.choice(open_cells)
+            if not occupancy[cell] and not self.is_food(cell):
+                return cell
+        return None
+
+
+class Node:
+    """A search tree node: the state after a sequence of moves."""
+    
+    __slots__ = ('children', 'visits', 'value', 'dead')
+    
+    def __init__(self):
+        """Initialize an unvisited node."""
+        self.children: List[Optional['Node']] = [None] * len(DIRECTIONS)
+        self.visits = 0
+        self.value = 0.0
+        self.dead = False
+
+
+class MCTSBot:
+    """Steers a GameEngine's snake with Monte Carlo tree search.
+    
+    Each decision searches from the current state for a time budget of
+    ``budget_fraction`` of a tick at the difficulty's tick rate. An
+    iteration descends the tree by UCT, adds one child, then plays a
+    food-biased random rollout for up to ``horizon`` moves on a
+    ``RolloutEngine``, and backs up a reward of discounted food eaten plus
+    a bonus for surviving (and for ending near the food). The search is
+    open-loop: food respawns inside the tree are random per iteration, so a
+    node's statistics average over them.
+    
+    After a move the chosen child becomes the next root when the game
+    arrives at the state it predicted, so search effort carries over
+    between ticks.
+    
+    With a ``TranspositionTable``, a new leaf reached by another move order
+    (same position hash at the same depth) reuses the stored rollout value
+    instead of playing a new rollout, and each search's best move is stored
+    to be tried first when the position comes up again.
+    """
+    
+    def __init__(self, engine: 'GameEngine',
+                 difficulty: Difficulty = Difficulty.MEDIUM,
+                 budget_fraction: float = 0.5, budget: Optional[float] = None,
+                 max_iterations: Optional[int] = None, horizon: int = 30,
+                 exploration: float = 1.0,
+                 table: Optional[TranspositionTable] = None,
+                 clock: Callable[[], float] = time.perf_counter):
+        """Initialize the bot.
+        
+        Args:
+            engine: The game engine to steer
+            difficulty: Difficulty whose tick rate sets the time budget
+            budget_fraction: Fraction of a tick to spend searching
+                (default: 0.5)
+            budget: Seconds per decision, overriding the difficulty
+            max_iterations: Stop a search after this many iterations, even
+                with time left (useful for reproducible tests)
+            horizon: Maximum moves per rollout (default: 30)
+            exploration: UCT exploration constant (default: 1.0)
+            table: Transposition table shared by the searches (default:
+                none)
+            clock: Monotonic clock returning seconds
+        """
+        self.engine = engine
+        self.budget = (budget if budget is not None
+                       else budget_fraction / difficulty.get_tick_rate())
+        self.max_iterations = max_iterations
+        self.horizon = horizon
+        self.exploration = exploration
+        self.table = table
+        self._clock = clock
+        
+        # Counters for benchmarks and debugging
+        self.iterations = 0
+        self.rollout_moves = 0
+        self.search_time = 0.0
+        self.reused = 0
+        
+        self._root: Optional[Node] = None
+        self._expected: Optional[Tuple] = None
+    
+    def step(self) -> Direction:
+        """Choose a direction and feed it to ``GameEngine.handle_input``.
+        
+        Returns:
+            The direction chosen
+        """
+        direction = self.choose_direction()
+        self.engine.handle_input(direction)
+        return direction
+    
+    def choose_direction(self) -> Direction:
+        """Search from the current state and pick the most visited move.
+        
+        Returns:
+            The direction to move in
+        """
+        engine = self.engine
+        root = self._reuse_root()
+        table = self.table
+        state = RolloutEngine(engine, hashed=table is not None)
+        hint = NO_MOVE
+        if table is not None:
+            table.new_search()
+            slot = table.probe(state.state_hash())
+            if slot >= 0:
+                hint = table.moves[slot]
+        
+        start = self._clock()
+        deadline = start + self.budget
+        iterations = 0
+        while self.max_iterations is None or iterations < self.max_iterations:
+            self._iterate(root, state, hint)
+            iterations += 1
+            if self._clock() >= deadline:
+                break
+        self.iterations += iterations
+        self.search_time += self._clock() - start
+        
+        best = None
+        reverse = engine.snake.direction.opposite()
+        for index, direction in enumerate(DIRECTIONS):
+            child = root.children[index]
+            if direction is reverse or child is None:
+                continue
+            if best is None or child.visits > root.children[best].visits:
+                best = index
+        if best is None:
+            return engine.snake.direction
+        if table is not None:
+            table.store(state.state_hash(), root.value / root.visits, move=best)
+        
+        # Remember what the chosen move leads to, to reuse its subtree
+        direction = DIRECTIONS[best]
+        self._root = root.children[best]
+        head = engine.board.neighbors[direction][engine.snake.cells[0]]
+        self._expected = (engine.snake, head, len(engine.snake.cells),
+                          engine.food.get_cell(), engine.score)
+        return direction
+    
+    def _reuse_root(self) -> Node:
+        """Get the subtree for the current state, or a fresh root.
+        
+        Returns:
+            Root node for the next search
+        """
+        engine = self.engine
+        snake = engine.snake
+        expected = self._expected
+        root = self._root
+        self._root = None
+        self._expected = None
+        if (root is not None and expected is not None and not root.dead
+                and expected == (snake, snake.cells[0], len(snake.cells),
+                                 engine.food.get_cell(), engine.score)):
+            self.reused += 1
+            return root
+        return Node()
+    
+    def _iterate(self, root: Node, state: RolloutEngine,
+                 hint: int = NO_MOVE) -> None:
+        """Run one selection, expansion, rollout and backup pass.
+        
+        Args:
+            root: Root of the search tree
+            state: Rollout engine at the root state; rewound afterwards
+            hint: Move to try first at the root, or ``NO_MOVE``
+        """
+        path = [root]
+        node = root
+        reward = 0.0
+        discount = 1.0
+        
+        # Selection and expansion
+        while not node.dead:
+            index = self._select(node, state, hint if node is root else NO_MOVE)
+            if index < 0:
+                break
+            child = node.children[index]
+            created = child is None
+            if created:
+                child = node.children[index] = Node()
+            outcome = state.move(DIRECTIONS[index])
+            if outcome == ATE:
+                reward += discount
+            elif outcome == DIED:
+                child.dead = True
+            discount *= FOOD_DISCOUNT
+            path.append(child)
+            node = child
+            if created:
+                break
+        
+        if not node.dead:
+            reward += self._evaluate(state, discount)
+        state.rewind()
+        
+        for visited in path:
+            visited.visits += 1
+            visited.value += reward
+    
+    def _select(self, node: Node, state: RolloutEngine,
+                hint: int = NO_MOVE) -> int:
+        """Pick the child to descend into.
+        
+        Unvisited moves are tried first (the hint, then random order), then
+        the best by UCT among the moves that are not reversals.
+        
+        Args:
+            node: Node being descended
+            state: Rollout engine at the node's state
+            hint: Move to try first if unvisited, or ``NO_MOVE``
+        
+        Returns:
+            Index into ``DIRECTIONS``, or -1 if there is no move
+        """
+        reverse = state.direction.opposite()
+        children = node.children
+        unvisited = [index for index, direction in enumerate(DIRECTIONS)
+                     if direction is not reverse and children[index] is None]
+        if unvisited:
+            return hint if hint in unvisited else random.choice(unvisited)
+        
+        log_visits = math.log(node.visits or 1)
+        best = -1
+        best_score = -math.inf
+        for index, direction in enumerate(DIRECTIONS):
+            child = children[index]
+            if direction is reverse or child is None:
+                continue
+            score = (child.value / child.visits
+                     + self.exploration * math.sqrt(log_visits / child.visits))
+            if score > best_score:
+                best = index
+                best_score = score
+        return best
+    
+    def _evaluate(self, state: RolloutEngine, discount: float) -> float:
+        """Value a new leaf, from the transposition table when possible.
+        
+        A leaf's key combines its position hash with its depth, since the
+        rollout's discount and remaining horizon depend on the depth.
+        
+        Args:
+            state: Rollout engine at the leaf (rewound by the caller)
+            discount: Discount already applied at this depth
+        
+        Returns:
+            The leaf's rollout reward
+        """
+        table = self.table
+        if table is None:
+            return self._rollout(state, discount)
+        key = (state.state_hash() ^ state.depth * _DEPTH_KEY) & _MASK
+        slot = table.probe(key)
+        if slot >= 0:
+            return table.values[slot]
+        value = self._rollout(state, discount)
+        table.store(key, value)
+        return value
+    
+    def _rollout(self, state: RolloutEngine, discount: float) -> float:
+        """Play food-biased random moves from the state.
+        
+        Args:
+            state: Rollout engine to play on (rewound by the caller)
+            discount: Discount already applied at this depth
+        
+        Returns:
+            Discounted food eaten plus the survival and closeness bonus
+        """
+        width, height = state.board.get_dimensions()
+        neighbors = state._neighbors
+        reward = 0.0
+        moves = 0
+        for _ in range(self.horizon - state.depth):
+            reverse = state.direction.opposite()
+            safe = [direction for direction in DIRECTIONS
+                    if direction is not reverse and state.is_safe(direction)]
+            if not safe:
+                # Trapped: every move crashes, so no survival bonus
+                self.rollout_moves += moves
+                return reward
+            food = state.food
+            if food is not None and random.random() < FOOD_BIAS:
+                head = state.cells[0]
+                direction = min(safe, key=lambda d: _distance(
+                    neighbors[d][head], food, width, height))
+            else:
+                direction = random.choice(safe)
+            if state.move(direction) == ATE:
+                reward += discount
+            discount *= FOOD_DISCOUNT
+            moves += 1
+        self.rollout_moves += moves
+        
+        # Survived the horizon
+        reward += 1.0
+        if state.food is not None:
+            closeness = _distance(state.cells[0], state.food, width, height)
+            reward += DISTANCE_WEIGHT * (1 - closeness / (width + height))
+        return reward
+
+
+def _distance(a: Cell, b: Cell, width: int, height: int) -> int:
+    """Get the wrap-around Manhattan distance between two cells."""
+    dx = abs(a % width - b % width)
+    dy = abs(a // width - b // width)
+    return min(dx, width - dx) + min(dy, height - dy)
@@ -0,0 +1,207 @@
+"""Downsampled whole-board overview drawn beside the main view."""
+
+from array import array
+from collections import deque
+from typing import TYPE_CHECKING, Deque, List
+from .renderer import Colors
+from .types import Cell
+
+if TYPE_CHECKING:
+    from .game_board import GameBoard
+    from .game_engine import GameEngine
+
+# Dot bit for each (row, column) inside a braille character (U+2800 block)
+BRAILLE_BITS = ((0x01, 0x08), (0x02, 0x10), (0x04, 0x20), (0x40, 0x80))
+
+# Dot bit for each (row, column) inside a half-block character
+HALF_BLOCK_BITS = ((0x01,), (0x02,))
+
+# Half-block glyph for each combination of upper (1) and lower (2) dots
+HALF_BLOCK_GLYPHS = (' ', '▀', '▄', '█')
+
+# Ticks the minimap can fall behind and still catch up incrementally
+MAX_CATCH_UP = 64
+
+
+class Minimap:
+    """Aggregates the board into blocks and draws one dot per block.
+    
+    The board is divided into equally sized blocks, each drawn as one dot
+    of a braille (2x4 dots per character) or half-block (1x2) glyph. A dot
+    is lit while any snake segment lies in its block. Block counts and
+    glyph bits are updated incrementally from the head and tail cells that
+    changed since the last draw, so drawing costs O(minimap size) no matter
+    how large the board is.
+    """
+    
+    def __init__(self, board: 'GameBoard', columns: int = 24, rows: int = 12,
+                 glyphs: str = 'braille'):
+        """Initialize the minimap.
+        
+        Args:
+            board: The board to summarize
+            columns: Maximum width in characters, excluding the frame
+                (default: 24)
+            rows: Maximum height in characters, excluding the frame
+                (default: 12)
+            glyphs: 'braille' or 'half' (half-block characters)
+        
+        Raises:
+            ValueError: If the glyph style is unknown or the size is not
+                positive
+        """
+        if glyphs not in ('braille', 'half'):
+            raise ValueError(f"Unknown minimap glyphs {glyphs!r}")
+        if columns < 1 or rows < 1:
+            raise ValueError("Minimap must be at least one character")
+        
+        self.board = board
+        self.glyphs = glyphs
+        self._dot_bits = BRAILLE_BITS if glyphs == 'braille' else HALF_BLOCK_BITS
+        dots_y = len(self._dot_bits)
+        dots_x = len(self._dot_bits[0])
+        
+        # Smallest block size that fits the board into the character budget
+        self.block_width = -(-board.width // (columns * dots_x))
+        self.block_height = -(-board.height // (rows * dots_y))
+        blocks_x = -(-board.width // self.block_width)
+        blocks_y = -(-board.height // self.block_height)
+        self.columns = -(-blocks_x // dots_x)
+        self.rows = -(-blocks_y // dots_y)
+        self._blocks_x = blocks_x
+        
+        # For each block: the character it is drawn in and its dot bit
+        self._block_char = array('i', [0]) * (blocks_x * blocks_y)
+        self._block_bit = bytearray(blocks_x * blocks_y)
+        for by in range(blocks_y):
+            for bx in range(blocks_x):
+                block = by * blocks_x + bx
+                self._block_char[block] = (by // dots_y) * self.columns + bx // dots_x
+                self._block_bit[block] = self._dot_bits[by % dots_y][bx % dots_x]
+        
+        self._counts = array('i', [0]) * (blocks_x * blocks_y)
+        self._bits = bytearray(self.columns * self.rows)
+        
+        # Counters for benchmarks and debugging
+        self.rebuilds = 0
+        self.updates = 0
+        
+        self._snake = None
+        self._cells: Deque[Cell] = deque()
+    
+    @property
+    def width(self) -> int:
+        """Width of the drawn minimap in characters, including the frame."""
+        return self.columns + 2
+    
+    def block_of(self, cell: Cell) -> int:
+        """Get the block containing a cell.
+        
+        Args:
+            cell: Packed board cell
+        
+        Returns:
+            Block index
+        """
+        y, x = divmod(cell, self.board.width)
+        return (y // self.block_height) * self._blocks_x + x // self.block_width
+    
+    def update(self, snake) -> None:
+        """Bring block counts up to date with the snake.
+        
+        Args:
+            snake: The snake to summarize
+        """
+        cells = snake.cells
+        mirror = self._cells
+        if snake is not self._snake or not mirror:
+            self._rebuild(snake)
+            return
+        
+        # Find how many ticks the snake moved since the last update
+        old_head = mirror[0]
+        steps = None
+        for i in range(min(len(cells), MAX_CATCH_UP + 1)):
+            if cells[i] == old_head:
+                steps = i
+                break
+        removed = len(mirror) + (steps or 0) - len(cells)
+        if steps is None or removed < 0:
+            self._rebuild(snake)
+            return
+        
+        self.updates += 1
+        for i in range(steps - 1, -1, -1):
+            mirror.appendleft(cells[i])
+            self._add(cells[i])
+        for _ in range(removed):
+            self._remove(mirror.pop())
+        if mirror[-1] != cells[-1]:
+            # The body was changed some other way
+            self._rebuild(snake)
+    
+    def draw(self, engine: 'GameEngine') -> List[str]:
+        """Draw the framed minimap for the engine's current state.
+        
+        Args:
+            engine: The game engine to summarize
+        
+        Returns:
+            One string per output line, with ANSI colors
+        """
+        self.update(engine.snake)
+        head_char = self._char_of(engine.snake.get_head_cell())
+        food = engine.food.get_cell()
+        food_char = self._char_of(food) if food is not None else None
+        food_bit = self._block_bit[self.block_of(food)] if food is not None else 0
+        
+        braille = self.glyphs == 'braille'
+        lines = [f"{Colors.BLUE}┌" + "─" * self.columns + f"┐{Colors.RESET}"]
+        bits = self._bits
+        for row in range(self.rows):
+            line = [f"{Colors.BLUE}│{Colors.RESET}"]
+            for char in range(row * self.columns, (row + 1) * self.columns):
+                dots = bits[char]
+                color = Colors.GREEN
+                if char == head_char:
+                    color = Colors.YELLOW
+                elif char == food_char:
+                    dots |= food_bit
+                    color = Colors.RED
+                if not dots:
+                    line.append(" ")
+                    continue
+                glyph = chr(0x2800 + dots) if braille else HALF_BLOCK_GLYPHS[dots]
+                line.append(f"{color}{glyph}{Colors.RESET}")
+            line.append(f"{Colors.BLUE}│{Colors.RESET}")
+            lines.append("".join(line))
+        lines.append(f"{Colors.BLUE}└" + "─" * self.columns + f"┘{Colors.RESET}")
+        return lines
+    
+    def _char_of(self, cell: Cell) -> int:
+        """Get the character a cell is drawn in."""
+        return self._block_char[self.block_of(cell)]
+    
+    def _add(self, cell: Cell) -> None:
+        """Count a newly occupied cell."""
+        block = self.block_of(cell)
+        self._counts[block] += 1
+        if self._counts[block] == 1:
+            self._bits[self._block_char[block]] |= self._block_bit[block]
+    
+    def _remove(self, cell: Cell) -> None:
+        """Uncount a vacated cell."""
+        block = self.block_of(cell)
+        self._counts[block] -= 1
+        if self._counts[block] == 0:
+            self._bits[self._block_char[block]] &= ~self._block_bit[block]
+    
+    def _rebuild(self, snake) -> None:
+        """Recount every snake cell from scratch."""
+        self.rebuilds += 1
+        self._snake = snake
+        self._counts = array('i', [0]) * len(self._counts)
+        self._bits = bytearray(len(self._bits))
+        self._cells = deque(snake.cells)
+        for cell in self._cells:
+            self._add(cell)
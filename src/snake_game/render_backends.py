@@ -0,0 +1,462 @@
+"""Output backends the Renderer draws frames to.
+
+A frame is a list of text lines that may contain ANSI SGR color codes
+(``Colors`` in ``renderer.py``). Backends decide what to do with it: write
+it to a terminal, translate it for curses, keep it in memory, or drop it.
+"""
+
+import os
+import re
+import sys
+import threading
+from collections import deque
+from typing import TYPE_CHECKING, Deque, List, Optional, TextIO, Tuple
+
+if TYPE_CHECKING:
+    from .latency import LatencyTracker
+
+# ANSI escape code to clear screen and move cursor to home
+CLEAR_SCREEN = '\033[2J\033[H'
+
+# SGR sequences such as '\033[92m' or '\033[1;93m'
+SGR_PATTERN = re.compile(r'\033\[([0-9;]*)m')
+
+
+def strip_ansi(text: str) -> str:
+    """Remove SGR color codes from text.
+    
+    Args:
+        text: Text possibly containing color codes
+    
+    Returns:
+        The plain text
+    """
+    return SGR_PATTERN.sub('', text)
+
+
+class RenderBackend:
+    """Base class for render backends."""
+    
+    # Whether the Renderer needs to compose frames for this backend at all
+    composes_frames = True
+    
+    def present(self, lines: List[str]) -> None:
+        """Replace whatever is displayed with a frame.
+        
+        Args:
+            lines: Frame content, one string per line
+        """
+        raise NotImplementedError
+    
+    def get_size(self) -> Optional[Tuple[int, int]]:
+        """Get the display size.
+        
+        Returns:
+            (columns, rows) available for a frame, or None if unbounded
+        """
+        return None
+    
+    def clear(self) -> None:
+        """Clear the display."""
+    
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+
+
+class AnsiBackend(RenderBackend):
+    """Writes frames to a terminal stream using ANSI escape codes."""
+    
+    def __init__(self, stream: Optional[TextIO] = None):
+        """Initialize the backend.
+        
+        Args:
+            stream: Stream to write to (default: ``sys.stdout``, looked up on
+                every write so redirection is honored)
+        """
+        self._stream = stream
+    
+    @property
+    def stream(self) -> TextIO:
+        """The stream frames are written to."""
+        return self._stream if self._stream is not None else sys.stdout
+    
+    def get_size(self) -> Optional[Tuple[int, int]]:
+        """Get the terminal size, queried on every call to follow resizes.
+        
+        Returns:
+            (columns, rows), or None if the stream is not a terminal
+        """
+        try:
+            size = os.get_terminal_size(self.stream.fileno())
+        except (AttributeError, OSError, ValueError):
+            return None
+        return size.columns, size.lines
+    
+    def present(self, lines: List[str]) -> None:
+        """Clear the screen and write the frame with one write and flush.
+        
+        Args:
+            lines: Frame content, one string per line
+        """
+        stream = self.stream
+        stream.write(CLEAR_SCREEN + "\n".join(lines) + "\n")
+        stream.flush()
+    
+    def clear(self) -> None:
+        """Clear the screen and move the cursor home."""
+        stream = self.stream
+        stream.write(CLEAR_SCREEN)
+        stream.flush()
+
+
+class CursesBackend(RenderBackend):
+    """Draws frames with curses, translating ANSI colors to attributes.
+    
+    curses redraws only the cells that changed between frames, which keeps
+    output small on slow links. Requires the ``curses`` module (not
+    available on Windows without a third-party package).
+    """
+    
+    # ANSI foreground codes and the curses colors they map to
+    ANSI_COLORS = {91: 'COLOR_RED', 92: 'COLOR_GREEN', 93: 'COLOR_YELLOW',
+                   94: 'COLOR_BLUE'}
+    
+    def __init__(self, screen=None, use_colors: Optional[bool] = None):
+        """Initialize the backend.
+        
+        Args:
+            screen: curses window to draw on (default: initialize the
+                terminal with ``curses.initscr`` and restore it on close)
+            use_colors: Map ANSI colors to color pairs (default: when the
+                terminal supports colors; off for a supplied screen)
+        
+        Raises:
+            ImportError: If curses is not available
+        """
+        import curses
+        self._curses = curses
+        self._owns_screen = screen is None
+        if screen is None:
+            screen = curses.initscr()
+            curses.noecho()
+            try:
+                curses.curs_set(0)
+            except curses.error:
+                pass
+            if use_colors is None:
+                use_colors = curses.has_colors()
+        self.screen = screen
+        
+        self._attrs = {0: 0, 1: curses.A_BOLD}
+        if use_colors:
+            curses.start_color()
+            for pair, (code, name) in enumerate(sorted(self.ANSI_COLORS.items()), 1):
+                curses.init_pair(pair, getattr(curses, name), curses.COLOR_BLACK)
+                self._attrs[code] = curses.color_pair(pair)
+    
+    def present(self, lines: List[str]) -> None:
+        """Draw the frame and refresh the screen.
+        
+        Args:
+            lines: Frame content, one string per line
+        """
+        screen = self.screen
+        screen.erase()
+        y = 0
+        for line in lines:
+            for row in line.split("\n"):
+                self._draw_row(y, row)
+                y += 1
+        screen.refresh()
+    
+    def get_size(self) -> Optional[Tuple[int, int]]:
+        """Get the screen size.
+        
+        Returns:
+            (columns, rows) of the curses window
+        """
+        rows, columns = self.screen.getmaxyx()
+        return columns, rows
+    
+    def _draw_row(self, y: int, row: str) -> None:
+        """Draw one row, switching attributes at each SGR code.
+        
+        Args:
+            y: Screen row
+            row: Text of the row, possibly with color codes
+        """
+        x = 0
+        attr = 0
+        position = 0
+        for match in SGR_PATTERN.finditer(row):
+            x = self._add(y, x, row[position:match.start()], attr)
+            for code in (match.group(1) or '0').split(';'):
+                code = int(code or 0)
+                if code == 0:
+                    attr = 0
+                elif code in self.ANSI_COLORS:
+                    # A new color replaces the previous one
+                    attr = (attr & ~self._curses.A_COLOR) | self._attrs.get(code, 0)
+                else:
+                    attr |= self._attrs.get(code, 0)
+            position = match.end()
+        self._add(y, x, row[position:], attr)
+    
+    def _add(self, y: int, x: int, text: str, attr: int) -> int:
+        """Write text at a position, ignoring text beyond the screen.
+        
+        Returns:
+            The column after the text
+        """
+        if text:
+            try:
+                self.screen.addstr(y, x, text, attr)
+            except self._curses.error:
+                # Writing past the screen edge; the rest is not visible
+                pass
+        return x + len(text)
+    
+    def clear(self) -> None:
+        """Clear the screen."""
+        self.screen.erase()
+        self.screen.refresh()
+    
+    def close(self) -> None:
+        """Restore the terminal if this backend initialized it."""
+        if self._owns_screen:
+            self._curses.endwin()
+            self._owns_screen = False
+
+
+class NullBackend(RenderBackend):
+    """Discards frames; the Renderer does not even compose them."""
+    
+    composes_frames = False
+    
+    def present(self, lines: List[str]) -> None:
+        """Discard the frame.
+        
+        Args:
+            lines: Frame content (ignored)
+        """
+
+
+class MemoryBackend(RenderBackend):
+    """Keeps frames in memory for tests and benchmarks."""
+    
+    def __init__(self, max_frames: Optional[int] = None,
+                 size: Optional[Tuple[int, int]] = None):
+        """Initialize the backend.
+        
+        Args:
+            max_frames: Number of most recent frames to keep (default: all)
+            size: (columns, rows) to report as the display size (default:
+                unbounded)
+        """
+        self.size = size
+        self.frames: Deque[str] = deque(maxlen=max_frames)
+        self.frame_count = 0
+        self.clears = 0
+    
+    def present(self, lines: List[str]) -> None:
+        """Store the frame as one string.
+        
+        Args:
+            lines: Frame content, one string per line
+        """
+        self.frames.append("\n".join(lines))
+        self.frame_count += 1
+    
+    def get_size(self) -> Optional[Tuple[int, int]]:
+        """Get the configured display size.
+        
+        Returns:
+            (columns, rows), or None if unbounded
+        """
+        return self.size
+    
+    def clear(self) -> None:
+        """Record a clear."""
+        self.clears += 1
+    
+    @property
+    def last_frame(self) -> Optional[str]:
+        """The most recent frame, or None if nothing was drawn."""
+        return self.frames[-1] if self.frames else None
+    
+    def text(self, index: int = -1) -> str:
+        """Get a stored frame with color codes removed.
+        
+        Args:
+            index: Frame index (default: the most recent)
+        
+        Returns:
+            The frame's plain text
+        """
+        return strip_ansi(self.frames[index])
+
+
+class ThreadedBackend(RenderBackend):
+    """Presents frames from a render thread, so callers never wait on output.
+    
+    ``present`` publishes an immutable copy of the frame into a back buffer
+    and returns at once. The render thread swaps the back buffer to the
+    front and hands that frame to the wrapped backend. A frame published
+    while the thread is still writing replaces the one waiting in the back
+    buffer (latest wins), so a slow terminal lowers the displayed frame
+    rate and never delays the game loop or builds a queue.
+    
+    Attributes:
+        backend: The wrapped backend, only called from the render thread
+            (except ``get_size``)
+        published: Frames handed to ``present``
+        displayed: Frames the wrapped backend finished presenting
+        superseded: Frames replaced by a newer one before being displayed
+    """
+    
+    def __init__(self, backend: RenderBackend,
+                 latency: Optional['LatencyTracker'] = None):
+        """Start the render thread.
+        
+        Args:
+            backend: Backend that draws the frames
+            latency: Optional tracker notified when a frame is displayed
+                (instead of the Renderer's, which would mark the publish);
+                each frame is credited only with keys of the ticks that
+                had completed when it was published
+        """
+        self.backend = backend
+        self.composes_frames = backend.composes_frames
+        self.latency = latency
+        self.published = 0
+        self.displayed = 0
+        self.superseded = 0
+        
+        # Waiting frame and the tracker's tick count when it was published
+        self._back: Optional[Tuple[str, ...]] = None
+        self._back_ticks = 0
+        self._busy = False
+        self._closed = False
+        self._error: Optional[BaseException] = None
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name='snake-render',
+                                        daemon=True)
+        self._thread.start()
+    
+    def present(self, lines: List[str]) -> None:
+        """Publish a frame for the render thread.
+        
+        Args:
+            lines: Frame content, one string per line
+        
+        Raises:
+            Exception: Whatever the wrapped backend raised on an earlier
+                frame, which stopped the render thread
+        """
+        frame = tuple(lines)
+        with self._condition:
+            self._raise_error()
+            if self._back is not None:
+                self.superseded += 1
+            self._back = frame
+            if self.latency is not None:
+                self._back_ticks = self.latency.ticks
+            self.published += 1
+            self._condition.notify_all()
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the latest published frame has been displayed.
+        
+        Args:
+            timeout: Most seconds to wait (default: no limit)
+        
+        Returns:
+            False if the timeout expired first
+        """
+        with self._condition:
+            done = self._condition.wait_for(
+                lambda: self._error is not None
+                or (self._back is None and not self._busy),
+                timeout,
+            )
+            self._raise_error()
+            return done
+    
+    def get_size(self) -> Optional[Tuple[int, int]]:
+        """Get the wrapped backend's display size."""
+        return self.backend.get_size()
+    
+    def clear(self) -> None:
+        """Clear the display once the pending frame has been drawn."""
+        self.flush()
+        self.backend.clear()
+    
+    def close(self) -> None:
+        """Display the pending frame, stop the thread and close the backend."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+        self.backend.close()
+        self._raise_error()
+    
+    def _run(self) -> None:
+        """Render thread: present the latest frame until closed."""
+        condition = self._condition
+        while True:
+            with condition:
+                condition.wait_for(lambda: self._back is not None or self._closed)
+                if self._back is None:
+                    return
+                front, self._back = self._back, None
+                ticks = self._back_ticks
+                self._busy = True
+            try:
+                self.backend.present(front)
+            except Exception as error:
+                with condition:
+                    self._error = error
+                    self._busy = False
+                    condition.notify_all()
+                return
+            if self.latency is not None:
+                self.latency.frame_flushed(ticks)
+            with condition:
+                self.displayed += 1
+                self._busy = False
+                condition.notify_all()
+    
+    def _raise_error(self) -> None:
+        """Re-raise the error that stopped the render thread, if any."""
+        if self._error is not None:
+            raise self._error
+
+
+# Backends selectable by name (e.g. from main.py)
+BACKENDS = {
+    'ansi': AnsiBackend,
+    'curses': CursesBackend,
+    'null': NullBackend,
+    'memory': MemoryBackend,
+}
+
+
+def create_backend(name: str) -> RenderBackend:
+    """Create a backend by name.
+    
+    Args:
+        name: One of the keys of ``BACKENDS``
+    
+    Returns:
+        A new backend
+    
+    Raises:
+        ValueError: If the name is unknown
+    """
+    try:
+        backend_class = BACKENDS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown render backend {name!r} (choose from {', '.join(BACKENDS)})"
+        ) from None
+    return backend_class()
@@ -1,11 +1,30 @@
 """Renderer class for displaying game state to terminal."""
 
-import sys
-from typing import TYPE_CHECKING
-from .types import GameState
+import time
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
+from .render_backends import AnsiBackend, RenderBackend
+from .types import GameState, Position
 
 if TYPE_CHECKING:
     from .game_engine import GameEngine
+    from .latency import LatencyTracker
+    from .minimap import Minimap
+
+# Weight of the newest sample in the smoothed write time
+WRITE_TIME_SMOOTHING = 0.5
+
+# Rows used around the board: score line, blank, borders, blank + message,
+# blank + controls
+CHROME_ROWS = 8
+
+# Columns used around the board: left and right border
+CHROME_COLUMNS = 2
+
+# Fraction of the viewport kept between the head and the viewport edge
+CAMERA_MARGIN = 0.25
+
+# Columns between the board and the minimap
+MINIMAP_GAP = 2
 
 
 # ANSI color codes
@@ -20,103 +39,241 @@ class Colors:
 
 
 class Renderer:
-    """Handles rendering of game state to the terminal."""
+    """Handles rendering of game state to the terminal.
+    
+    Frames are composed as lines of ANSI-colored text and handed whole to a
+    ``RenderBackend``; the default backend writes each frame with one write
+    and one flush, so the terminal never shows a partial frame and the
+    flush marks exactly when the frame was handed to the terminal.
+    
+    Write + flush time is measured on every frame. When its smoothed value
+    exceeds ``frame_budget`` the terminal is not keeping up (slow SSH link,
+    congested terminal), so running frames are skipped until the terminal
+    has had as long to drain as the last write took. A skipped frame is
+    never queued: the next frame drawn shows the latest state, so game
+    logic keeps its tick rate while the display rate degrades.
+    
+    Boards larger than the display are drawn through a viewport that
+    follows the snake's head, scrolling (and wrapping with the board) once
+    the head comes within a margin of the viewport edge. Drawing cost is
+    proportional to the viewport, not the board or the snake length. An
+    optional ``Minimap`` gives a whole-board overview beside the view.
+    """
+    
+    def __init__(self, latency: Optional['LatencyTracker'] = None,
+                 frame_budget: Optional[float] = None,
+                 clock: Callable[[], float] = time.perf_counter,
+                 backend: Optional[RenderBackend] = None,
+                 minimap: Optional['Minimap'] = None):
+        """Initialize the renderer.
+        
+        Args:
+            latency: Optional tracker notified whenever a frame is flushed
+            frame_budget: Seconds a frame write may take before frames start
+                being skipped (default: None, never skip)
+            clock: Monotonic clock returning seconds
+            backend: Where frames are drawn (default: ANSI to stdout)
+            minimap: Optional overview drawn to the right of the board
+        """
+        self.backend = backend if backend is not None else AnsiBackend()
+        self.minimap = minimap
+        self.latency = latency
+        self.frame_budget = frame_budget
+        self._clock = clock
+        
+        # Counters for diagnostics
+        self.frames_rendered = 0
+        self.frames_dropped = 0
+        self.last_write_time = 0.0
+        self.write_time = 0.0  # Smoothed write + flush time in seconds
+        self._resume_at = 0.0
+        
+        # Viewport camera: top-left board coordinate and the snake it follows
+        self.camera: Position = (0, 0)
+        self._camera_snake = None
     
-    def __init__(self):
-        """Initialize the renderer."""
-        pass
+    @property
+    def backpressured(self) -> bool:
+        """Whether frame writes currently take longer than the budget."""
+        return self.frame_budget is not None and self.write_time > self.frame_budget
     
     def clear_screen(self) -> None:
         """Clear the terminal screen."""
-        # ANSI escape code to clear screen and move cursor to home
-        sys.stdout.write('\033[2J\033[H')
-        sys.stdout.flush()
+        self.backend.clear()
     
-    def render(self, engine: 'GameEngine', high_score: int = 0) -> None:
+    def render(self, engine: 'GameEngine', high_score: int = 0,
+               force: bool = False) -> bool:
         """Render the current game state.
         
+        Frames of a running game may be skipped under backpressure; paused
+        and finished games are always drawn, since no later frame would
+        replace them.
+        
         Args:
             engine: The game engine containing state to render
             high_score: The high score to display
+            force: Draw even if the terminal is backpressured
+        
+        Returns:
+            True if the frame was written, False if it was skipped
         """
-        self.clear_screen()
+        if (not force and self._clock() < self._resume_at
+                and engine.get_state() == GameState.RUNNING):
+            self.frames_dropped += 1
+            return False
+        if not self.backend.composes_frames:
+            self.frames_rendered += 1
+            return True
         
-        # Display score and high score
-        print(f"Score: {engine.get_score():<10}High Score: {high_score}")
-        print()
+        lines = [f"Score: {engine.get_score():<10}High Score: {high_score}", ""]
+        lines.extend(self._draw_board(engine))
         
-        # Check if paused
         if engine.get_state() == GameState.PAUSED:
-            self._render_paused(engine, high_score)
-            return
+            # Display PAUSED message
+            lines.append(f"\n{Colors.YELLOW}{Colors.BOLD}        *** PAUSED ***{Colors.RESET}")
+            lines.append(f"\nControls: {Colors.YELLOW}P: Resume{Colors.RESET} | Q: Quit")
+        else:
+            # Display controls
+            lines.append(f"\nControls: Arrow Keys or WASD | {Colors.YELLOW}P: Pause{Colors.RESET} | Q: Quit")
+        
+        self._write_frame(lines)
+        return True
+    
+    def _draw_board(self, engine: 'GameEngine') -> List[str]:
+        """Draw the bordered board, or the part of it in the viewport.
         
+        Args:
+            engine: The game engine containing state to render
+        
+        Returns:
+            One string per output line
+        """
         # Get game state
         board = engine.board
-        snake_body = set(engine.snake.get_body())
-        snake_head = engine.snake.get_head_position()
-        food_pos = engine.food.get_position()
+        width = board.width
+        occupancy = engine.snake.occupancy
+        walls = board.walls
+        head = engine.snake.get_head_cell()
+        food = engine.food.get_cell()
+        foods = engine.foods.mask
+        
+        columns, rows = self.get_viewport(board)
+        left, top = self._follow(engine, columns, rows)
+        xs = [(left + i) % width for i in range(columns)]
         
         # Draw top border (blue)
-        print(f"{Colors.BLUE}╔" + "═" * board.width + f"╗{Colors.RESET}")
+        lines = [f"{Colors.BLUE}╔" + "═" * columns + f"╗{Colors.RESET}"]
         
         # Draw board
-        for y in range(board.height):
-            print(f"{Colors.BLUE}║{Colors.RESET}", end="")
-            for x in range(board.width):
-                pos = (x, y)
-                if pos == snake_head:
-                    print(f"{Colors.GREEN}@{Colors.RESET}", end="")
-                elif pos in snake_body:
-                    print(f"{Colors.GREEN}○{Colors.RESET}", end="")
-                elif pos == food_pos:
-                    print(f"{Colors.RED}•{Colors.RESET}", end="")
+        for j in range(rows):
+            base = (top + j) % board.height * width
+            row = [f"{Colors.BLUE}║{Colors.RESET}"]
+            for x in xs:
+                cell = base + x
+                if cell == head:
+                    row.append(f"{Colors.GREEN}@{Colors.RESET}")
+                elif walls[cell]:
+                    row.append(f"{Colors.BLUE}█{Colors.RESET}")
+                elif occupancy[cell]:
+                    row.append(f"{Colors.GREEN}○{Colors.RESET}")
+                elif cell == food or foods[cell]:
+                    row.append(f"{Colors.RED}•{Colors.RESET}")
                 else:
-                    print(" ", end="")
-            print(f"{Colors.BLUE}║{Colors.RESET}")
+                    row.append(" ")
+            row.append(f"{Colors.BLUE}║{Colors.RESET}")
+            lines.append("".join(row))
         
         # Draw bottom border (blue)
-        print(f"{Colors.BLUE}╚" + "═" * board.width + f"╝{Colors.RESET}")
+        lines.append(f"{Colors.BLUE}╚" + "═" * columns + f"╝{Colors.RESET}")
         
-        # Display controls
-        print(f"\nControls: Arrow Keys or WASD | {Colors.YELLOW}P: Pause{Colors.RESET} | Q: Quit")
+        if self.minimap is not None:
+            self._place_minimap(lines, self.minimap.draw(engine), columns + 2)
+        return lines
     
-    def _render_paused(self, engine: 'GameEngine', high_score: int) -> None:
-        """Render the paused game state.
+    @staticmethod
+    def _place_minimap(lines: List[str], minimap: List[str], width: int) -> None:
+        """Append minimap lines to the right of the board lines.
+        
+        Args:
+            lines: Board lines, extended in place
+            minimap: Minimap lines
+            width: Visible width of each board line
+        """
+        gap = " " * MINIMAP_GAP
+        for i, mini in enumerate(minimap):
+            if i < len(lines):
+                lines[i] += gap + mini
+            else:
+                lines.append(" " * width + gap + mini)
+    
+    def get_viewport(self, board) -> Tuple[int, int]:
+        """Get how many board cells fit on the display.
+        
+        Args:
+            board: The board being drawn
+        
+        Returns:
+            (columns, rows) of cells to draw, at most the board size
+        """
+        size = self.backend.get_size()
+        if size is None:
+            return board.width, board.height
+        available = size[0] - CHROME_COLUMNS
+        if self.minimap is not None:
+            available -= self.minimap.width + MINIMAP_GAP
+        columns = max(1, min(board.width, available))
+        rows = max(1, min(board.height, size[1] - CHROME_ROWS))
+        return columns, rows
+    
+    def _follow(self, engine: 'GameEngine', columns: int, rows: int) -> Position:
+        """Move the camera so the head stays inside the viewport margins.
         
         Args:
             engine: The game engine containing state to render
-            high_score: The high score to display
+            columns: Viewport width in cells
+            rows: Viewport height in cells
+        
+        Returns:
+            Board coordinate of the viewport's top-left cell
         """
-        # Get game state
         board = engine.board
-        snake_body = set(engine.snake.get_body())
-        snake_head = engine.snake.get_head_position()
-        food_pos = engine.food.get_position()
+        head_x, head_y = engine.snake.get_head_position()
+        left, top = self.camera
+        if engine.snake is not self._camera_snake:
+            # New game: start with the head centered
+            self._camera_snake = engine.snake
+            left = head_x - columns // 2
+            top = head_y - rows // 2
         
-        # Draw top border (blue)
-        print(f"{Colors.BLUE}╔" + "═" * board.width + f"╗{Colors.RESET}")
-        
-        # Draw board with dimmed colors
-        for y in range(board.height):
-            print(f"{Colors.BLUE}║{Colors.RESET}", end="")
-            for x in range(board.width):
-                pos = (x, y)
-                if pos == snake_head:
-                    print(f"{Colors.GREEN}@{Colors.RESET}", end="")
-                elif pos in snake_body:
-                    print(f"{Colors.GREEN}○{Colors.RESET}", end="")
-                elif pos == food_pos:
-                    print(f"{Colors.RED}•{Colors.RESET}", end="")
-                else:
-                    print(" ", end="")
-            print(f"{Colors.BLUE}║{Colors.RESET}")
+        self.camera = (
+            _scroll(left, head_x, columns, board.width),
+            _scroll(top, head_y, rows, board.height),
+        )
+        return self.camera
+    
+    def _write_frame(self, lines: List[str]) -> None:
+        """Clear the screen and write a whole frame at once.
         
-        # Draw bottom border (blue)
-        print(f"{Colors.BLUE}╚" + "═" * board.width + f"╝{Colors.RESET}")
+        Also times the write and schedules when the next running frame may
+        be drawn.
+        
+        Args:
+            lines: Frame content, one string per line
+        """
+        start = self._clock()
+        self.backend.present(lines)
+        end = self._clock()
+        if self.latency is not None:
+            self.latency.frame_flushed()
         
-        # Display PAUSED message
-        print(f"\n{Colors.YELLOW}{Colors.BOLD}        *** PAUSED ***{Colors.RESET}")
-        print(f"\nControls: {Colors.YELLOW}P: Resume{Colors.RESET} | Q: Quit")
+        self.frames_rendered += 1
+        self.last_write_time = duration = end - start
+        if self.frames_rendered == 1:
+            self.write_time = duration
+        else:
+            self.write_time += WRITE_TIME_SMOOTHING * (duration - self.write_time)
+        # Under backpressure, give the terminal as long to drain as a write takes
+        self._resume_at = end + self.write_time if self.backpressured else end
     
     def display_game_over(self, score: int) -> None:
         """Display game over screen.
@@ -124,11 +281,40 @@ class Renderer:
         Args:
             score: Final score to display
         """
-        self.clear_screen()
-        print("\n" + "=" * 40)
-        print(" " * 15 + "GAME OVER")
-        print("=" * 40)
-        print(f"\n{'Final Score:':>20} {score}")
-        print("\n" + "=" * 40)
-        print("\nPress R to restart or Q to quit")
-        sys.stdout.flush()
+        self._write_frame([
+            "\n" + "=" * 40,
+            " " * 15 + "GAME OVER",
+            "=" * 40,
+            f"\n{'Final Score:':>20} {score}",
+            "\n" + "=" * 40,
+            "\nPress R to restart or Q to quit",
+        ])
+
+
+def _scroll(start: int, head: int, span: int, size: int) -> int:
+    """Scroll one viewport axis to keep the head away from its edges.
+    
+    Offsets are taken modulo the board size, so the viewport moves smoothly
+    when the head wraps around the board.
+    
+    Args:
+        start: Current first visible coordinate
+        head: Head coordinate
+        span: Visible cells along the axis
+        size: Board cells along the axis
+    
+    Returns:
+        New first visible coordinate
+    """
+    if span >= size:
+        return 0
+    margin = int(span * CAMERA_MARGIN)
+    offset = (head - start) % size
+    if offset >= span:
+        # Head is off screen (e.g. the viewport shrank): recenter
+        return (head - span // 2) % size
+    if offset < margin:
+        return (head - margin) % size
+    if offset > span - 1 - margin:
+        return (head - (span - 1 - margin)) % size
+    return start % size
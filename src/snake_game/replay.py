@@ -0,0 +1,493 @@
+"""Replay archive holding many recorded games in one memory-mapped file.
+
+Layout (all integers little-endian)::
+
+    file header   magic, version, game count, index offset
+    game blobs    one per game, back to back
+    index         (offset, size) of every game blob
+    
+    game blob     game header
+                  walls mask (map games only)
+                  keyframe ticks (u32 each), keyframe offsets (u64 each)
+                  delta ticks (u32 each), delta directions (u8 each)
+                  keyframes
+
+A keyframe is the full state after a tick: snake cells, direction, pending
+growth, food, score, the food spawn counter and the engine's state hash. A delta records the tick
+from which the snake moves in a new direction. A recording starts at the
+engine's tick when the recorder was attached, which is the first keyframe;
+earlier ticks cannot be restored. Restoring tick N of a game
+reads the index entry, binary-searches the keyframe and delta tick arrays
+and replays at most one keyframe interval of ticks, so only the pages
+holding that game's tables and one keyframe are touched. Food is
+reproducible because recorded games use ``GameEngine(food_seed=...)``.
+"""
+
+import mmap
+import struct
+from array import array
+from typing import List, Optional, Tuple
+from .game_engine import GameEngine
+from .level_map import LevelMap
+from .types import Collision, Direction, GameState
+
+MAGIC = b'SNKRPLY1'
+VERSION = 4
+
+# Ticks between keyframes (default)
+KEYFRAME_INTERVAL = 256
+
+# Enum orders used to encode members as small integers
+DIRECTIONS = tuple(Direction)
+STATES = tuple(GameState)
+COLLISIONS = (None,) + tuple(Collision)
+
+# magic, version, game count, index offset
+_FILE_HEADER = struct.Struct('<8sIIQ')
+
+# game blob offset, size
+_INDEX_ENTRY = struct.Struct('<QQ')
+
+# width, height, food seed, food count, start x, start y, has walls, ticks
+# recorded, score, keyframe count, delta count
+_GAME_HEADER = struct.Struct('<IIqIiiBIIII')
+
+# tick, score, spawn count, direction, grow pending, state, collision, food
+# cell (-1 for none), extra food count, cell count, state hash
+_KEYFRAME = struct.Struct('<IIIBBBBiIIQ')
+
+_U32 = struct.Struct('<I')
+_U64 = struct.Struct('<Q')
+
+
+class GameRecorder:
+    """Records one game as keyframes plus direction changes.
+    
+    Call ``capture`` after every ``GameEngine.tick``; the game so far is
+    written with ``ReplayWriter.add``.
+    """
+    
+    def __init__(self, engine: GameEngine,
+                 keyframe_interval: int = KEYFRAME_INTERVAL):
+        """Start recording from the engine's current state.
+        
+        Args:
+            engine: Engine to record; must place food reproducibly
+            keyframe_interval: Ticks between keyframes (default: 256)
+        
+        Raises:
+            ValueError: If the engine has no ``food_seed``
+        """
+        if engine.food_seed is None:
+            raise ValueError("Recording needs an engine with a food_seed")
+        self.engine = engine
+        self.keyframe_interval = keyframe_interval
+        self.keyframe_ticks = array('I')
+        self.keyframes: List[bytes] = []
+        self.delta_ticks = array('I')
+        self.delta_directions = bytearray()
+        self._direction = engine.snake.direction
+        self._keyframe()
+    
+    def capture(self) -> None:
+        """Record the tick the engine just completed."""
+        engine = self.engine
+        tick = engine.tick_count
+        direction = engine.snake.direction
+        if direction is not self._direction:
+            self._direction = direction
+            self.delta_ticks.append(tick)
+            self.delta_directions.append(DIRECTIONS.index(direction))
+        last = self.keyframe_ticks[-1]
+        if tick != last and (tick - last >= self.keyframe_interval
+                             or engine.state == GameState.GAME_OVER):
+            self._keyframe()
+    
+    def to_bytes(self) -> bytes:
+        """Encode the game as an archive blob.
+        
+        Returns:
+            The game blob
+        """
+        engine = self.engine
+        board = engine.board
+        level_map = board.level_map
+        start = level_map.start if level_map and level_map.start else (-1, -1)
+        walls = bytes(board.walls) if level_map is not None else b''
+        header = _GAME_HEADER.pack(
+            board.width, board.height, engine.food_seed, engine.food_count,
+            start[0], start[1], bool(walls),
+            engine.tick_count - self.keyframe_ticks[0], engine.score,
+            len(self.keyframes), len(self.delta_ticks),
+        )
+        
+        keyframe_count = len(self.keyframes)
+        tables = (len(header) + len(walls) + 12 * keyframe_count
+                  + 5 * len(self.delta_ticks))
+        offsets = array('Q')
+        position = tables
+        for keyframe in self.keyframes:
+            offsets.append(position)
+            position += len(keyframe)
+        return b''.join([
+            header, walls, _little(self.keyframe_ticks), _little(offsets),
+            _little(self.delta_ticks), bytes(self.delta_directions),
+        ] + self.keyframes)
+    
+    def _keyframe(self) -> None:
+        """Snapshot the engine's full state after the current tick."""
+        engine = self.engine
+        snake = engine.snake
+        food = engine.food.get_cell()
+        extras = array('i', sorted(engine.foods))
+        cells = array('i', snake.cells)
+        self.keyframe_ticks.append(engine.tick_count)
+        self.keyframes.append(b''.join((
+            _KEYFRAME.pack(
+                engine.tick_count, engine.score, engine.spawn_count,
+                DIRECTIONS.index(snake.direction), snake.grow_pending,
+                STATES.index(engine.state), COLLISIONS.index(engine.collision),
+                -1 if food is None else food, len(extras), len(cells),
+                engine.state_hash(),
+            ),
+            _little(extras), _little(cells),
+        )))
+
+
+class ReplayWriter:
+    """Writes recorded games into a new archive file."""
+    
+    def __init__(self, path: str):
+        """Create the archive.
+        
+        Args:
+            path: Output file path (overwritten)
+        """
+        self._file = open(path, 'wb')
+        self._file.write(_FILE_HEADER.pack(MAGIC, VERSION, 0, 0))
+        self._index: List[Tuple[int, int]] = []
+    
+    def add(self, recorder: GameRecorder) -> int:
+        """Append a recorded game.
+        
+        Args:
+            recorder: Recorder holding the game
+        
+        Returns:
+            Index of the game in the archive
+        """
+        blob = recorder.to_bytes()
+        self._index.append((self._file.tell(), len(blob)))
+        self._file.write(blob)
+        return len(self._index) - 1
+    
+    def close(self) -> None:
+        """Write the index and header, and close the file."""
+        if self._file.closed:
+            return
+        index_offset = self._file.tell()
+        for offset, size in self._index:
+            self._file.write(_INDEX_ENTRY.pack(offset, size))
+        self._file.seek(0)
+        self._file.write(_FILE_HEADER.pack(MAGIC, VERSION, len(self._index),
+                                           index_offset))
+        self._file.close()
+    
+    def __enter__(self) -> 'ReplayWriter':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ReplayInfo:
+    """Summary of one archived game, read from its header.
+    
+    Attributes:
+        width: Board width
+        height: Board height
+        start: Engine tick the recording starts at
+        ticks: Ticks the recording covers
+        score: Score at the end of the recording
+    """
+    
+    def __init__(self, width: int, height: int, start: int, ticks: int,
+                 score: int):
+        """Initialize the summary."""
+        self.width = width
+        self.height = height
+        self.start = start
+        self.ticks = ticks
+        self.score = score
+
+
+class ReplayArchive:
+    """Random access to the games of an archive through ``mmap``."""
+    
+    def __init__(self, path: str):
+        """Open an archive.
+        
+        Args:
+            path: Archive file path
+        
+        Raises:
+            ValueError: If the file is not a replay archive of this version
+        """
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mmap) < _FILE_HEADER.size:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a replay archive")
+        magic, version, self._count, self._index_offset = \
+            _FILE_HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a version {VERSION} replay archive")
+    
+    def __len__(self) -> int:
+        """Number of games in the archive."""
+        return self._count
+    
+    def info(self, game: int) -> ReplayInfo:
+        """Read a game's summary.
+        
+        Args:
+            game: Index of the game
+        
+        Returns:
+            The game's size, first tick, length and final score
+        """
+        layout = self._layout(game)
+        return ReplayInfo(layout.width, layout.height, layout.start,
+                          layout.ticks, layout.score)
+    
+    def restore(self, game: int, tick: int) -> GameEngine:
+        """Build an engine in the state right after a tick of a game.
+        
+        Args:
+            game: Index of the game
+            tick: Engine tick to restore, from ``info(game).start`` (the
+                state when recording began) to ``start + ticks``
+        
+        Returns:
+            A new engine at that tick, which can keep playing
+        
+        Raises:
+            IndexError: If the game or tick is out of range
+        """
+        layout = self._layout(game)
+        end = layout.start + layout.ticks
+        if not layout.start <= tick <= end:
+            raise IndexError(f"Tick {tick} outside {layout.start}..{end}")
+        keyframe = _bisect_u32(self._mmap, layout.keyframe_ticks,
+                               layout.keyframe_count, tick) - 1
+        engine = self._keyframe_engine(layout, keyframe)
+        self._advance(engine, layout, tick)
+        return engine
+    
+    def verify(self, game: int) -> Optional[int]:
+        """Replay a game from its start and check it against its keyframes.
+        
+        Every keyframe stores the recording engine's ``state_hash()``, so a
+        rule change, a changed food generator or a damaged file that makes
+        the replay drift is caught at the first keyframe after it.
+        
+        Args:
+            game: Index of the game
+        
+        Returns:
+            Tick of the first keyframe the replay disagrees with, or None
+            if it matches throughout
+        """
+        mm = self._mmap
+        layout = self._layout(game)
+        engine = self._keyframe_engine(layout, 0)
+        for keyframe in range(1, layout.keyframe_count):
+            tick = _U32.unpack_from(mm, layout.keyframe_ticks + 4 * keyframe)[0]
+            self._advance(engine, layout, tick)
+            offset = _U64.unpack_from(
+                mm, layout.keyframe_offsets + 8 * keyframe)[0]
+            expected = _KEYFRAME.unpack_from(mm, layout.base + offset)[-1]
+            if engine.state_hash() != expected:
+                return tick
+        return None
+    
+    def close(self) -> None:
+        """Unmap the archive."""
+        self._mmap.close()
+    
+    def __enter__(self) -> 'ReplayArchive':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def _game_offset(self, game: int) -> int:
+        """Look up a game blob's offset in the index.
+        
+        Args:
+            game: Index of the game
+        
+        Returns:
+            File offset of the game blob
+        
+        Raises:
+            IndexError: If there is no such game
+        """
+        if not 0 <= game < self._count:
+            raise IndexError(f"Game {game} outside 0..{self._count - 1}")
+        return _INDEX_ENTRY.unpack_from(
+            self._mmap, self._index_offset + game * _INDEX_ENTRY.size)[0]
+    
+    def _layout(self, game: int) -> '_GameLayout':
+        """Read a game's header and locate its tables.
+        
+        Args:
+            game: Index of the game
+        
+        Returns:
+            The game's layout
+        """
+        mm = self._mmap
+        layout = _GameLayout()
+        layout.base = base = self._game_offset(game)
+        (width, height, layout.seed, layout.food_count, start_x, start_y,
+         has_walls, layout.ticks, layout.score, layout.keyframe_count,
+         layout.delta_count) = _GAME_HEADER.unpack_from(mm, base)
+        layout.width = width
+        layout.height = height
+        
+        position = base + _GAME_HEADER.size
+        layout.level_map = None
+        if has_walls:
+            walls = mm[position:position + width * height]
+            start = (start_x, start_y) if start_x >= 0 else None
+            layout.level_map = LevelMap(width, height, walls, start)
+            position += width * height
+        layout.keyframe_ticks = position
+        layout.keyframe_offsets = position + 4 * layout.keyframe_count
+        layout.delta_ticks = layout.keyframe_offsets + 8 * layout.keyframe_count
+        layout.delta_directions = layout.delta_ticks + 4 * layout.delta_count
+        layout.start = _U32.unpack_from(mm, layout.keyframe_ticks)[0]
+        return layout
+    
+    def _keyframe_engine(self, layout: '_GameLayout',
+                         keyframe: int) -> GameEngine:
+        """Build an engine in a keyframe's state.
+        
+        Args:
+            layout: The game's layout
+            keyframe: Index of the keyframe
+        
+        Returns:
+            A new engine
+        """
+        offset = _U64.unpack_from(
+            self._mmap, layout.keyframe_offsets + 8 * keyframe)[0]
+        engine = GameEngine(layout.width, layout.height,
+                            level_map=layout.level_map,
+                            food_count=layout.food_count, food_seed=layout.seed)
+        _apply_keyframe(engine, self._mmap, layout.base + offset)
+        return engine
+    
+    def _advance(self, engine: GameEngine, layout: '_GameLayout',
+                 tick: int) -> None:
+        """Replay recorded ticks up to a tick, applying direction changes.
+        
+        Args:
+            engine: Engine at an earlier tick of the game
+            layout: The game's layout
+            tick: Tick to stop after
+        """
+        mm = self._mmap
+        delta_ticks = layout.delta_ticks
+        delta_count = layout.delta_count
+        delta = _bisect_u32(mm, delta_ticks, delta_count, engine.tick_count)
+        while engine.tick_count < tick:
+            if (delta < delta_count and _U32.unpack_from(
+                    mm, delta_ticks + 4 * delta)[0] == engine.tick_count + 1):
+                engine.snake.direction = DIRECTIONS[
+                    mm[layout.delta_directions + delta]]
+                delta += 1
+            engine.tick()
+
+
+class _GameLayout:
+    """Header fields and table offsets of one archived game."""
+    
+    __slots__ = ('base', 'width', 'height', 'seed', 'food_count', 'start',
+                 'ticks', 'score', 'keyframe_count', 'delta_count', 'level_map',
+                 'keyframe_ticks', 'keyframe_offsets', 'delta_ticks',
+                 'delta_directions')
+
+
+def _apply_keyframe(engine: GameEngine, buffer, offset: int) -> None:
+    """Overwrite an engine's state with a keyframe.
+    
+    Args:
+        engine: Engine created with the game's board and food settings
+        buffer: Archive contents
+        offset: File offset of the keyframe
+    """
+    (tick, score, spawn_count, direction, grow_pending, state, collision,
+     food, extra_count, cell_count, _) = _KEYFRAME.unpack_from(buffer, offset)
+    offset += _KEYFRAME.size
+    extras = struct.unpack_from(f'<{extra_count}i', buffer, offset)
+    offset += 4 * extra_count
+    cells = struct.unpack_from(f'<{cell_count}i', buffer, offset)
+    
+    board = engine.board
+    snake = engine.snake
+    snake.body = [board.to_position(cell) for cell in cells]
+    snake.direction = DIRECTIONS[direction]
+    if grow_pending:
+        snake.grow()
+    engine.foods.clear()
+    for cell in extras:
+        engine.foods.add(cell)
+    if food >= 0:
+        engine.food.place(board, board.to_position(food))
+    engine.score = score
+    engine.tick_count = tick
+    engine.spawn_count = spawn_count
+    engine.state = STATES[state]
+    engine.collision = COLLISIONS[collision]
+    engine.rehash()
+
+
+def _bisect_u32(buffer, offset: int, count: int, value: int) -> int:
+    """Binary-search a sorted little-endian u32 array for ``value``.
+    
+    Args:
+        buffer: Buffer holding the array
+        offset: Offset of the first element
+        count: Number of elements
+        value: Value to look for
+    
+    Returns:
+        Number of elements less than or equal to ``value``
+    """
+    low, high = 0, count
+    while low < high:
+        middle = (low + high) // 2
+        if _U32.unpack_from(buffer, offset + 4 * middle)[0] <= value:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+def _little(values: array) -> bytes:
+    """Encode an array in little-endian byte order.
+    
+    Args:
+        values: Array to encode
+    
+    Returns:
+        The array's bytes, byte-swapped on big-endian hosts
+    """
+    if array('H', [1]).tobytes()[0] == 1:
+        return values.tobytes()
+    swapped = array(values.typecode, values)
+    swapped.byteswap()
+    return swapped.tobytes()
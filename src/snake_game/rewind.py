@@ -0,0 +1,268 @@
+"""Bounded history of per-tick deltas for rewinding a running game."""
+
+from array import array
+from typing import TYPE_CHECKING, List, Tuple
+from .events import EventType
+from .food import Food
+from .replay import COLLISIONS, DIRECTIONS
+from .types import Cell, GameState
+
+if TYPE_CHECKING:
+    from .game_engine import GameEngine
+
+# Ticks kept by default (about a minute at the fastest tick rate)
+DEFAULT_CAPACITY = 1024
+
+# Delta flag bits
+_GREW = 1           # grow was pending before the tick (tail kept)
+_ATE = 2            # grow is pending after the tick (food eaten)
+_ENDED = 4          # the tick ended the game
+_DIRECTION_BEFORE = 3  # shift of the 2-bit direction index before the tick
+_DIRECTION_AFTER = 5   # shift of the 2-bit direction index after the tick
+
+_NO_CELLS: Tuple[Cell, ...] = ()
+
+
+class RewindBuffer:
+    """Ring buffer of compact per-tick deltas that rewinds a game.
+    
+    Drive the game with ``tick`` instead of ``GameEngine.tick``. Each tick
+    stores what changed: the head cell added, the tail cell removed (or
+    kept while growing), the main food's old and new cell, the extra food
+    item eaten or added, the score change, growth and direction, and how
+    the game ended. Rewinding or fast-forwarding a tick applies one delta
+    to the snake, food and counters in O(1) (plus the food items it added),
+    never copying the board. Deltas live in parallel fixed-size arrays, so
+    memory is bounded by ``capacity`` whatever the game length; the oldest
+    tick is dropped when the buffer is full. Recording a tick after a
+    rewind discards the ticks that could have been fast-forwarded. The
+    engine's state hash is recomputed once per rewind or fast-forward call.
+    """
+    
+    def __init__(self, engine: 'GameEngine', capacity: int = DEFAULT_CAPACITY):
+        """Start recording a game.
+        
+        Args:
+            engine: The game to record
+            capacity: Most ticks kept (default: 1024)
+        
+        Raises:
+            ValueError: If capacity is not positive
+        """
+        if capacity < 1:
+            raise ValueError("Rewind capacity must be positive")
+        self.engine = engine
+        self.capacity = capacity
+        self._head = array('i', [0]) * capacity
+        self._tail = array('i', [0]) * capacity
+        self._food_before = array('i', [0]) * capacity
+        self._food_after = array('i', [0]) * capacity
+        self._removed = array('i', [0]) * capacity
+        self._score = array('i', [0]) * capacity
+        self._flags = bytearray(capacity)
+        self._collision = bytearray(capacity)
+        self._added: List[Tuple[Cell, ...]] = [_NO_CELLS] * capacity
+        
+        # Ring slot of the oldest tick, ticks stored, and ticks applied
+        self._start = 0
+        self._count = 0
+        self._position = 0
+        self._direction = engine.snake.direction
+        
+        # A restarted game has no history
+        engine.subscribe(lambda event: self.clear(), EventType.RESTARTED)
+    
+    @property
+    def behind(self) -> int:
+        """Ticks that can be rewound."""
+        return self._position
+    
+    @property
+    def ahead(self) -> int:
+        """Ticks that can be fast-forwarded."""
+        return self._count - self._position
+    
+    @property
+    def nbytes(self) -> int:
+        """Approximate bytes held by the delta arrays."""
+        return self.capacity * (6 * 4 + 2 + 8)
+    
+    def clear(self) -> None:
+        """Forget every recorded tick."""
+        self._start = 0
+        self._count = 0
+        self._position = 0
+        self._direction = self.engine.snake.direction
+    
+    def tick(self) -> None:
+        """Advance the game one tick and record what changed."""
+        engine = self.engine
+        snake = engine.snake
+        foods = engine.foods
+        cells = snake.cells
+        tail = cells[-1]
+        grew = snake.grow_pending
+        next_head = engine.board.neighbors[snake.direction][cells[0]]
+        ate_extra = next_head in foods
+        food_before = engine.food.get_cell()
+        extras_before = len(foods)
+        score_before = engine.score
+        tick_before = engine.tick_count
+        
+        engine.tick()
+        if engine.tick_count == tick_before:
+            return
+        
+        food_after = engine.food.get_cell()
+        if ate_extra:
+            removed = next_head
+        elif next_head == food_before and len(foods) < extras_before:
+            # The board was full, so an extra item became the main food
+            removed = food_after
+        else:
+            removed = -1
+        added = len(foods) - extras_before + (removed >= 0)
+        
+        # Drop ticks that were rewound, then the oldest tick if full
+        if self._count == self.capacity and self._position == self._count:
+            self._start = (self._start + 1) % self.capacity
+        else:
+            self._count = self._position + 1
+        self._position = self._count
+        slot = (self._start + self._count - 1) % self.capacity
+        
+        self._head[slot] = cells[0]
+        self._tail[slot] = -1 if grew else tail
+        self._food_before[slot] = -1 if food_before is None else food_before
+        self._food_after[slot] = -1 if food_after is None else food_after
+        self._removed[slot] = removed
+        self._added[slot] = tuple(foods.newest(added)) if added else _NO_CELLS
+        self._score[slot] = engine.score - score_before
+        self._flags[slot] = (
+            (_GREW if grew else 0)
+            | (_ATE if snake.grow_pending else 0)
+            | (_ENDED if engine.state == GameState.GAME_OVER else 0)
+            | DIRECTIONS.index(self._direction) << _DIRECTION_BEFORE
+            | DIRECTIONS.index(snake.direction) << _DIRECTION_AFTER
+        )
+        self._collision[slot] = COLLISIONS.index(engine.collision)
+        self._direction = snake.direction
+    
+    def rewind(self, ticks: int = 1) -> int:
+        """Take back recorded ticks, newest first.
+        
+        A game that ended is running again afterwards; a paused game stays
+        paused.
+        
+        Args:
+            ticks: Ticks to take back (default: 1)
+        
+        Returns:
+            Ticks actually taken back
+        """
+        ticks = min(ticks, self._position)
+        for _ in range(ticks):
+            self._position -= 1
+            self._undo((self._start + self._position) % self.capacity)
+        if ticks:
+            self.engine.rehash()
+        return ticks
+    
+    def fast_forward(self, ticks: int = 1) -> int:
+        """Reapply rewound ticks, oldest first.
+        
+        Args:
+            ticks: Ticks to reapply (default: 1)
+        
+        Returns:
+            Ticks actually reapplied
+        """
+        ticks = min(ticks, self._count - self._position)
+        for _ in range(ticks):
+            self._redo((self._start + self._position) % self.capacity)
+            self._position += 1
+        if ticks:
+            self.engine.rehash()
+        return ticks
+    
+    def _undo(self, slot: int) -> None:
+        """Restore the state before a recorded tick.
+        
+        Args:
+            slot: Ring slot of the tick
+        """
+        engine = self.engine
+        snake = engine.snake
+        occupancy = snake.occupancy
+        flags = self._flags[slot]
+        
+        occupancy[snake.cells.popleft()] -= 1
+        tail = self._tail[slot]
+        if tail >= 0:
+            snake.cells.append(tail)
+            occupancy[tail] += 1
+        snake.grow_pending = bool(flags & _GREW)
+        self._direction = DIRECTIONS[flags >> _DIRECTION_BEFORE & 3]
+        snake.direction = self._direction
+        
+        foods = engine.foods
+        for cell in self._added[slot]:
+            foods.remove(cell)
+        if self._removed[slot] >= 0:
+            foods.add(self._removed[slot])
+        self._place_food(self._food_before[slot])
+        
+        engine.score -= self._score[slot]
+        if flags & _ATE:
+            engine.spawn_count -= 1
+        engine.tick_count -= 1
+        if engine.state == GameState.GAME_OVER:
+            engine.state = GameState.RUNNING
+            engine.collision = None
+    
+    def _redo(self, slot: int) -> None:
+        """Reapply a recorded tick.
+        
+        Args:
+            slot: Ring slot of the tick
+        """
+        engine = self.engine
+        snake = engine.snake
+        occupancy = snake.occupancy
+        flags = self._flags[slot]
+        
+        head = self._head[slot]
+        snake.cells.appendleft(head)
+        occupancy[head] += 1
+        if self._tail[slot] >= 0:
+            occupancy[snake.cells.pop()] -= 1
+        snake.grow_pending = bool(flags & _ATE)
+        self._direction = DIRECTIONS[flags >> _DIRECTION_AFTER & 3]
+        snake.direction = self._direction
+        
+        foods = engine.foods
+        if self._removed[slot] >= 0:
+            foods.remove(self._removed[slot])
+        for cell in self._added[slot]:
+            foods.add(cell)
+        self._place_food(self._food_after[slot])
+        
+        engine.score += self._score[slot]
+        if flags & _ATE:
+            engine.spawn_count += 1
+        engine.tick_count += 1
+        if flags & _ENDED:
+            engine.state = GameState.GAME_OVER
+            engine.collision = COLLISIONS[self._collision[slot]]
+    
+    def _place_food(self, cell: Cell) -> None:
+        """Put the main food on a cell, or remove it for -1.
+        
+        Args:
+            cell: Packed cell, or -1
+        """
+        engine = self.engine
+        if cell < 0:
+            engine.food = Food()
+        elif engine.food.get_cell() != cell:
+            engine.food.place(engine.board, engine.board.to_position(cell))
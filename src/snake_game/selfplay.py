@@ -0,0 +1,502 @@
+"""Self-play training samples generated by worker processes in shared memory."""
+
+import multiprocessing
+import random
+import time
+from multiprocessing import shared_memory
+from typing import Iterator, List, Optional, Tuple
+from .autopilot import Autopilot
+from .game_engine import FOOD_SCORE, GameEngine
+from .replay import DIRECTIONS
+from .types import GameState
+
+try:
+    import numpy
+except ImportError:
+    # Batches are served as memoryviews instead
+    numpy = None
+
+# Samples each worker's ring holds by default
+DEFAULT_CAPACITY = 4096
+
+# Samples per batch handed to the consumer by default
+DEFAULT_BATCH = 256
+
+# Observation cell values
+EMPTY = 0
+WALL = 1
+BODY = 2
+HEAD = 3
+FOOD = 4
+
+# Header words (unsigned 64-bit); each counter has a single writer, and the
+# producer's and consumer's words sit on separate cache lines
+_HEADER_SIZE = 128
+_WRITTEN = 0    # samples published by the producer
+_CLOSED = 1     # set by the producer after its last sample
+_STALLS = 2     # times the producer found the ring full
+_READ = 8       # samples released by the consumer
+_STOPPED = 9    # set by the consumer to make the producer give up
+
+# Sleeps between polls of an empty or full ring, longest last
+_BACKOFF = (0.0002, 0.001, 0.005)
+
+_ACTIONS = {direction: i for i, direction in enumerate(DIRECTIONS)}
+
+
+class SampleBatch:
+    """Contiguous samples read from a ring, viewed in place.
+    
+    With NumPy installed the fields are arrays (``observations`` of shape
+    (count, cells), uint8; ``actions`` uint8; ``rewards`` float32;
+    ``dones`` uint8), otherwise memoryviews of the same shape (index
+    observations as ``[sample, cell]`` or use ``tolist()``). Either way
+    they alias the shared memory and are only valid until the samples are
+    released back to the ring.
+    """
+    
+    __slots__ = ('observations', 'actions', 'rewards', 'dones')
+    
+    def __init__(self, observations, actions, rewards, dones):
+        self.observations = observations
+        self.actions = actions
+        self.rewards = rewards
+        self.dones = dones
+    
+    def __len__(self) -> int:
+        return len(self.actions)
+    
+    def release(self) -> None:
+        """Invalidate memoryview fields so they cannot see reused slots.
+        
+        NumPy fields cannot be invalidated; drop them instead.
+        """
+        if numpy is None:
+            for view in (self.observations, self.actions, self.rewards,
+                         self.dones):
+                view.release()
+
+
+class SampleRing:
+    """Single-producer, single-consumer ring of samples in shared memory.
+    
+    A sample is a board observation (one byte per cell, see ``EMPTY`` ..
+    ``FOOD``), the action taken (index into ``replay.DIRECTIONS``), the
+    reward and whether the game ended. Fields are stored as separate
+    arrays so a run of samples is readable as one array per field without
+    copying. The producer publishes a sample by advancing the written
+    counter; the consumer frees slots by advancing the read counter. The
+    producer blocks while the ring is full, so a slow consumer throttles
+    its workers instead of letting samples pile up.
+    
+    Pickling a ring (e.g. passing it to a ``multiprocessing.Process``)
+    attaches the other process to the same memory.
+    
+    Attributes:
+        capacity: Number of sample slots
+        obs_size: Bytes per observation
+        name: Name of the shared memory block
+        observations: Writable view of all observation slots
+        actions: Writable view of the action per slot
+        rewards: Writable view of the reward per slot
+        dones: Writable view of the game-ended flag per slot
+    """
+    
+    def __init__(self, capacity: int, obs_size: int,
+                 name: Optional[str] = None):
+        """Create a ring, or attach to an existing one.
+        
+        Args:
+            capacity: Number of sample slots
+            obs_size: Bytes per observation
+            name: Shared memory block to attach to; a new block is created
+                if None
+        
+        Raises:
+            ValueError: If capacity or obs_size is not positive
+        """
+        if capacity < 1 or obs_size < 1:
+            raise ValueError("Ring capacity and observation size must be positive")
+        self.capacity = capacity
+        self.obs_size = obs_size
+        size = _HEADER_SIZE + capacity * (4 + 1 + 1 + obs_size)
+        self._shm = shared_memory.SharedMemory(
+            name=name, create=name is None, size=size
+        )
+        self.name = self._shm.name
+        
+        buf = self._shm.buf
+        self._header = buf[:_HEADER_SIZE].cast('Q')
+        if name is None:
+            for i in range(len(self._header)):
+                self._header[i] = 0
+        offset = _HEADER_SIZE
+        self.rewards = buf[offset:offset + 4 * capacity].cast('f')
+        offset += 4 * capacity
+        self.actions = buf[offset:offset + capacity]
+        offset += capacity
+        self.dones = buf[offset:offset + capacity]
+        offset += capacity
+        self.observations = buf[offset:offset + capacity * obs_size]
+    
+    def __reduce__(self):
+        return SampleRing, (self.capacity, self.obs_size, self.name)
+    
+    def __len__(self) -> int:
+        """Number of published samples not yet released."""
+        return self._header[_WRITTEN] - self._header[_READ]
+    
+    @property
+    def written(self) -> int:
+        """Samples published since the ring was created."""
+        return self._header[_WRITTEN]
+    
+    @property
+    def stalls(self) -> int:
+        """Times the producer had to wait for the consumer."""
+        return self._header[_STALLS]
+    
+    @property
+    def closed(self) -> bool:
+        """Whether the producer published its last sample."""
+        return bool(self._header[_CLOSED])
+    
+    @property
+    def finished(self) -> bool:
+        """Whether the producer is done and every sample was released."""
+        # Closed is set after the last sample, so read it first
+        return self.closed and not len(self)
+    
+    # Producer side
+    
+    def reserve(self) -> int:
+        """Wait for a free slot.
+        
+        Returns:
+            Index of the slot for the next sample, or -1 if the consumer
+            stopped the ring
+        """
+        header = self._header
+        written = header[_WRITTEN]
+        if written - header[_READ] >= self.capacity:
+            header[_STALLS] += 1
+            attempt = 0
+            while written - header[_READ] >= self.capacity:
+                if header[_STOPPED]:
+                    return -1
+                time.sleep(_BACKOFF[min(attempt, len(_BACKOFF) - 1)])
+                attempt += 1
+        if header[_STOPPED]:
+            return -1
+        return written % self.capacity
+    
+    def observation(self, slot: int) -> memoryview:
+        """Get the writable observation of a slot.
+        
+        Args:
+            slot: Slot index from ``reserve``
+        
+        Returns:
+            View of ``obs_size`` bytes
+        """
+        start = slot * self.obs_size
+        return self.observations[start:start + self.obs_size]
+    
+    def commit(self) -> None:
+        """Publish the reserved slot's sample to the consumer."""
+        self._header[_WRITTEN] += 1
+    
+    def finish(self) -> None:
+        """Mark the last sample as published."""
+        self._header[_CLOSED] = 1
+    
+    # Consumer side
+    
+    def read(self, max_count: int,
+             min_count: int = 1) -> Optional[SampleBatch]:
+        """View the oldest published samples without copying them.
+        
+        Only samples up to the end of the ring are returned; the rest come
+        from the next call.
+        
+        Args:
+            max_count: Most samples to return
+            min_count: Fewest samples worth returning; fewer are returned
+                only when they reach the end of the ring (default: 1)
+        
+        Returns:
+            Batch of samples, or None if too few are published. Call
+            ``release`` with its length once done with it.
+        """
+        header = self._header
+        read = header[_READ]
+        start = read % self.capacity
+        end = self.capacity - start
+        count = min(header[_WRITTEN] - read, end, max_count)
+        if count <= 0 or count < min(min_count, end):
+            return None
+        end = start + count
+        observations = self.observations[start * self.obs_size:
+                                         end * self.obs_size]
+        actions = self.actions[start:end]
+        rewards = self.rewards[start:end]
+        dones = self.dones[start:end]
+        if numpy is None:
+            return SampleBatch(observations.cast('B', (count, self.obs_size)),
+                               actions, rewards, dones)
+        return SampleBatch(
+            numpy.frombuffer(observations, numpy.uint8).reshape(
+                count, self.obs_size),
+            numpy.frombuffer(actions, numpy.uint8),
+            numpy.frombuffer(rewards, numpy.float32),
+            numpy.frombuffer(dones, numpy.uint8),
+        )
+    
+    def release(self, count: int) -> None:
+        """Free the oldest samples for the producer to overwrite.
+        
+        Args:
+            count: Number of samples, at most ``len(self)``
+        """
+        self._header[_READ] += count
+    
+    def stop(self) -> None:
+        """Make the producer give up at its next reserve."""
+        self._header[_STOPPED] = 1
+    
+    def close(self) -> None:
+        """Detach from the shared memory.
+        
+        Raises:
+            BufferError: If a batch read from the ring is still referenced
+        """
+        for view in (self._header, self.rewards, self.actions, self.dones,
+                     self.observations):
+            view.release()
+        self._shm.close()
+    
+    def unlink(self) -> None:
+        """Free the shared memory block once every process has closed it."""
+        self._shm.unlink()
+
+
+def encode_observation(engine: GameEngine, out) -> None:
+    """Write the board as one byte per cell (``EMPTY`` .. ``FOOD``).
+    
+    Args:
+        engine: Game to observe
+        out: Writable buffer of ``engine.board.size`` bytes
+    """
+    # Wall cells are 1 in the mask, which is WALL
+    out[:] = engine.board.walls
+    cells = engine.snake.cells
+    for cell in cells:
+        out[cell] = BODY
+    if cells:
+        out[cells[0]] = HEAD
+    food = engine.food.get_cell()
+    if food is not None:
+        out[food] = FOOD
+    for cell in engine.foods:
+        out[cell] = FOOD
+
+
+def play_step(engine: GameEngine, autopilot: Autopilot, rng: random.Random,
+              epsilon: float, out) -> Tuple[int, float, bool]:
+    """Observe the game, pick an action and play one tick.
+    
+    The autopilot chooses the move, replaced by a random one with
+    probability ``epsilon``. A finished game is restarted after its last
+    sample.
+    
+    Args:
+        engine: Game to play
+        autopilot: Autopilot steering ``engine``
+        rng: Generator for exploration
+        epsilon: Probability of a random move
+        out: Writable buffer for the observation before the move
+    
+    Returns:
+        Tuple of (action, reward, done): the index of the direction the
+        snake moved in, food eaten (in items) minus one for a crash, and
+        whether the game ended
+    """
+    encode_observation(engine, out)
+    direction = autopilot.choose_direction()
+    if epsilon and rng.random() < epsilon:
+        direction = rng.choice(DIRECTIONS)
+    engine.handle_input(direction)
+    action = _ACTIONS[engine.snake.direction]
+    
+    score = engine.score
+    engine.tick()
+    reward = (engine.score - score) / FOOD_SCORE
+    done = engine.state == GameState.GAME_OVER
+    if done:
+        if engine.collision is not None:
+            reward -= 1.0
+        engine.restart()
+    return action, reward, done
+
+
+def produce(ring: SampleRing, samples: int, board_size: int = 10,
+            seed: int = 0, epsilon: float = 0.1) -> None:
+    """Play games and publish their samples to a ring (worker entry point).
+    
+    Args:
+        ring: Ring to fill; its observation size must match the board
+        samples: Number of samples to produce
+        board_size: Width and height of the board (default: 10)
+        seed: Seed for food placement and exploration (default: 0)
+        epsilon: Probability of a random move (default: 0.1)
+    """
+    random.seed(seed)
+    rng = random.Random(seed)
+    engine = GameEngine(board_width=board_size, board_height=board_size)
+    autopilot = Autopilot(engine)
+    actions = ring.actions
+    rewards = ring.rewards
+    dones = ring.dones
+    try:
+        for _ in range(samples):
+            slot = ring.reserve()
+            if slot < 0:
+                break
+            action, reward, done = play_step(engine, autopilot, rng, epsilon,
+                                             ring.observation(slot))
+            actions[slot] = action
+            rewards[slot] = reward
+            dones[slot] = done
+            ring.commit()
+    finally:
+        ring.finish()
+        ring.close()
+
+
+class SelfPlayPipeline:
+    """Worker processes filling shared-memory rings with self-play samples.
+    
+    Each worker plays its own games and writes samples straight into its
+    own ``SampleRing``; ``batches`` hands the consumer views of those rings,
+    so no sample is pickled or copied on its way to the consumer. Rings
+    give flow control: a worker blocks while its ring is full.
+    
+    Attributes:
+        rings: One ring per worker
+        waits: Times ``batches`` found every ring empty
+    """
+    
+    def __init__(self, workers: int = 2, samples: int = 10000,
+                 board_size: int = 10, capacity: int = DEFAULT_CAPACITY,
+                 seed: int = 0, epsilon: float = 0.1):
+        """Create the rings and workers (started by ``start``).
+        
+        Args:
+            workers: Number of worker processes (default: 2)
+            samples: Samples per worker (default: 10000)
+            board_size: Width and height of the boards (default: 10)
+            capacity: Samples per ring (default: 4096)
+            seed: Seed of the first worker; worker i uses seed + i
+                (default: 0)
+            epsilon: Probability of a random move (default: 0.1)
+        
+        Raises:
+            ValueError: If there are no workers
+        """
+        if workers < 1:
+            raise ValueError("A pipeline needs at least one worker")
+        self.rings: List[SampleRing] = []
+        self._processes: List[multiprocessing.Process] = []
+        self.waits = 0
+        for i in range(workers):
+            ring = SampleRing(capacity, board_size * board_size)
+            self.rings.append(ring)
+            self._processes.append(multiprocessing.Process(
+                target=produce, args=(ring, samples, board_size, seed + i,
+                                      epsilon),
+                daemon=True,
+            ))
+    
+    def __enter__(self) -> 'SelfPlayPipeline':
+        self.start()
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def start(self) -> None:
+        """Start the workers."""
+        for process in self._processes:
+            process.start()
+    
+    def batches(self, max_count: int = DEFAULT_BATCH) -> Iterator[SampleBatch]:
+        """Yield samples from the rings until every worker is done.
+        
+        Rings are visited in turn, and a ring's samples are taken once
+        ``max_count`` have piled up (or its worker is done), so polling and
+        batch overhead is paid per batch rather than per sample. A batch's
+        samples are released when the
+        next batch is requested, so a batch must not be kept past that
+        (memoryview batches are invalidated then).
+        
+        Args:
+            max_count: Samples per batch, except at the end of a ring or of
+                a worker's run (default: 256)
+        
+        Yields:
+            Batches of samples from one worker each
+        
+        Raises:
+            RuntimeError: If a worker died before finishing
+        """
+        pending = list(self.rings)
+        attempt = 0
+        while pending:
+            progressed = False
+            for ring in list(pending):
+                # The flag is set after the last sample, so read it first
+                closed = ring.closed
+                batch = ring.read(max_count, 1 if closed else max_count)
+                if batch is None:
+                    if closed:
+                        pending.remove(ring)
+                    continue
+                progressed = True
+                count = len(batch)
+                try:
+                    yield batch
+                finally:
+                    batch.release()
+                ring.release(count)
+            if progressed:
+                attempt = 0
+                continue
+            for process in self._processes:
+                if process.exitcode:
+                    raise RuntimeError(
+                        f"Self-play worker exited with code {process.exitcode}"
+                    )
+            self.waits += 1
+            time.sleep(_BACKOFF[min(attempt, len(_BACKOFF) - 1)])
+            attempt += 1
+    
+    @property
+    def stalls(self) -> int:
+        """Times workers found their ring full."""
+        return sum(ring.stalls for ring in self.rings)
+    
+    def close(self) -> None:
+        """Stop and join the workers and free the rings."""
+        for ring in self.rings:
+            ring.stop()
+        for process in self._processes:
+            if process.pid is not None:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+        rings, self.rings = self.rings, []
+        for ring in rings:
+            ring.unlink()
+        for ring in rings:
+            ring.close()
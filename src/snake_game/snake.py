@@ -1,40 +1,89 @@
 """Snake class for managing snake state and behavior."""
 
-from typing import List
-from .types import Direction, Position
+from collections import deque
+from collections.abc import MutableSequence
+from typing import Deque, Iterable, List, Optional
+from .game_board import GameBoard
+from .types import Cell, Direction, Position
 
 
 class Snake:
-    """Manages snake state including body segments, direction, and movement."""
+    """Manages snake state including body segments, direction, and movement.
     
-    def __init__(self, start_position: Position, initial_length: int = 3, 
-                 initial_direction: Direction = Direction.RIGHT):
+    The body is stored as a deque of packed cells (head first) together with
+    a per-cell occupancy count, so moving and self-collision checks never
+    build tuples or scan the body.
+    """
+    
+    def __init__(self, start_position: Position, initial_length: int = 3,
+                 initial_direction: Direction = Direction.RIGHT,
+                 board: Optional[GameBoard] = None,
+                 occupancy: Optional[bytearray] = None):
         """Initialize the snake.
         
         Args:
             start_position: Starting position (head) of the snake
             initial_length: Initial length of the snake (default: 3)
             initial_direction: Initial movement direction (default: RIGHT)
+            board: Board the snake moves on (default: a standard 20x20 board)
+            occupancy: Occupancy grid shared with other snakes on the same
+                board (default: a grid of the snake's own). On a shared grid
+                ``collides_with_self`` reports a collision with any snake.
         """
         self.direction = initial_direction
+        self.board = board if board is not None else GameBoard()
+        
+        # Packed body cells, head first
+        self.cells: Deque[Cell] = deque()
+        
+        # Number of body segments on each cell (>1 only on collision). Board
+        # walls are pre-counted, so moving into one is a collision too.
+        self.occupancy = (
+            occupancy if occupancy is not None else bytearray(self.board.walls)
+        )
         
         # Create body segments starting from head position
         # Body grows backwards from head in opposite direction
         dx, dy = initial_direction.value
-        self.body: List[Position] = [
+        self.body = [
             (start_position[0] - i * dx, start_position[1] - i * dy)
             for i in range(initial_length)
         ]
         
         self._grow_pending = False
     
+    @property
+    def body(self) -> 'SnakeBody':
+        """Body segment positions as a live, mutable view (head first)."""
+        return SnakeBody(self)
+    
+    @body.setter
+    def body(self, positions: Iterable[Position]) -> None:
+        """Replace the body with new segment positions (head first)."""
+        positions = list(positions)
+        for cell in self.cells:
+            self.occupancy[cell] -= 1
+        self.cells.clear()
+        for x, y in positions:
+            cell = self.board.to_cell(x, y)
+            self.cells.append(cell)
+            self.occupancy[cell] += 1
+    
     def get_head_position(self) -> Position:
         """Get the position of the snake's head.
         
         Returns:
             Position of the head (first segment)
         """
-        return self.body[0]
+        return self.board.to_position(self.cells[0])
+    
+    def get_head_cell(self) -> Cell:
+        """Get the packed cell of the snake's head.
+        
+        Returns:
+            Packed cell index of the head (first segment)
+        """
+        return self.cells[0]
     
     def get_body(self) -> List[Position]:
         """Get all body segment positions.
@@ -42,11 +91,15 @@ class Snake:
         Returns:
             List of positions representing the snake body
         """
-        return self.body.copy()
+        to_position = self.board.to_position
+        return [to_position(cell) for cell in self.cells]
     
     def move(self, new_direction: Direction) -> None:
         """Move the snake one step in the given direction.
         
+        The head wraps around the board edges via the board's precomputed
+        neighbor table.
+        
         Args:
             new_direction: Direction to move (validated against reversal)
         """
@@ -54,17 +107,14 @@ class Snake:
         if new_direction != self.direction.opposite():
             self.direction = new_direction
         
-        # Calculate new head position
-        dx, dy = self.direction.value
-        head_x, head_y = self.get_head_position()
-        new_head = (head_x + dx, head_y + dy)
-        
         # Add new head
-        self.body.insert(0, new_head)
+        new_head = self.board.neighbors[self.direction][self.cells[0]]
+        self.cells.appendleft(new_head)
+        self.occupancy[new_head] += 1
         
         # Remove tail unless growth is pending
         if not self._grow_pending:
-            self.body.pop()
+            self.occupancy[self.cells.pop()] -= 1
         else:
             self._grow_pending = False
     
@@ -72,11 +122,71 @@ class Snake:
         """Mark snake to grow by one segment on next move."""
         self._grow_pending = True
     
+    @property
+    def grow_pending(self) -> bool:
+        """Whether the next move grows the snake."""
+        return self._grow_pending
+    
+    @grow_pending.setter
+    def grow_pending(self, pending: bool) -> None:
+        """Set or cancel growth on the next move."""
+        self._grow_pending = pending
+    
     def collides_with_self(self) -> bool:
         """Check if the head collides with any body segment.
         
+        Walls (and, on a shared grid, other snakes) are counted in the
+        occupancy grid too, so running into them is reported as well.
+        
         Returns:
             True if head position overlaps with body, False otherwise
         """
-        head = self.get_head_position()
-        return head in self.body[1:]  # Check against body (excluding head)
+        # The head itself accounts for one occupant of its cell
+        return self.occupancy[self.cells[0]] > 1
+
+
+class SnakeBody(MutableSequence):
+    """Mutable list-like view of a snake's body as position tuples.
+    
+    Reads unpack cells on demand; writes rebuild the packed body. Intended
+    for setup and inspection, not for the per-tick hot path.
+    """
+    
+    def __init__(self, snake: Snake):
+        """Initialize the view.
+        
+        Args:
+            snake: The snake whose body is exposed
+        """
+        self._snake = snake
+    
+    def __len__(self) -> int:
+        return len(self._snake.cells)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._snake.get_body()[index]
+        return self._snake.board.to_position(self._snake.cells[index])
+    
+    def __setitem__(self, index, value) -> None:
+        positions = self._snake.get_body()
+        positions[index] = value
+        self._snake.body = positions
+    
+    def __delitem__(self, index) -> None:
+        positions = self._snake.get_body()
+        del positions[index]
+        self._snake.body = positions
+    
+    def insert(self, index: int, value: Position) -> None:
+        positions = self._snake.get_body()
+        positions.insert(index, value)
+        self._snake.body = positions
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, SnakeBody)):
+            return self._snake.get_body() == list(other)
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return repr(self._snake.get_body())
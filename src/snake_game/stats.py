@@ -0,0 +1,292 @@
+"""Constant-memory statistics over many game outcomes."""
+
+import json
+import math
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+from .events import EventType
+
+if TYPE_CHECKING:
+    from .game_engine import GameEngine
+
+# Values below this are counted exactly; above it every power-of-two range
+# is split into this many equal buckets (relative error under 1/32)
+SUB_BUCKETS = 16
+_SUB_BITS = SUB_BUCKETS.bit_length() - 1
+
+# Outcome metrics recorded per game
+METRICS = ('score', 'length', 'ticks')
+
+# Cause recorded for a game that ended without a collision
+BOARD_FULL = 'board_full'
+
+
+def bucket_of(value: int) -> int:
+    """Get the histogram bucket of a non-negative integer.
+    
+    Args:
+        value: Value to bucket
+    
+    Returns:
+        Bucket index; buckets are ordered like their values
+    """
+    if value < SUB_BUCKETS:
+        return value
+    shift = value.bit_length() - 1 - _SUB_BITS
+    return (shift + 1) * SUB_BUCKETS + (value >> shift) - SUB_BUCKETS
+
+
+def bucket_bounds(bucket: int) -> Tuple[int, int]:
+    """Get the value range of a histogram bucket.
+    
+    Args:
+        bucket: Bucket index from ``bucket_of``
+    
+    Returns:
+        Tuple of (lowest, highest) integer value in the bucket
+    """
+    if bucket < SUB_BUCKETS:
+        return bucket, bucket
+    shift = bucket // SUB_BUCKETS - 1
+    low = (bucket % SUB_BUCKETS + SUB_BUCKETS) << shift
+    return low, low + (1 << shift) - 1
+
+
+class StreamingStats:
+    """Count, mean/variance, min/max and quantiles of an integer stream.
+    
+    Mean and variance use Welford's update, and two summaries are merged
+    with Chan et al.'s pairwise formula, so results do not depend on how
+    samples were split between workers. Quantiles come from a log-linear
+    histogram whose size grows only with the logarithm of the largest value.
+    """
+    
+    def __init__(self):
+        """Initialize empty statistics."""
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+        self.buckets: Dict[int, int] = {}
+    
+    def add(self, value: int) -> None:
+        """Add one sample.
+        
+        Args:
+            value: Non-negative integer sample
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        bucket = bucket_of(value)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+    
+    def merge(self, other: 'StreamingStats') -> None:
+        """Fold another summary into this one.
+        
+        Args:
+            other: Statistics of a disjoint set of samples
+        """
+        if not other.count:
+            return
+        if not self.count:
+            self.min = other.min
+            self.max = other.max
+        else:
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self._m2 += other._m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        for bucket, bucket_count in other.buckets.items():
+            self.buckets[bucket] = self.buckets.get(bucket, 0) + bucket_count
+    
+    @property
+    def variance(self) -> Optional[float]:
+        """Sample variance, or None with fewer than two samples."""
+        if self.count < 2:
+            return None
+        return self._m2 / (self.count - 1)
+    
+    @property
+    def stdev(self) -> Optional[float]:
+        """Sample standard deviation, or None with fewer than two samples."""
+        variance = self.variance
+        return math.sqrt(variance) if variance is not None else None
+    
+    def quantile(self, fraction: float) -> Optional[float]:
+        """Estimate a quantile from the histogram.
+        
+        Args:
+            fraction: Quantile as a fraction (e.g. 0.99)
+        
+        Returns:
+            Midpoint of the bucket holding the quantile, clamped to the
+            observed range (exact below ``SUB_BUCKETS`` and for the
+            maximum), or None if empty
+        """
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(fraction * self.count))
+        if rank >= self.count:
+            return float(self.max)
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                break
+        low, high = bucket_bounds(bucket)
+        return min(max((low + high) / 2, self.min), self.max)
+    
+    def to_dict(self) -> dict:
+        """Serialize the statistics to JSON-compatible types.
+        
+        Returns:
+            Dictionary that ``from_dict`` restores exactly, plus derived
+            summary fields for reports
+        """
+        return {
+            'count': self.count,
+            'mean': self.mean if self.count else None,
+            'm2': self._m2,
+            'stdev': self.stdev,
+            'min': self.min,
+            'max': self.max,
+            'p50': self.quantile(0.5),
+            'p90': self.quantile(0.9),
+            'p99': self.quantile(0.99),
+            'buckets': {str(bucket): count
+                        for bucket, count in sorted(self.buckets.items())},
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'StreamingStats':
+        """Restore statistics serialized by ``to_dict``.
+        
+        Args:
+            data: Dictionary from ``to_dict`` (possibly via JSON)
+        
+        Returns:
+            The restored statistics
+        """
+        stats = cls()
+        stats.count = data['count']
+        stats.mean = data['mean'] or 0.0
+        stats._m2 = data['m2']
+        stats.min = data['min']
+        stats.max = data['max']
+        stats.buckets = {int(bucket): count
+                         for bucket, count in data['buckets'].items()}
+        return stats
+
+
+class OutcomeStats:
+    """Aggregates the outcomes of many games in constant memory.
+    
+    Each finished game adds its score, final snake length and ticks
+    survived to a ``StreamingStats`` per metric, and counts how it ended
+    (the ``Collision`` value, or ``BOARD_FULL``). Collectors from separate
+    worker processes are combined with ``merge``, typically after a JSON
+    round trip through ``to_dict``/``from_dict``.
+    """
+    
+    def __init__(self):
+        """Initialize an empty collector."""
+        self.games = 0
+        self.metrics: Dict[str, StreamingStats] = {
+            name: StreamingStats() for name in METRICS
+        }
+        self.causes: Dict[str, int] = {}
+    
+    def record(self, score: int, length: int, ticks: int, cause: str) -> None:
+        """Add one game outcome.
+        
+        Args:
+            score: Final score
+            length: Final snake length
+            ticks: Ticks the game lasted
+            cause: How the game ended
+        """
+        self.games += 1
+        metrics = self.metrics
+        metrics['score'].add(score)
+        metrics['length'].add(length)
+        metrics['ticks'].add(ticks)
+        self.causes[cause] = self.causes.get(cause, 0) + 1
+    
+    def record_engine(self, engine: 'GameEngine') -> None:
+        """Add the outcome of a finished game.
+        
+        Args:
+            engine: Engine whose game just ended
+        """
+        collision = engine.collision
+        self.record(engine.score, len(engine.snake.cells), engine.tick_count,
+                    collision.value if collision is not None else BOARD_FULL)
+    
+    def attach(self, engine: 'GameEngine') -> None:
+        """Record every game the engine finishes from now on.
+        
+        Args:
+            engine: Engine to subscribe to
+        """
+        engine.subscribe(lambda event: self.record_engine(engine),
+                         EventType.GAME_OVER)
+    
+    def merge(self, other: 'OutcomeStats') -> None:
+        """Fold another collector into this one.
+        
+        Args:
+            other: Outcomes of a disjoint set of games
+        """
+        self.games += other.games
+        for name, stats in other.metrics.items():
+            self.metrics[name].merge(stats)
+        for cause, count in other.causes.items():
+            self.causes[cause] = self.causes.get(cause, 0) + count
+    
+    def to_dict(self) -> dict:
+        """Serialize the collector to JSON-compatible types.
+        
+        Returns:
+            Dictionary that ``from_dict`` restores exactly
+        """
+        return {
+            'games': self.games,
+            'causes': dict(sorted(self.causes.items())),
+            'metrics': {name: stats.to_dict()
+                        for name, stats in self.metrics.items()},
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'OutcomeStats':
+        """Restore a collector serialized by ``to_dict``.
+        
+        Args:
+            data: Dictionary from ``to_dict`` (possibly via JSON)
+        
+        Returns:
+            The restored collector
+        """
+        outcome = cls()
+        outcome.games = data['games']
+        outcome.causes = dict(data['causes'])
+        for name, stats in data['metrics'].items():
+            outcome.metrics[name] = StreamingStats.from_dict(stats)
+        return outcome
+    
+    def write_json(self, path: str) -> None:
+        """Write the collector to a JSON file.
+        
+        Args:
+            path: Output file path
+        """
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
@@ -0,0 +1,147 @@
+"""Bounded transposition table for search bots."""
+
+from array import array
+
+# Slots in a table by default (rounded up to a power of two)
+DEFAULT_SIZE = 1 << 16
+
+# Move stored for entries without a best move
+NO_MOVE = 255
+
+_MASK = (1 << 64) - 1
+
+
+class TranspositionTable:
+    """Fixed-size cache of search results keyed by position hash.
+    
+    Entries live in parallel arrays (key, mean value, sample count, best
+    move, search generation) indexed by the low bits of the key, so memory
+    is fixed at creation however many positions a search visits. Storing a
+    result for a key already present folds it into the entry's mean. A
+    different key replaces the slot's entry only if that entry is empty,
+    from an earlier search (see ``new_search``), or has no more samples
+    than the new result, so well-sampled entries of the current search
+    survive collisions.
+    
+    Attributes:
+        size: Number of slots
+        probes: Lookups made
+        hits: Lookups that found their key
+        stores: Results stored or merged
+        replacements: Stores that evicted another key's entry
+        rejections: Stores dropped to keep a better entry
+    """
+    
+    def __init__(self, size: int = DEFAULT_SIZE):
+        """Allocate an empty table.
+        
+        Args:
+            size: Minimum number of slots (default: 65536)
+        
+        Raises:
+            ValueError: If size is not positive
+        """
+        if size < 1:
+            raise ValueError("Transposition table size must be positive")
+        size = 1 << (size - 1).bit_length()
+        self.size = size
+        self._mask = size - 1
+        self.keys = array('Q', [0]) * size
+        self.values = array('d', [0.0]) * size
+        self.samples = array('I', [0]) * size
+        self.moves = bytearray([NO_MOVE]) * size
+        self._generations = bytearray(size)
+        self._generation = 0
+        self._used = 0
+        
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+        self.replacements = 0
+        self.rejections = 0
+    
+    def __len__(self) -> int:
+        """Number of slots holding an entry."""
+        return self._used
+    
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that hit, or 0.0 before any lookup."""
+        return self.hits / self.probes if self.probes else 0.0
+    
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the entry arrays."""
+        return self.size * (8 + 8 + 4 + 1 + 1)
+    
+    def new_search(self) -> None:
+        """Start a new search; older entries become replaceable."""
+        self._generation = (self._generation + 1) & 0xFF
+    
+    def probe(self, key: int) -> int:
+        """Look up a position.
+        
+        Args:
+            key: Position hash; only its low 64 bits are used, as in
+                ``store``
+        
+        Returns:
+            Slot of the entry (read ``values``, ``samples`` and ``moves``
+            at it), or -1 if the position is not stored
+        """
+        self.probes += 1
+        key &= _MASK
+        slot = key & self._mask
+        if self.samples[slot] and self.keys[slot] == key:
+            self.hits += 1
+            self._generations[slot] = self._generation
+            return slot
+        return -1
+    
+    def store(self, key: int, value: float, samples: int = 1,
+              move: int = NO_MOVE) -> bool:
+        """Record a search result for a position.
+        
+        Args:
+            key: 64-bit position hash
+            value: Mean value of the samples
+            samples: Number of samples the value averages (default: 1)
+            move: Index of the best move, or ``NO_MOVE`` to keep the stored
+                one
+        
+        Returns:
+            False if the result was dropped in favor of the stored entry
+        """
+        key &= _MASK
+        slot = key & self._mask
+        stored = self.samples[slot]
+        if stored and self.keys[slot] == key:
+            total = stored + samples
+            self.values[slot] += (value - self.values[slot]) * samples / total
+            self.samples[slot] = min(total, 0xFFFFFFFF)
+        else:
+            if stored:
+                if (self._generations[slot] == self._generation
+                        and stored > samples):
+                    self.rejections += 1
+                    return False
+                self.replacements += 1
+            else:
+                self._used += 1
+            self.keys[slot] = key
+            self.values[slot] = value
+            self.samples[slot] = samples
+            self.moves[slot] = NO_MOVE
+        if move != NO_MOVE:
+            self.moves[slot] = move
+        self._generations[slot] = self._generation
+        self.stores += 1
+        return True
+    
+    def clear(self) -> None:
+        """Remove every entry and reset the counters."""
+        self.samples = array('I', [0]) * self.size
+        self.moves = bytearray([NO_MOVE]) * self.size
+        self._used = 0
+        self.probes = self.hits = self.stores = 0
+        self.replacements = self.rejections = 0
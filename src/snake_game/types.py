@@ -6,6 +6,9 @@ from typing import Tuple
 # Type alias for position coordinates
 Position = Tuple[int, int]
 
+# Type alias for packed cell indices (cell = y * width + x)
+Cell = int
+
 
 class Direction(Enum):
     """Enumeration for movement directions."""
@@ -13,16 +16,23 @@ class Direction(Enum):
     DOWN = (0, 1)
     LEFT = (-1, 0)
     RIGHT = (1, 0)
-
+    
+    # Members are singletons, so identity hashing is correct; it runs in C,
+    # while Enum's hash of the name builds a new int on every dict lookup
+    __hash__ = object.__hash__
+    
     def opposite(self) -> 'Direction':
         """Return the opposite direction."""
-        opposites = {
-            Direction.UP: Direction.DOWN,
-            Direction.DOWN: Direction.UP,
-            Direction.LEFT: Direction.RIGHT,
-            Direction.RIGHT: Direction.LEFT
-        }
-        return opposites[self]
+        return _OPPOSITES[self]
+
+
+# Built once at import time so opposite() never allocates
+_OPPOSITES = {
+    Direction.UP: Direction.DOWN,
+    Direction.DOWN: Direction.UP,
+    Direction.LEFT: Direction.RIGHT,
+    Direction.RIGHT: Direction.LEFT
+}
 
 
 class GameState(Enum):
@@ -32,6 +42,14 @@ class GameState(Enum):
     GAME_OVER = "game_over"
 
 
+class Collision(Enum):
+    """Enumeration for the ways a snake can crash."""
+    SELF = "self"
+    BODY = "body"
+    HEAD_TO_HEAD = "head_to_head"
+    WALL = "wall"
+
+
 class Difficulty(Enum):
     """Enumeration for difficulty levels."""
     EASY = 1
@@ -0,0 +1,128 @@
+"""Zobrist keys for hashing game positions."""
+
+import random
+import sys
+from array import array
+from functools import lru_cache
+from typing import Dict, Iterable, List
+from .types import Cell, Direction
+
+# Seed of the key tables; engines in different processes or on different
+# machines must use the same keys for their hashes to be comparable
+ZOBRIST_SEED = 0x5A0B1257
+
+
+class ZobristKeys:
+    """Random 64-bit keys for the parts of a position on one board size.
+    
+    A position's hash is the XOR of the keys of its parts: a ``body`` key
+    per snake cell, a ``head`` key for the head cell, a ``tail`` key for
+    the tail cell, a ``food`` key per food cell, the ``direction`` key and,
+    while growth is pending, the ``grow`` key. Moving the snake or changing
+    the food flips only the keys of the cells involved, so hashes are
+    maintained in O(1) per change.
+    
+    The body is hashed as a set of cells with both ends marked, not as a
+    sequence: two snakes covering the same cells with the same head and
+    tail but a different path between them (e.g. nine segments folded into
+    a 3x3 block) hash equally. Such positions differ only in the order the interior
+    cells free up, so search caches treat them as one.
+    
+    Attributes:
+        body: Key per cell holding a snake segment
+        head: Key per cell holding the head
+        tail: Key per cell holding the tail
+        food: Key per cell holding food
+        direction: Key per Direction
+        grow: Key for pending growth
+        enter: ``body`` XOR ``head`` per cell, for the new head of a move
+    """
+    
+    def __init__(self, size: int, seed: int = ZOBRIST_SEED):
+        """Generate the key tables.
+        
+        Args:
+            size: Number of cells on the board
+            seed: Generator seed (default: ``ZOBRIST_SEED``)
+        """
+        rng = random.Random((seed << 32) | size)
+        self.body = _random_keys(rng, size)
+        self.head = _random_keys(rng, size)
+        self.food = _random_keys(rng, size)
+        self.tail = _random_keys(rng, size)
+        self.direction: Dict[Direction, int] = dict(
+            zip(Direction, _random_keys(rng, len(Direction)))
+        )
+        self.grow = rng.getrandbits(64)
+        
+        # Body and head keys combined, flipped by the cell a head moves into
+        self.enter = [body ^ head for body, head in zip(self.body, self.head)]
+    
+    def body_hash(self, cells: Iterable[Cell]) -> int:
+        """Hash a snake body from scratch (head first).
+        
+        Args:
+            cells: Packed body cells, head first
+        
+        Returns:
+            XOR of the body keys, the head key and the tail key
+        """
+        value = 0
+        head = None
+        cell = None
+        body = self.body
+        for cell in cells:
+            if head is None:
+                head = cell
+            value ^= body[cell]
+        if head is None:
+            return value
+        return value ^ self.head[head] ^ self.tail[cell]
+    
+    def food_hash(self, cells: Iterable[Cell]) -> int:
+        """Hash a set of food cells from scratch.
+        
+        Args:
+            cells: Packed food cells
+        
+        Returns:
+            XOR of their food keys
+        """
+        value = 0
+        food = self.food
+        for cell in cells:
+            value ^= food[cell]
+        return value
+
+
+@lru_cache(maxsize=16)
+def zobrist_keys(size: int) -> ZobristKeys:
+    """Get the shared key tables for a board size.
+    
+    Tables are cached per size and shared between engines, so they must be
+    treated as read-only.
+    
+    Args:
+        size: Number of cells on the board
+    
+    Returns:
+        The keys for that size
+    """
+    return ZobristKeys(size)
+
+
+def _random_keys(rng: random.Random, count: int) -> List[int]:
+    """Draw 64-bit keys, identically on every platform.
+    
+    Args:
+        rng: Seeded generator
+        count: Number of keys
+    
+    Returns:
+        List of keys (a list, so reading one allocates nothing)
+    """
+    keys = array('Q')
+    keys.frombytes(rng.randbytes(8 * count))
+    if sys.byteorder == 'big':
+        keys.byteswap()
+    return keys.tolist()
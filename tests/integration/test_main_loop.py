@@ -0,0 +1,25 @@
+"""Integration tests running the game's main loop as a process."""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(__file__), '..', '..')
+MAIN = os.path.join(ROOT, 'src', 'main.py')
+MAP = os.path.join(ROOT, 'maps', 'box.txt')
+
+
+class TestMainLoop:
+    """Integration test suite for src/main.py."""
+    
+    def test_exits_when_input_ends_at_game_over(self, tmp_path):
+        """Test that a game over with closed input quits instead of spinning."""
+        env = dict(os.environ, HOME=str(tmp_path), SNAKE_RENDERER='null',
+                   SNAKE_MAP=MAP)
+        
+        # Hard difficulty, then end of input: the snake runs into a wall
+        result = subprocess.run([sys.executable, MAIN], input=b'3\n',
+                                env=env, capture_output=True, timeout=30)
+        
+        assert result.returncode == 0
+        assert b"Thanks for playing!" in result.stdout
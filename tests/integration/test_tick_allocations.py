@@ -0,0 +1,139 @@
+"""Integration tests asserting the steady-state tick does not allocate."""
+
+import gc
+import itertools
+import sys
+import tracemalloc
+
+import pytest
+from src.snake_game.game_engine import GameEngine
+from src.snake_game.types import GameState
+
+TICKS = 100_000
+
+# Interpreter-internal caches (specialization, method caches) may settle a
+# handful of blocks during the run; anything per-tick would show as >= TICKS.
+BLOCK_TOLERANCE = 32
+BYTE_TOLERANCE = 2048
+
+# Largest transient allowed inside a single tick: a few small ints in flight,
+# nothing proportional to the body or the board.
+PEAK_BYTE_TOLERANCE = 512
+
+# Ticks sampled one at a time for their transient allocation
+SAMPLES = 10_000
+
+# Mean bytes a tick may allocate and free again, beyond what measuring an
+# empty call costs: the new tick_count int (32 bytes once past the cached
+# small ints) and the deque's occasional block swap. Any other object built
+# per tick (an int or tuple is 28+ bytes) goes over.
+TRANSIENT_BYTE_TOLERANCE = 40
+
+
+@pytest.fixture
+def steady_engine():
+    """Engine whose snake moves right forever without ever reaching food."""
+    engine = GameEngine(board_width=20, board_height=20)
+    head_row = engine.snake.get_head_position()[1]
+    while engine.food.get_position()[1] == head_row:
+        engine.food.spawn(engine.board, engine.snake)
+    
+    # Warm up so lazily created interpreter state is excluded
+    for _ in itertools.repeat(None, 1000):
+        engine.tick()
+    return engine
+
+
+def transient_bytes(call) -> float:
+    """Mean traced peak minus current around single calls.
+    
+    Returns:
+        Bytes allocated and freed again per call, on average
+    """
+    total = 0
+    tracemalloc.start()
+    try:
+        for _ in itertools.repeat(None, SAMPLES):
+            tracemalloc.reset_peak()
+            current, _ = tracemalloc.get_traced_memory()
+            call()
+            _, peak = tracemalloc.get_traced_memory()
+            total += peak - current
+    finally:
+        tracemalloc.stop()
+    return total / SAMPLES
+
+
+def run_ticks(engine: GameEngine) -> None:
+    """Tick the engine without allocating loop counters."""
+    tick = engine.tick
+    for _ in itertools.repeat(None, TICKS):
+        tick()
+
+
+class TestTickAllocations:
+    """Allocation checks for GameEngine.tick in steady state (no food eaten)."""
+    
+    def test_tick_has_no_net_block_growth(self, steady_engine):
+        """Test that 100k ticks leave the allocated block count unchanged."""
+        gc.collect()
+        gc.disable()
+        try:
+            before = sys.getallocatedblocks()
+            run_ticks(steady_engine)
+            after = sys.getallocatedblocks()
+        finally:
+            gc.enable()
+        
+        assert steady_engine.get_state() == GameState.RUNNING
+        assert after - before <= BLOCK_TOLERANCE
+    
+    def test_tick_traced_memory_stays_flat(self, steady_engine):
+        """Test that traced memory neither grows nor spikes over 100k ticks."""
+        tracemalloc.start()
+        try:
+            start, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            run_ticks(steady_engine)
+            end, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        
+        assert steady_engine.get_state() == GameState.RUNNING
+        assert end - start <= BYTE_TOLERANCE
+        assert peak - start <= PEAK_BYTE_TOLERANCE
+    
+    def test_tick_allocates_no_transient_objects(self, steady_engine):
+        """Test that a single tick builds no objects besides its counter."""
+        baseline = transient_bytes(lambda: None)
+        per_tick = transient_bytes(steady_engine.tick)
+        
+        assert steady_engine.get_state() == GameState.RUNNING
+        assert per_tick - baseline <= TRANSIENT_BYTE_TOLERANCE
+    
+    def test_tick_triggers_no_garbage_collection(self, steady_engine):
+        """Test that 100k ticks never trigger a garbage collection pass."""
+        collections = []
+        
+        def on_gc(phase, info):
+            if phase == "start":
+                collections.append(info["generation"])
+        
+        gc.collect()
+        gc.callbacks.append(on_gc)
+        try:
+            run_ticks(steady_engine)
+        finally:
+            gc.callbacks.remove(on_gc)
+        
+        assert collections == []
+    
+    def test_tick_wraps_during_run(self, steady_engine):
+        """Test that the measured run exercises wrap-around."""
+        start_x = steady_engine.snake.get_head_position()[0]
+        
+        for _ in range(steady_engine.board.width):
+            steady_engine.tick()
+        
+        assert steady_engine.snake.get_head_position()[0] == start_x
+        assert steady_engine.get_state() == GameState.RUNNING
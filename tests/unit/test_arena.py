@@ -0,0 +1,161 @@
+"""Unit tests for the ArenaEngine class."""
+
+import random
+
+import pytest
+from src.snake_game.arena import ArenaEngine
+from src.snake_game.level_map import parse_map
+from src.snake_game.types import Collision, Direction, GameState
+
+
+def make_arena(*bodies, directions=None, food_count=0, width=20, height=20):
+    """Build an arena whose snakes have the given bodies (head first)."""
+    arena = ArenaEngine(width, height, snake_count=len(bodies),
+                        food_count=food_count)
+    for snake, body, direction in zip(arena.snakes, bodies, directions):
+        snake.body = body
+        snake.direction = direction
+    return arena
+
+
+class TestArenaEngine:
+    """Test suite for ArenaEngine class."""
+    
+    def test_snakes_share_occupancy(self):
+        """Test that all snakes are registered in one grid."""
+        random.seed(1)
+        arena = ArenaEngine(30, 30, snake_count=10, initial_length=4)
+        
+        assert sum(arena.occupancy) == 10 * 4
+        assert all(snake.occupancy is arena.occupancy for snake in arena.snakes)
+        assert not any(arena.occupancy[cell] for cell in arena.foods)
+        assert len(arena.foods) == 10
+    
+    def test_head_to_head_kills_both(self):
+        """Test that snakes moving onto the same cell both die."""
+        arena = make_arena([(5, 5), (4, 5), (3, 5)], [(7, 5), (8, 5), (9, 5)],
+                           directions=[Direction.RIGHT, Direction.LEFT])
+        
+        deaths = arena.tick()
+        
+        assert sorted(deaths) == [(0, Collision.HEAD_TO_HEAD),
+                                  (1, Collision.HEAD_TO_HEAD)]
+        assert arena.alive_count() == 0
+        assert arena.get_state() == GameState.GAME_OVER
+        assert sum(arena.occupancy) == 0
+    
+    def test_head_to_body_kills_only_mover(self):
+        """Test that running into another body kills only the runner."""
+        arena = make_arena([(5, 4), (4, 4), (3, 4)],
+                           [(6, 5), (5, 5), (4, 5), (3, 5)],
+                           [(15, 15), (14, 15), (13, 15)],
+                           directions=[Direction.DOWN, Direction.RIGHT,
+                                       Direction.RIGHT])
+        
+        deaths = arena.tick()
+        
+        assert deaths == [(0, Collision.BODY)]
+        assert arena.alive == [False, True, True]
+        assert arena.deaths[0] == Collision.BODY
+        assert arena.get_state() == GameState.RUNNING
+        assert sum(arena.occupancy) == 4 + 3
+    
+    def test_self_collision(self):
+        """Test that a snake curling into itself is a self collision."""
+        arena = make_arena([(5, 5), (5, 6), (6, 6), (6, 5), (6, 4)],
+                           [(15, 15), (14, 15), (13, 15)],
+                           directions=[Direction.RIGHT, Direction.RIGHT])
+        
+        assert arena.tick() == [(0, Collision.SELF)]
+    
+    def test_following_a_tail_is_safe(self):
+        """Test moving into a cell another snake's tail leaves this tick."""
+        arena = make_arena([(4, 5), (3, 5), (2, 5)], [(7, 5), (6, 5), (5, 5)],
+                           directions=[Direction.RIGHT, Direction.RIGHT])
+        
+        assert arena.tick() == []
+        assert arena.alive_count() == 2
+    
+    def test_eating_scores_and_refills_food(self):
+        """Test that eaten food is replaced and the snake grows."""
+        random.seed(2)
+        arena = make_arena([(5, 5), (4, 5), (3, 5)], [(15, 15), (14, 15), (13, 15)],
+                           directions=[Direction.RIGHT, Direction.RIGHT],
+                           food_count=3)
+        arena.foods.clear()
+        arena.foods.add(arena.board.to_cell(6, 5))
+        arena._fill_food()
+        
+        arena.tick()
+        arena.tick()
+        
+        assert arena.get_score(0) == 10
+        assert len(arena.snakes[0].cells) == 4
+        assert len(arena.foods) == 3
+        assert arena.board.to_cell(6, 5) not in arena.foods
+    
+    def test_respawn(self):
+        """Test that a dead snake can be brought back."""
+        arena = make_arena([(5, 4), (4, 4), (3, 4)],
+                           [(6, 5), (5, 5), (4, 5), (3, 5)],
+                           [(15, 15), (14, 15), (13, 15)],
+                           directions=[Direction.DOWN, Direction.RIGHT,
+                                       Direction.RIGHT])
+        arena.tick()
+        
+        arena.respawn(0)
+        
+        assert arena.alive == [True, True, True]
+        assert sum(arena.occupancy) == 3 + 4 + 3
+    
+    def test_handle_input_ignores_reversal(self):
+        """Test that a snake cannot be turned back onto itself."""
+        arena = ArenaEngine(20, 20, snake_count=2)
+        snake = arena.snakes[0]
+        arena.handle_input(0, snake.direction.opposite())
+        
+        assert arena.snakes[0].direction == snake.direction
+    
+    def test_crowded_board_rejected(self):
+        """Test that too many snakes for the board raise."""
+        with pytest.raises(ValueError):
+            ArenaEngine(5, 5, snake_count=20, initial_length=3)
+    
+    def test_random_match_keeps_grid_consistent(self):
+        """Test the shared grid against the live bodies over a long match."""
+        random.seed(4)
+        arena = ArenaEngine(25, 25, snake_count=12)
+        for _ in range(300):
+            for i, snake in enumerate(arena.snakes):
+                if arena.alive[i]:
+                    arena.handle_input(i, random.choice(list(Direction)))
+            arena.tick()
+            for i in range(arena.snake_count):
+                if not arena.alive[i] and random.random() < 0.3:
+                    arena.respawn(i)
+            
+            expected = bytearray(arena.board.size)
+            for i, snake in enumerate(arena.snakes):
+                if arena.alive[i]:
+                    for cell in snake.cells:
+                        expected[cell] += 1
+            assert arena.occupancy == expected
+            assert max(expected) <= 1
+    
+    def test_wall_collision(self):
+        """Test that running into a map wall is a wall collision."""
+        random.seed(6)
+        level_map = parse_map("#" * 12 + "\n" + ("#" + "." * 10 + "#\n") * 10
+                              + "#" * 12 + "\n")
+        arena = ArenaEngine(snake_count=2, food_count=4, level_map=level_map)
+        arena.snakes[0].body = [(1, 3), (2, 3), (3, 3)]
+        arena.snakes[0].direction = Direction.LEFT
+        arena.snakes[1].body = [(8, 8), (7, 8), (6, 8)]
+        arena.snakes[1].direction = Direction.RIGHT
+        
+        assert arena.tick() == [(0, Collision.WALL)]
+        assert not any(arena.board.walls[cell] for cell in arena.foods)
+        assert arena.occupancy == bytearray(
+            wall + (cell in arena.snakes[1].cells)
+            for cell, wall in enumerate(arena.board.walls)
+        )
@@ -0,0 +1,107 @@
+"""Unit tests for the Autopilot class."""
+
+import random
+
+import pytest
+from src.snake_game.autopilot import Autopilot
+from src.snake_game.game_engine import GameEngine
+from src.snake_game.types import Direction, GameState
+
+
+class TestAutopilot:
+    """Test suite for Autopilot class."""
+    
+    def test_step_feeds_handle_input(self):
+        """Test that step turns the snake toward the food."""
+        engine = GameEngine(board_width=10, board_height=10)
+        engine.snake.body = [(5, 5), (4, 5), (3, 5)]
+        engine.food.place(engine.board, (5, 2))
+        autopilot = Autopilot(engine)
+        
+        direction = autopilot.step()
+        
+        assert direction == Direction.UP
+        assert engine.snake.direction == Direction.UP
+    
+    def test_path_uses_wrap_around(self):
+        """Test that the shortest path crosses the board edge when shorter."""
+        engine = GameEngine(board_width=10, board_height=10)
+        engine.snake.body = [(1, 5), (1, 6), (1, 7)]
+        engine.snake.direction = Direction.UP
+        engine.food.place(engine.board, (8, 5))
+        autopilot = Autopilot(engine)
+        
+        assert autopilot.choose_direction() == Direction.LEFT
+        assert autopilot.path_to_food() == [(0, 5), (9, 5), (8, 5)]
+    
+    def test_never_reverses(self):
+        """Test that the food directly behind the head is not approached by reversing."""
+        engine = GameEngine(board_width=10, board_height=10)
+        engine.snake.body = [(5, 5), (4, 5), (3, 5)]
+        engine.food.place(engine.board, (2, 5))
+        autopilot = Autopilot(engine)
+        
+        assert autopilot.choose_direction() != Direction.LEFT
+    
+    def test_unreachable_food_prefers_free_cell(self):
+        """Test the fallback when the food is walled off by the body."""
+        engine = GameEngine(board_width=5, board_height=5)
+        # Body encloses (0, 0) completely on the torus
+        engine.snake.body = [(2, 2), (1, 2), (1, 1), (0, 1), (4, 1),
+                             (4, 0), (1, 0), (1, 4), (0, 4)]
+        engine.snake.direction = Direction.RIGHT
+        engine.food.place(engine.board, (0, 0))
+        autopilot = Autopilot(engine)
+        
+        assert autopilot.path_to_food() == []
+        direction = autopilot.choose_direction()
+        head = engine.snake.get_head_cell()
+        assert not engine.snake.occupancy[engine.board.neighbors[direction][head]]
+    
+    def test_incremental_field_matches_rebuild(self):
+        """Test that the repaired field always equals a fresh BFS."""
+        random.seed(7)
+        engine = GameEngine(board_width=12, board_height=9)
+        autopilot = Autopilot(engine)
+        reference = Autopilot(engine, incremental=False)
+        
+        for _ in range(400):
+            if engine.get_state() != GameState.RUNNING:
+                break
+            if random.random() < 0.8:
+                autopilot.step()
+            else:
+                engine.handle_input(random.choice(list(Direction)))
+                autopilot.choose_direction()
+            reference.choose_direction()
+            
+            assert autopilot._dist == reference._dist
+            engine.tick()
+        
+        assert autopilot.repairs > autopilot.rebuilds
+    
+    def test_rebuilds_after_restart(self):
+        """Test that a restarted engine gets a fresh field."""
+        engine = GameEngine(board_width=10, board_height=10)
+        autopilot = Autopilot(engine)
+        autopilot.step()
+        rebuilds = autopilot.rebuilds
+        
+        engine.restart()
+        autopilot.step()
+        
+        assert autopilot.rebuilds == rebuilds + 1
+    
+    def test_autopilot_eats_food(self):
+        """Test that an autopilot-driven game scores."""
+        random.seed(3)
+        engine = GameEngine(board_width=15, board_height=15)
+        autopilot = Autopilot(engine)
+        
+        for _ in range(300):
+            if engine.get_state() != GameState.RUNNING:
+                break
+            autopilot.step()
+            engine.tick()
+        
+        assert engine.get_score() >= 50
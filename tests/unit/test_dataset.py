@@ -0,0 +1,143 @@
+"""Unit tests for the sharded dataset writer."""
+
+import mmap
+import os
+import random
+import struct
+
+import pytest
+from src.snake_game.dataset import (HEADER_SIZE, DatasetWriter, npy_header,
+                                    read_header, read_manifest,
+                                    record_self_play)
+from src.snake_game.game_engine import GameEngine
+from src.snake_game.selfplay import SampleRing
+
+
+def read_field(directory, shard, field):
+    """Map one field of a shard and return its header and bytes."""
+    path = os.path.join(directory, shard['files'][field])
+    descr, shape, offset = read_header(path)
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0,
+                                          access=mmap.ACCESS_READ) as data:
+        return descr, shape, data[offset:]
+
+
+class TestNpyHeader:
+    """Test suite for the .npy header helpers."""
+    
+    def test_header_round_trip(self):
+        """Test that headers have a fixed size and parse back."""
+        header = npy_header('<f4', (12, 100))
+        
+        assert len(header) == HEADER_SIZE
+        assert header.startswith(b'\x93NUMPY\x01\x00')
+        assert header.endswith(b'\n')
+    
+    def test_oversized_shape_is_rejected(self):
+        """Test that a header that would not fit raises."""
+        with pytest.raises(ValueError):
+            npy_header('|u1', (10 ** 40, 10 ** 40))
+
+
+class TestDatasetWriter:
+    """Test suite for DatasetWriter class."""
+    
+    def test_rows_are_sharded_and_listed(self, tmp_path):
+        """Test shard sizes, patched shapes and the manifest."""
+        directory = str(tmp_path)
+        with DatasetWriter(directory, obs_size=3, shard_rows=4) as writer:
+            for i in range(10):
+                writer.add(bytes([i] * 3), i % 4, i * 0.5, i == 9)
+            assert len(writer) == 10
+        
+        manifest = read_manifest(directory)
+        assert manifest['rows'] == 10
+        assert [shard['rows'] for shard in manifest['shards']] == [4, 4, 2]
+        assert manifest['fields']['observations'] == {'dtype': '|u1',
+                                                      'shape': [3]}
+        
+        last = manifest['shards'][2]
+        descr, shape, data = read_field(directory, last, 'observations')
+        assert (descr, shape, data) == ('|u1', (2, 3), bytes([8] * 3 + [9] * 3))
+        descr, shape, data = read_field(directory, last, 'rewards')
+        assert (descr, shape) == ('<f4', (2,))
+        assert struct.unpack('<2f', data) == (4.0, 4.5)
+        assert read_field(directory, last, 'dones')[2] == b'\x00\x01'
+        assert read_field(directory, last, 'actions')[2] == b'\x00\x01'
+    
+    def test_reopening_appends_new_shards(self, tmp_path):
+        """Test that a reopened dataset keeps its shards and adds more."""
+        directory = str(tmp_path)
+        with DatasetWriter(directory, obs_size=2, shard_rows=8) as writer:
+            writer.add(b'ab', 0, 0.0, False)
+        with DatasetWriter(directory, obs_size=2, shard_rows=8) as writer:
+            assert len(writer) == 1
+            writer.add(b'cd', 1, 1.0, True)
+        
+        manifest = read_manifest(directory)
+        assert manifest['rows'] == 2
+        assert [shard['files']['observations']
+                for shard in manifest['shards']] == [
+            'observations-00000.npy', 'observations-00001.npy'
+        ]
+        with pytest.raises(ValueError):
+            DatasetWriter(directory, obs_size=5)
+    
+    def test_open_shard_is_not_listed_until_closed(self, tmp_path):
+        """Test that readers only see complete shards."""
+        directory = str(tmp_path)
+        writer = DatasetWriter(directory, obs_size=1, shard_rows=2)
+        for _ in range(3):
+            writer.add(b'x', 0, 0.0, False)
+        
+        assert read_manifest(directory)['rows'] == 2
+        path = os.path.join(directory, 'actions-00001.npy')
+        assert read_header(path)[1] == (0,)
+        writer.close()
+        assert read_header(path)[1] == (1,)
+    
+    def test_add_batch_splits_across_shards(self, tmp_path):
+        """Test that ring batches are written without per-sample calls."""
+        directory = str(tmp_path)
+        ring = SampleRing(8, 2)
+        try:
+            for i in range(6):
+                slot = ring.reserve()
+                ring.observation(slot)[:] = bytes([i, i])
+                ring.actions[slot] = i
+                ring.rewards[slot] = float(i)
+                ring.dones[slot] = 0
+                ring.commit()
+            batch = ring.read(8)
+            with DatasetWriter(directory, obs_size=2, shard_rows=4) as writer:
+                writer.add_batch(batch)
+            batch.release()
+        finally:
+            ring.close()
+            ring.unlink()
+        
+        shards = read_manifest(directory)['shards']
+        assert [shard['rows'] for shard in shards] == [4, 2]
+        observations = read_field(directory, shards[1], 'observations')[2]
+        rewards = read_field(directory, shards[1], 'rewards')[2]
+        assert observations == b'\x04\x04\x05\x05'
+        assert struct.unpack('<2f', rewards) == (4.0, 5.0)
+    
+    def test_observation_size_is_checked(self, tmp_path):
+        """Test that observations of the wrong size are rejected."""
+        with DatasetWriter(str(tmp_path), obs_size=4) as writer:
+            with pytest.raises(ValueError):
+                writer.add(b'abc', 0, 0.0, False)
+    
+    def test_record_self_play(self, tmp_path):
+        """Test streaming engine runs into a dataset."""
+        random.seed(2)
+        engine = GameEngine(board_width=6, board_height=6)
+        with DatasetWriter(str(tmp_path), obs_size=36, shard_rows=100) as writer:
+            counts = record_self_play(writer, engine, 250, seed=2)
+        
+        manifest = read_manifest(str(tmp_path))
+        assert counts['samples'] == manifest['rows'] == 250
+        dones = b''.join(read_field(str(tmp_path), shard, 'dones')[2]
+                         for shard in manifest['shards'])
+        assert dones.count(1) == counts['games']
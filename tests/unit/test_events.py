@@ -0,0 +1,155 @@
+"""Unit tests for GameEngine events."""
+
+import pytest
+from src.snake_game.events import EventType
+from src.snake_game.game_engine import GameEngine
+from src.snake_game.level_map import parse_map
+from src.snake_game.types import Collision, Direction, GameState
+
+
+@pytest.fixture
+def recorded():
+    """Engine with a listener recording every event."""
+    engine = GameEngine(board_width=10, board_height=10)
+    events = []
+    engine.subscribe(events.append)
+    return engine, events
+
+
+def types_of(events):
+    """Get the types of recorded events."""
+    return [event.type for event in events]
+
+
+class TestEvents:
+    """Test suite for GameEngine events."""
+    
+    def test_move_emits_moved(self, recorded):
+        """Test that a plain tick reports the new head and direction."""
+        engine, events = recorded
+        engine.food.place(engine.board, (0, 0))
+        
+        engine.tick()
+        
+        assert types_of(events) == [EventType.MOVED]
+        event = events[0]
+        assert event.tick == 1
+        assert event.cell == engine.snake.get_head_cell()
+        assert event.value == Direction.RIGHT
+    
+    def test_wrap_is_reported(self, recorded):
+        """Test that crossing the board edge emits a wrap."""
+        engine, events = recorded
+        engine.snake.body = [(9, 3), (8, 3), (7, 3)]
+        engine.food.place(engine.board, (0, 0))
+        
+        engine.tick()
+        
+        assert types_of(events) == [EventType.MOVED, EventType.WRAPPED]
+        assert events[1].cell == engine.board.to_cell(0, 3)
+    
+    def test_eating_then_growing(self, recorded):
+        """Test that food is reported when eaten and growth on the next move."""
+        engine, events = recorded
+        engine.snake.body = [(4, 5), (3, 5), (2, 5)]
+        engine.food.place(engine.board, (5, 5))
+        
+        engine.tick()
+        engine.food.place(engine.board, (0, 0))
+        engine.tick()
+        
+        assert types_of(events) == [EventType.MOVED, EventType.ATE_FOOD,
+                                    EventType.MOVED, EventType.GREW]
+        assert events[1].cell == engine.board.to_cell(5, 5)
+        assert events[1].value == 10
+        assert events[3].value == 4
+    
+    def test_self_collision_ends_game(self, recorded):
+        """Test that a crash reports the collision and then game over."""
+        engine, events = recorded
+        engine.snake.body = [(5, 5), (5, 6), (6, 6), (6, 5), (6, 4)]
+        engine.food.place(engine.board, (0, 0))
+        
+        engine.tick()
+        
+        assert types_of(events) == [EventType.MOVED, EventType.COLLIDED,
+                                    EventType.GAME_OVER]
+        assert events[1].value == Collision.SELF
+        assert events[2].value == 0
+        assert engine.get_state() == GameState.GAME_OVER
+    
+    def test_wall_collision_is_classified(self):
+        """Test that running into a map wall reports a wall collision."""
+        engine = GameEngine(level_map=parse_map("#####\n#..S#\n#####\n"))
+        collisions = []
+        engine.subscribe(collisions.append, EventType.COLLIDED)
+        
+        engine.tick()
+        
+        assert [event.value for event in collisions] == [Collision.WALL]
+    
+    def test_pause_resume_restart(self, recorded):
+        """Test state change events."""
+        engine, events = recorded
+        
+        engine.toggle_pause()
+        engine.toggle_pause()
+        engine.restart()
+        
+        assert types_of(events) == [EventType.PAUSED, EventType.RESUMED,
+                                    EventType.RESTARTED]
+        assert engine.tick_count == 0
+    
+    def test_subscribe_filters_types(self):
+        """Test that a listener only receives the types it asked for."""
+        engine = GameEngine()
+        events = []
+        engine.subscribe(events.append, EventType.PAUSED)
+        engine.subscribe(events.append, EventType.PAUSED)
+        
+        engine.tick()
+        engine.pause()
+        
+        assert types_of(events) == [EventType.PAUSED]
+    
+    def test_unsubscribe_during_dispatch(self):
+        """Test that a listener can remove itself while being called."""
+        engine = GameEngine()
+        calls = []
+        
+        def once(event):
+            calls.append(event)
+            engine.unsubscribe(once)
+        
+        engine.subscribe(once)
+        engine.subscribe(calls.append, EventType.MOVED)
+        engine.tick()
+        engine.tick()
+        
+        assert len(calls) == 3
+        assert EventType.PAUSED not in engine._listeners
+    
+    def test_no_listeners_no_registry(self):
+        """Test that unsubscribing everything leaves the fast path."""
+        engine = GameEngine()
+        engine.subscribe(print)
+        engine.unsubscribe(print)
+        
+        assert not engine._listeners
+    
+    def test_other_listeners_keep_fast_move(self):
+        """Test that only movement listeners make ticks build move events."""
+        engine = GameEngine()
+        slow_moves = []
+        engine._move_observed = lambda: slow_moves.append(engine.tick_count)
+        engine.subscribe(print, EventType.GAME_OVER, EventType.RESTARTED)
+        engine.tick()
+        assert slow_moves == []
+        
+        engine.subscribe(print, EventType.GREW)
+        engine.tick()
+        assert slow_moves == [2]
+        
+        engine.unsubscribe(print, EventType.GREW)
+        engine.tick()
+        assert slow_moves == [2]
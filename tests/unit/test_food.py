@@ -1,8 +1,11 @@
-"""Unit tests for the Food class."""
+"""Unit tests for the Food and FoodManager classes."""
+
+import random
 
 import pytest
-from src.snake_game.food import Food
+from src.snake_game.food import Food, FoodManager
 from src.snake_game.game_board import GameBoard
+from src.snake_game.level_map import parse_map
 from src.snake_game.snake import Snake
 from src.snake_game.types import Direction
 
@@ -118,3 +121,109 @@ class TestFood:
         
         # Should find a different position at some point
         assert different_position_found
+    
+    def test_food_place_sets_position_and_cell(self):
+        """Test placing food at a given position."""
+        board = GameBoard(10, 10)
+        food = Food()
+        
+        food.place(board, (3, 7))
+        
+        assert food.get_position() == (3, 7)
+        assert food.get_cell() == board.to_cell(3, 7)
+
+
+def check_pool(manager):
+    """Assert the pool partition, slots and mask agree."""
+    pool = manager._pool
+    for slot, cell in enumerate(pool):
+        assert manager._slot[cell] == slot
+        assert manager.mask[cell] == (slot >= manager._free)
+    assert sum(manager.mask) == len(manager)
+
+
+class TestFoodManager:
+    """Test suite for FoodManager class."""
+    
+    def test_add_remove_and_membership(self):
+        """Test O(1) add, remove and lookup of food cells."""
+        manager = FoodManager(GameBoard(10, 10))
+        
+        manager.add(5)
+        manager.add(42)
+        manager.add(5)
+        
+        assert len(manager) == 2
+        assert 5 in manager and 42 in manager and 6 not in manager
+        assert sorted(manager) == [5, 42]
+        assert sorted(manager.positions()) == [(2, 4), (5, 0)]
+        
+        manager.remove(5)
+        assert 5 not in manager
+        with pytest.raises(KeyError):
+            manager.remove(5)
+        check_pool(manager)
+    
+    def test_spawn_avoids_snake_and_food(self):
+        """Test that spawned cells are distinct, free and not excluded."""
+        random.seed(1)
+        board = GameBoard(10, 10)
+        snake = Snake((5, 5), initial_length=20, board=board)
+        manager = FoodManager(board)
+        manager.add(0)
+        
+        cells = manager.spawn(30, snake.occupancy, exclude=1)
+        
+        assert len(cells) == len(set(cells)) == 30
+        assert not any(snake.occupancy[cell] for cell in cells)
+        assert 0 not in cells and 1 not in cells
+        assert len(manager) == 31
+        check_pool(manager)
+    
+    def test_spawn_fills_board_then_stops(self):
+        """Test that a crowded board yields only the free cells."""
+        board = GameBoard(5, 5)
+        snake = Snake((4, 0), initial_length=5, board=board)
+        manager = FoodManager(board)
+        
+        assert len(manager.spawn(100, snake.occupancy)) == 20
+        assert manager.spawn(1, snake.occupancy) == []
+        assert set(manager) == set(range(5, 25))
+    
+    def test_sample_covers_every_free_cell(self):
+        """Test that sampling can reach every free cell."""
+        random.seed(2)
+        board = GameBoard(6, 6)
+        occupancy = bytearray(board.size)
+        manager = FoodManager(board)
+        
+        seen = set()
+        for _ in range(200):
+            seen.update(manager.sample(3, occupancy))
+        
+        assert seen == set(range(board.size))
+        assert len(manager) == 0
+    
+    def test_walls_are_never_food(self):
+        """Test that a walled board keeps food off the walls."""
+        board = GameBoard(level_map=parse_map("###\n#..\n###\n"))
+        manager = FoodManager(board)
+        
+        assert sorted(manager.spawn(5, bytearray(board.walls))) == [4, 5]
+        with pytest.raises(ValueError):
+            manager.add(0)
+    
+    def test_random_operations_keep_pool_consistent(self):
+        """Test the pool invariants over mixed spawns, removals and clears."""
+        random.seed(3)
+        board = GameBoard(12, 8)
+        occupancy = bytearray(board.size)
+        manager = FoodManager(board)
+        
+        for step in range(300):
+            manager.spawn(random.randrange(4), occupancy)
+            for cell in random.sample(list(manager), min(2, len(manager))):
+                manager.remove(cell)
+            if step % 100 == 99:
+                manager.clear()
+            check_pool(manager)
@@ -2,6 +2,7 @@
 
 import pytest
 from src.snake_game.game_board import GameBoard
+from src.snake_game.types import Direction
 
 
 class TestGameBoard:
@@ -94,3 +95,73 @@ class TestGameBoard:
         board = GameBoard(20, 20)
         
         assert not board.is_valid_position(20, 20)
+    
+    def test_to_cell_packs_row_major(self):
+        """Test that cells are packed as y * width + x."""
+        board = GameBoard(30, 15)
+        
+        assert board.to_cell(0, 0) == 0
+        assert board.to_cell(4, 2) == 2 * 30 + 4
+        assert board.size == 30 * 15
+    
+    def test_to_cell_wraps_out_of_bounds(self):
+        """Test that out-of-bounds coordinates wrap onto the board."""
+        board = GameBoard(10, 8)
+        
+        assert board.to_cell(-1, 3) == board.to_cell(9, 3)
+        assert board.to_cell(10, 3) == board.to_cell(0, 3)
+        assert board.to_cell(4, -1) == board.to_cell(4, 7)
+    
+    def test_to_position_round_trip(self):
+        """Test that every cell unpacks back to its coordinates."""
+        board = GameBoard(7, 5)
+        
+        for y in range(5):
+            for x in range(7):
+                assert board.to_position(board.to_cell(x, y)) == (x, y)
+    
+    def test_next_cell_moves_one_step(self):
+        """Test stepping to neighbors away from the edges."""
+        board = GameBoard(10, 10)
+        cell = board.to_cell(5, 5)
+        
+        assert board.to_position(board.next_cell(cell, Direction.UP)) == (5, 4)
+        assert board.to_position(board.next_cell(cell, Direction.DOWN)) == (5, 6)
+        assert board.to_position(board.next_cell(cell, Direction.LEFT)) == (4, 5)
+        assert board.to_position(board.next_cell(cell, Direction.RIGHT)) == (6, 5)
+    
+    def test_next_cell_wraps_at_edges(self):
+        """Test that stepping off an edge wraps to the opposite edge."""
+        board = GameBoard(10, 6)
+        
+        assert board.next_cell(board.to_cell(9, 2), Direction.RIGHT) == board.to_cell(0, 2)
+        assert board.next_cell(board.to_cell(0, 2), Direction.LEFT) == board.to_cell(9, 2)
+        assert board.next_cell(board.to_cell(3, 0), Direction.UP) == board.to_cell(3, 5)
+        assert board.next_cell(board.to_cell(3, 5), Direction.DOWN) == board.to_cell(3, 0)
+    
+    def test_neighbor_tables_match_wrapped_steps(self):
+        """Test that every table entry equals the wrapped single step."""
+        board = GameBoard(6, 4)
+        
+        for direction in Direction:
+            dx, dy = direction.value
+            table = board.neighbors[direction]
+            assert len(table) == board.size
+            for cell in range(board.size):
+                x, y = board.to_position(cell)
+                assert table[cell] == board.to_cell(x + dx, y + dy)
+    
+    def test_neighbor_tables_follow_direction_order(self):
+        """Test that neighbor_tables lists tables in Direction order."""
+        board = GameBoard(5, 5)
+        
+        for direction, table in zip(Direction, board.neighbor_tables):
+            assert board.neighbors[direction] is table
+    
+    def test_neighbor_tables_shared_between_same_size_boards(self):
+        """Test that boards of equal size reuse the precomputed tables."""
+        first = GameBoard(12, 9)
+        second = GameBoard(12, 9)
+        
+        assert first.neighbor_tables is second.neighbor_tables
+        assert GameBoard(9, 12).neighbor_tables is not first.neighbor_tables
@@ -1,5 +1,7 @@
 """Unit tests for the GameEngine class."""
 
+import random
+
 import pytest
 from src.snake_game.game_engine import GameEngine
 from src.snake_game.types import Direction, GameState
@@ -282,3 +284,96 @@ class TestGameEngine:
         engine.handle_input(Direction.UP)
         
         assert engine.snake.direction == direction_before
+    
+    def test_multiple_food_items(self):
+        """Test that extra food items are eaten and replaced."""
+        engine = GameEngine(food_count=50)
+        
+        assert len(engine.foods) == 49
+        assert engine.food.get_cell() not in engine.foods
+        
+        head = engine.snake.get_head_cell()
+        target = engine.board.neighbors[Direction.RIGHT][head]
+        if engine.food.get_cell() == target:
+            engine.food.place(engine.board, (0, 0))
+        engine.foods.add(target)
+        engine.foods.remove(next(cell for cell in engine.foods if cell != target))
+        engine.tick()
+        
+        assert engine.get_score() == 10
+        assert target not in engine.foods
+        assert len(engine.foods) == 49
+        assert not any(engine.snake.occupancy[cell] for cell in engine.foods)
+    
+    @pytest.mark.parametrize("food_count", [0, -1])
+    def test_rejects_non_positive_food_count(self, food_count):
+        """Test that an engine needs at least one food item."""
+        with pytest.raises(ValueError, match="Food count must be positive"):
+            GameEngine(food_count=food_count)
+    
+    def test_full_board_keeps_remaining_food(self):
+        """Test that an eaten main item is replaced by a leftover one."""
+        engine = GameEngine(board_width=5, board_height=1, food_count=2)
+        # Snake fills three of five cells; food covers the other two, the
+        # main item in front of the head
+        engine.food.place(engine.board, (3, 0))
+        engine.foods.clear()
+        engine.foods.add(engine.board.to_cell(4, 0))
+        engine.rehash()
+        
+        # Growing onto the main item leaves no free cell to respawn it on
+        engine.snake.grow()
+        engine.tick()
+        
+        assert engine.get_state() == GameState.RUNNING
+        assert engine.get_score() == 10
+        assert engine.food.get_position() == (4, 0)
+        assert len(engine.foods) == 0
+    
+    def test_state_hash_tracks_ticks_incrementally(self):
+        """Test that the incremental hash equals a from-scratch rehash."""
+        random.seed(3)
+        engine = GameEngine(board_width=8, board_height=8, food_count=5)
+        for _ in range(20):
+            engine.restart()
+            while engine.get_state() == GameState.RUNNING:
+                engine.handle_input(random.choice(list(Direction)))
+                engine.tick()
+                current = engine.state_hash()
+                assert engine.rehash() == current
+    
+    def test_state_hash_identifies_position(self):
+        """Test that equal positions hash equally and others differ."""
+        first = GameEngine(board_width=10, board_height=10, food_seed=4)
+        second = GameEngine(board_width=10, board_height=10, food_seed=4)
+        assert first.state_hash() == second.state_hash()
+        
+        first.tick()
+        assert first.state_hash() != second.state_hash()
+        second.tick()
+        assert first.state_hash() == second.state_hash()
+        
+        second.handle_input(Direction.UP)
+        assert first.state_hash() != second.state_hash()
+        second.handle_input(Direction.RIGHT)
+        second.snake.grow()
+        assert first.state_hash() != second.state_hash()
+    
+    def test_state_hash_body_order(self):
+        """Test which body orders the hash tells apart."""
+        engine = GameEngine(board_width=10, board_height=10)
+        
+        def body_hash(positions):
+            engine.snake.body = positions
+            return engine.rehash()
+        
+        # Same cells and head, tail at the other end: different positions
+        square = body_hash([(2, 2), (1, 2), (1, 1), (2, 1)])
+        assert square != body_hash([(2, 2), (2, 1), (1, 1), (1, 2)])
+        
+        # Same cells, head and tail, different path between them: a known
+        # collision (documented on ZobristKeys)
+        folded = body_hash([(0, 0), (0, 1), (0, 2), (1, 2), (2, 2), (2, 1),
+                            (1, 1), (1, 0), (2, 0)])
+        assert folded == body_hash([(0, 0), (1, 0), (1, 1), (0, 1), (0, 2),
+                                    (1, 2), (2, 2), (2, 1), (2, 0)])
@@ -0,0 +1,107 @@
+"""Unit tests for the Hamiltonian-cycle solver."""
+
+import random
+
+import pytest
+from src.snake_game.game_board import GameBoard
+from src.snake_game.game_engine import GameEngine
+from src.snake_game.hamiltonian import HamiltonianSolver, hamiltonian_cycle
+from src.snake_game.types import GameState
+
+
+class TestHamiltonianCycle:
+    """Test suite for hamiltonian_cycle."""
+    
+    @pytest.mark.parametrize("width,height", [
+        (1, 5), (2, 1), (2, 3), (3, 3), (4, 4), (5, 7), (6, 5), (9, 9),
+    ])
+    def test_cycle_visits_every_cell_once(self, width, height):
+        """Test that the cycle is a permutation of all cells."""
+        order, index = hamiltonian_cycle(width, height)
+        
+        assert sorted(order) == list(range(width * height))
+        for position, cell in enumerate(order):
+            assert index[cell] == position
+    
+    @pytest.mark.parametrize("width,height", [
+        (1, 5), (2, 1), (2, 3), (3, 3), (4, 4), (5, 7), (6, 5), (9, 9),
+    ])
+    def test_cycle_steps_are_adjacent(self, width, height):
+        """Test that consecutive cycle cells are neighbors on the torus."""
+        board = GameBoard(width, height)
+        order, _ = hamiltonian_cycle(width, height)
+        
+        for position, cell in enumerate(order):
+            following = order[(position + 1) % len(order)]
+            assert any(table[cell] == following for table in board.neighbor_tables)
+    
+    def test_cycle_is_cached_per_size(self):
+        """Test that the same arrays are returned for the same dimensions."""
+        assert hamiltonian_cycle(12, 8) is hamiltonian_cycle(12, 8)
+
+
+class TestHamiltonianSolver:
+    """Test suite for HamiltonianSolver class."""
+    
+    @pytest.mark.parametrize("shortcuts", [True, False])
+    @pytest.mark.parametrize("width,height", [(4, 4), (4, 8), (5, 5), (8, 8), (7, 9)])
+    def test_solver_fills_the_board(self, width, height, shortcuts):
+        """Test that games end in the board-full victory, not a collision."""
+        random.seed(width * height)
+        engine = GameEngine(board_width=width, board_height=height)
+        solver = HamiltonianSolver(engine, shortcuts=shortcuts)
+        
+        for _ in range(width * height * width * height):
+            if engine.get_state() != GameState.RUNNING:
+                break
+            solver.step()
+            engine.tick()
+        
+        assert engine.get_state() == GameState.GAME_OVER
+        assert not engine.snake.collides_with_self()
+        assert len(engine.snake.cells) == engine.board.size
+        # The snake starts at length 3 and eats the last food at full length
+        assert engine.get_score() == (engine.board.size - 2) * 10
+    
+    def test_shortcuts_finish_faster(self):
+        """Test that shortcuts reduce the ticks needed to fill the board."""
+        ticks = {}
+        for shortcuts in (True, False):
+            random.seed(5)
+            engine = GameEngine(board_width=10, board_height=10)
+            solver = HamiltonianSolver(engine, shortcuts=shortcuts)
+            ticks[shortcuts] = 0
+            while engine.get_state() == GameState.RUNNING:
+                solver.step()
+                engine.tick()
+                ticks[shortcuts] += 1
+        
+        assert ticks[True] < ticks[False]
+    
+    def test_realigns_after_restart(self):
+        """Test that the solver keeps working on a restarted engine."""
+        engine = GameEngine(board_width=6, board_height=6)
+        solver = HamiltonianSolver(engine)
+        solver.step()
+        
+        engine.restart()
+        solver.step()
+        engine.tick()
+        
+        assert engine.get_state() == GameState.RUNNING
+    
+    def test_rejects_body_off_the_cycle(self):
+        """Test that a body which cannot lie along the cycle is reported."""
+        engine = GameEngine(board_width=6, board_height=6)
+        engine.snake.body = [(2, 2), (2, 3), (3, 3), (3, 2), (4, 2), (4, 1)]
+        solver = HamiltonianSolver(engine)
+        
+        with pytest.raises(ValueError, match="Hamiltonian cycle"):
+            solver.choose_direction()
+    
+    def test_rejects_boards_narrower_than_four(self):
+        """Test that a 3-wide board, where the snake fills a row, is refused."""
+        engine = GameEngine(board_width=3, board_height=8)
+        
+        with pytest.raises(ValueError, match="at least 4 cells wide"):
+            HamiltonianSolver(engine)
@@ -0,0 +1,196 @@
+"""Unit tests for the InputHandler and KeyParser classes."""
+
+import os
+import threading
+
+import pytest
+from src.snake_game.input_handler import InputHandler, KeyParser
+from src.snake_game.types import Direction
+
+
+@pytest.fixture
+def pipe():
+    """A pipe standing in for the terminal: (handler, write end)."""
+    read_fd, write_fd = os.pipe()
+    yield InputHandler(fd=read_fd), write_fd
+    os.close(read_fd)
+    os.close(write_fd)
+
+
+class TestKeyParser:
+    """Test suite for KeyParser class."""
+    
+    def test_parses_wasd_and_other_keys(self):
+        """Test that plain keys map to directions or pass through."""
+        parser = KeyParser()
+        
+        assert parser.feed('wAx') == [Direction.UP, Direction.LEFT, 'x']
+    
+    def test_parses_arrow_sequences(self):
+        """Test CSI and SS3 arrow key sequences."""
+        parser = KeyParser()
+        
+        assert parser.feed('\x1b[A\x1b[B\x1bOC\x1bOD') == [
+            Direction.UP, Direction.DOWN, Direction.RIGHT, Direction.LEFT,
+        ]
+    
+    def test_sequence_split_across_reads(self):
+        """Test that an escape sequence split between reads is reassembled."""
+        parser = KeyParser()
+        
+        assert parser.feed('\x1b') == []
+        assert parser.feed('[') == []
+        assert parser.feed('Dq') == [Direction.LEFT, 'q']
+    
+    def test_modified_arrow_and_unknown_sequences(self):
+        """Test parameterized CSI arrows and ignored sequences."""
+        parser = KeyParser()
+        
+        assert parser.feed('\x1b[1;5A\x1b[2~p') == [Direction.UP, 'p']
+    
+    def test_lone_escape_reported_on_flush(self):
+        """Test that a lone ESC is only reported once input goes quiet."""
+        parser = KeyParser()
+        
+        assert parser.feed('\x1b') == []
+        assert parser.flush() == ['\x1b']
+        assert parser.flush() == []
+    
+    def test_escape_followed_by_key(self):
+        """Test that ESC followed by a non-sequence key is an ESC press."""
+        parser = KeyParser()
+        
+        assert parser.feed('\x1bq') == ['\x1b', 'q']
+
+
+class TestInputHandler:
+    """Test suite for InputHandler reading from a file descriptor."""
+    
+    def test_no_input_returns_none(self, pipe):
+        """Test that polling an idle descriptor does not block."""
+        handler, _ = pipe
+        
+        assert handler.get_input() is None
+        assert handler.get_last_char() is None
+    
+    def test_burst_applied_one_per_tick(self, pipe):
+        """Test that keys read together are returned on consecutive calls."""
+        handler, write_fd = pipe
+        os.write(write_fd, b'w\x1b[D')
+        
+        assert handler.get_input() == Direction.UP
+        assert handler.get_input() == Direction.LEFT
+        assert handler.get_input() is None
+    
+    def test_arrow_split_across_writes(self, pipe):
+        """Test that an arrow key split across two reads is parsed."""
+        handler, write_fd = pipe
+        os.write(write_fd, b'\x1b[')
+        assert handler.get_input() is None
+        
+        os.write(write_fd, b'B')
+        assert handler.get_input() == Direction.DOWN
+    
+    def test_lone_escape_becomes_quit_key(self, pipe):
+        """Test that a lone ESC surfaces on the next quiet poll."""
+        handler, write_fd = pipe
+        os.write(write_fd, b'\x1b')
+        
+        handler.get_input()
+        assert handler.get_last_char() is None
+        handler.get_input()
+        char = handler.get_last_char()
+        assert char == '\x1b'
+        assert handler.should_quit(char)
+    
+    def test_control_key_not_delayed_by_directions(self, pipe):
+        """Test that pause is seen on the same tick as queued moves."""
+        handler, write_fd = pipe
+        os.write(write_fd, b'wasp')
+        
+        assert handler.get_input() == Direction.UP
+        assert handler.get_last_char() == 'p'
+    
+    def test_repeated_direction_collapsed(self, pipe):
+        """Test that auto-repeat of one key does not fill the queue."""
+        handler, write_fd = pipe
+        os.write(write_fd, b'dddddds')
+        
+        assert handler.get_input() == Direction.RIGHT
+        assert handler.get_input() == Direction.DOWN
+    
+    def test_only_queued_repeats_dropped(self, pipe):
+        """Test that a key is dropped only when it repeats the queued one."""
+        handler, write_fd = pipe
+        os.write(write_fd, b'wwaw')
+        
+        assert handler.get_input() == Direction.UP
+        os.write(write_fd, b'a')
+        assert handler.get_input() == Direction.LEFT
+        assert handler.get_input() == Direction.UP
+        assert handler.get_input() == Direction.LEFT
+        assert handler.get_input() is None
+        
+        # Once handed out, the same key pressed again is queued
+        os.write(write_fd, b'a')
+        assert handler.get_input() == Direction.LEFT
+    
+    def test_queue_bounded_drops_oldest(self):
+        """Test that the direction queue keeps only the newest keys."""
+        read_fd, write_fd = os.pipe()
+        try:
+            handler = InputHandler(fd=read_fd, max_queued=2)
+            os.write(write_fd, b'wasd')
+            
+            assert handler.get_input() == Direction.DOWN
+            assert handler.get_input() == Direction.RIGHT
+            assert handler.get_input() is None
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+    
+    def test_wait_for_char_returns_control_key(self, pipe):
+        """Test waiting for a control key while discarding movement keys."""
+        handler, write_fd = pipe
+        os.write(write_fd, b'wr')
+        
+        assert handler.wait_for_char(0.01) == 'r'
+        assert handler.get_input() is None
+    
+    def test_wait_for_char_times_out(self, pipe):
+        """Test that waiting with no input returns None."""
+        handler, _ = pipe
+        
+        assert handler.wait_for_char(0.01) is None
+    
+    def test_wait_for_char_blocks_through_movement_keys(self, pipe):
+        """Test that an idle wait only wakes for a control key."""
+        handler, write_fd = pipe
+        writes = [b'w', b'\x1b[A', b'p']
+        timers = [threading.Timer(0.02 * (i + 1), os.write, (write_fd, data))
+                  for i, data in enumerate(writes)]
+        for timer in timers:
+            timer.start()
+        
+        assert handler.wait_for_char(None) == 'p'
+        assert handler.get_input() is None
+    
+    def test_wait_for_char_resolves_lone_escape(self, pipe):
+        """Test that a blocking wait still reports a lone ESC."""
+        handler, write_fd = pipe
+        os.write(write_fd, b'\x1b')
+        
+        assert handler.wait_for_char(None) == '\x1b'
+    
+    def test_wait_for_char_returns_at_end_of_input(self):
+        """Test that a closed input does not block forever."""
+        read_fd, write_fd = os.pipe()
+        os.close(write_fd)
+        try:
+            handler = InputHandler(fd=read_fd)
+            assert not handler.at_eof
+            assert handler.wait_for_char(None) is None
+            assert handler.at_eof
+            assert handler.wait_for_char(None) is None
+        finally:
+            os.close(read_fd)
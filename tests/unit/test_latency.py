@@ -0,0 +1,174 @@
+"""Unit tests for latency instrumentation."""
+
+import json
+import os
+
+import pytest
+from src.snake_game.game_engine import GameEngine
+from src.snake_game.input_handler import InputHandler
+from src.snake_game.latency import LatencyHistogram, LatencyTracker
+from src.snake_game.renderer import Renderer
+from src.snake_game.types import Direction
+
+
+class FakeClock:
+    """Manually advanced clock returning seconds."""
+    
+    def __init__(self):
+        self.now = 100.0
+    
+    def __call__(self) -> float:
+        return self.now
+    
+    def advance(self, ms: float) -> None:
+        self.now += ms / 1000
+
+
+class TestLatencyHistogram:
+    """Test suite for LatencyHistogram class."""
+    
+    def test_empty_histogram(self):
+        """Test that an empty histogram has no percentiles."""
+        histogram = LatencyHistogram()
+        
+        assert histogram.percentile(0.5) is None
+        assert histogram.to_dict()['mean_ms'] is None
+    
+    def test_records_into_buckets(self):
+        """Test bucket placement, including bucket bounds and overflow."""
+        histogram = LatencyHistogram()
+        for latency_ms in (0.5, 1.0, 3.0, 2500.0):
+            histogram.record(latency_ms)
+        
+        summary = histogram.to_dict()
+        assert summary['bucket_counts'][0] == 2  # <= 1 ms
+        assert summary['bucket_counts'][2] == 1  # 2..5 ms
+        assert summary['bucket_counts'][-1] == 1  # > 1000 ms
+        assert summary['min_ms'] == 0.5
+        assert summary['max_ms'] == 2500.0
+    
+    def test_percentiles_use_bucket_bounds(self):
+        """Test that percentiles report bucket upper bounds, capped at max."""
+        histogram = LatencyHistogram()
+        for _ in range(90):
+            histogram.record(4.0)
+        for _ in range(10):
+            histogram.record(120.0)
+        
+        assert histogram.percentile(0.5) == 5.0
+        assert histogram.percentile(0.9) == 5.0
+        assert histogram.percentile(0.99) == 120.0
+
+
+class TestLatencyTracker:
+    """Test suite for LatencyTracker class."""
+    
+    def test_stages_measured_from_previous_stage(self):
+        """Test that each stage is timed from the one before."""
+        clock = FakeClock()
+        tracker = LatencyTracker(tick_rate=12, clock=clock)
+        
+        read_time = tracker.key_read()
+        clock.advance(3)
+        tracker.key_applied(read_time)
+        clock.advance(1)
+        tracker.tick_completed()
+        clock.advance(2)
+        tracker.frame_flushed()
+        
+        report = tracker.report()['12']
+        assert report['queued']['mean_ms'] == pytest.approx(3)
+        assert report['tick']['mean_ms'] == pytest.approx(1)
+        assert report['render']['mean_ms'] == pytest.approx(2)
+        assert report['total']['mean_ms'] == pytest.approx(6)
+    
+    def test_frames_without_keys_not_recorded(self):
+        """Test that idle ticks and frames produce no samples."""
+        tracker = LatencyTracker(tick_rate=8, clock=FakeClock())
+        tracker.tick_completed()
+        tracker.frame_flushed()
+        
+        assert tracker.report() == {}
+    
+    def test_only_ticked_keys_reach_frame(self):
+        """Test that a key applied after the tick waits for the next frame."""
+        clock = FakeClock()
+        tracker = LatencyTracker(clock=clock)
+        tracker.key_applied(tracker.key_read())
+        tracker.tick_completed()
+        tracker.key_applied(tracker.key_read())
+        tracker.frame_flushed()
+        
+        assert tracker.histograms[0]['total'].count == 1
+        tracker.tick_completed()
+        tracker.frame_flushed()
+        assert tracker.histograms[0]['total'].count == 2
+    
+    def test_frame_reflects_ticks_through(self):
+        """Test that a frame of an earlier tick leaves later keys waiting."""
+        tracker = LatencyTracker(clock=FakeClock())
+        tracker.key_applied(tracker.key_read())
+        tracker.tick_completed()
+        drawn = tracker.ticks
+        tracker.key_applied(tracker.key_read())
+        tracker.tick_completed()
+        
+        tracker.frame_flushed(drawn)
+        assert tracker.histograms[0]['total'].count == 1
+        tracker.frame_flushed(drawn)
+        assert tracker.histograms[0]['total'].count == 1
+        tracker.frame_flushed(tracker.ticks)
+        assert tracker.histograms[0]['total'].count == 2
+    
+    def test_grouped_by_tick_rate(self):
+        """Test that changing the tick rate starts a separate histogram."""
+        tracker = LatencyTracker(tick_rate=8, clock=FakeClock())
+        for tick_rate in (8, 16):
+            tracker.tick_rate = tick_rate
+            tracker.key_applied(tracker.key_read())
+            tracker.tick_completed()
+            tracker.frame_flushed()
+        
+        assert list(tracker.report()) == ['8', '16']
+    
+    def test_write_json(self, tmp_path):
+        """Test that the report round-trips through JSON."""
+        tracker = LatencyTracker(tick_rate=16, clock=FakeClock())
+        tracker.key_applied(tracker.key_read())
+        tracker.tick_completed()
+        tracker.frame_flushed()
+        path = tmp_path / 'latency.json'
+        
+        tracker.write_json(str(path))
+        
+        assert json.loads(path.read_text()) == tracker.report()
+    
+    def test_end_to_end_through_handler_and_renderer(self, capsys):
+        """Test a key flowing from the handler through a tick to a frame."""
+        clock = FakeClock()
+        tracker = LatencyTracker(tick_rate=12, clock=clock)
+        read_fd, write_fd = os.pipe()
+        try:
+            handler = InputHandler(fd=read_fd, latency=tracker)
+            renderer = Renderer(latency=tracker)
+            engine = GameEngine(board_width=10, board_height=10)
+            os.write(write_fd, b'w')
+            
+            handler.poll()
+            clock.advance(5)
+            direction = handler.get_input()
+            engine.handle_input(direction)
+            engine.tick()
+            tracker.tick_completed()
+            clock.advance(1)
+            renderer.render(engine)
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+        
+        assert direction == Direction.UP
+        assert '╝' in capsys.readouterr().out
+        report = tracker.report()['12']
+        assert report['total']['count'] == 1
+        assert report['queued']['mean_ms'] == pytest.approx(5)
+        assert report['total']['mean_ms'] == pytest.approx(6)
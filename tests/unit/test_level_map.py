@@ -0,0 +1,142 @@
+"""Unit tests for static obstacle maps."""
+
+import os
+import random
+
+import pytest
+from src.snake_game.food import Food
+from src.snake_game.game_board import GameBoard
+from src.snake_game.game_engine import GameEngine
+from src.snake_game.level_map import load_map, parse_map
+from src.snake_game.render_backends import MemoryBackend, strip_ansi
+from src.snake_game.renderer import Renderer
+from src.snake_game.types import Direction, GameState
+
+BOX = (
+    "########\n"
+    "#......#\n"
+    "#...S..#\n"
+    "#......#\n"
+    "########\n"
+)
+
+
+class TestLevelMap:
+    """Test suite for map parsing and loading."""
+    
+    def test_parse_walls_and_start(self):
+        """Test that walls, open cells and the start are read."""
+        level_map = parse_map(BOX)
+        
+        assert (level_map.width, level_map.height) == (8, 5)
+        assert level_map.start == (4, 2)
+        assert level_map.wall_count == 8 * 5 - 6 * 3
+        assert level_map.is_wall(0)
+        assert not level_map.is_wall(1 * 8 + 1)
+        assert list(level_map.open_cells) == [
+            y * 8 + x for y in range(1, 4) for x in range(1, 7)
+        ]
+    
+    def test_trailing_space_rows_are_floor(self):
+        """Test that only empty trailing lines are dropped, not floor rows."""
+        level_map = parse_map("#..#\r\n    \r\n    \n\n")
+        
+        assert (level_map.width, level_map.height) == (4, 3)
+        assert level_map.wall_count == 2
+    
+    @pytest.mark.parametrize("text", [
+        "",
+        "\n\n",
+        "###\n##\n",
+        "#x#\n",
+        "S.S\n",
+        "S..\n..S\n",
+    ])
+    def test_malformed_maps_rejected(self, text):
+        """Test that empty, ragged, unknown and multi-start maps raise."""
+        with pytest.raises(ValueError):
+            parse_map(text)
+    
+    def test_load_map_is_cached_until_modified(self, tmp_path):
+        """Test that an unchanged file is parsed once and an edit reloads."""
+        path = tmp_path / "level.txt"
+        path.write_text(BOX)
+        
+        first = load_map(str(path))
+        assert load_map(str(path)) is first
+        
+        path.write_text(BOX.replace("#......#\n#...S", "#..##..#\n#...S"))
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        reloaded = load_map(str(path))
+        
+        assert reloaded is not first
+        assert reloaded.wall_count == first.wall_count + 2
+
+
+class TestWalls:
+    """Test suite for walls on boards, snakes, food and the engine."""
+    
+    def test_board_takes_map_size_and_mask(self):
+        """Test that a map sets the board size and wall mask."""
+        board = GameBoard(level_map=parse_map(BOX))
+        
+        assert board.get_dimensions() == (8, 5)
+        assert board.is_wall(0, 0)
+        assert board.is_wall(8, 5)
+        assert not board.is_wall(3, 2)
+        assert len(board.open_cells) == 18
+    
+    def test_open_board_has_no_walls(self):
+        """Test that a board without a map is all open."""
+        board = GameBoard(6, 4)
+        
+        assert not any(board.walls)
+        assert list(board.open_cells) == list(range(24))
+    
+    def test_food_never_spawns_on_walls(self):
+        """Test that food only lands on open cells."""
+        random.seed(3)
+        engine = GameEngine(level_map=parse_map(BOX))
+        food = Food()
+        
+        for _ in range(100):
+            food.spawn(engine.board, engine.snake)
+            assert not engine.board.walls[food.get_cell()]
+            assert food.get_cell() not in engine.snake.cells
+    
+    def test_engine_starts_at_map_start(self):
+        """Test that the snake's head starts on the 'S' marker."""
+        engine = GameEngine(level_map=parse_map(BOX))
+        
+        assert engine.snake.get_head_position() == (4, 2)
+        engine.restart()
+        assert engine.snake.get_head_position() == (4, 2)
+    
+    def test_start_inside_wall_rejected(self):
+        """Test that a snake laid across a wall raises."""
+        with pytest.raises(ValueError):
+            GameEngine(level_map=parse_map("#####\n#S..#\n#####\n"))
+    
+    def test_running_into_wall_ends_game(self):
+        """Test that moving into a wall is a collision."""
+        engine = GameEngine(level_map=parse_map(BOX))
+        engine.food.place(engine.board, (1, 1))
+        engine.handle_input(Direction.DOWN)
+        
+        engine.tick()
+        assert engine.get_state() == GameState.RUNNING
+        engine.tick()
+        
+        assert engine.get_state() == GameState.GAME_OVER
+    
+    def test_walls_rendered(self):
+        """Test that walls are drawn distinctly from the snake."""
+        engine = GameEngine(level_map=parse_map(BOX))
+        backend = MemoryBackend(size=(80, 40))
+        
+        Renderer(backend=backend).render(engine)
+        
+        lines = strip_ansi(backend.text()).split("\n")
+        board_rows = [line for line in lines if line.startswith("║")]
+        assert board_rows[0] == "║" + "█" * 8 + "║"
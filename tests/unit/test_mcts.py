@@ -0,0 +1,191 @@
+"""Unit tests for the MCTS bot and its rollout engine."""
+
+import random
+
+import pytest
+from src.snake_game.game_engine import GameEngine
+from src.snake_game.level_map import parse_map
+from src.snake_game.mcts import ATE, DIED, MOVED, MCTSBot, RolloutEngine
+from src.snake_game.transposition import NO_MOVE, TranspositionTable
+from src.snake_game.types import Difficulty, Direction, GameState
+
+ROOM = (
+    "##########\n"
+    "#........#\n"
+    "#..####..#\n"
+    "#...S....#\n"
+    "#........#\n"
+    "##########\n"
+)
+
+
+def snapshot(state):
+    """Capture a rollout engine's state for comparison."""
+    return (bytes(state.occupancy), list(state.cells), state.direction,
+            state.grow_pending, state.food, state.score, state.alive)
+
+
+class FakeClock:
+    """Clock advancing a fixed step per reading."""
+    
+    def __init__(self, step):
+        self.now = 0.0
+        self.step = step
+    
+    def __call__(self):
+        self.now += self.step
+        return self.now
+
+
+class TestRolloutEngine:
+    """Test suite for RolloutEngine class."""
+    
+    def test_undo_restores_state(self):
+        """Test that rewinding random lines of play restores every field."""
+        random.seed(1)
+        engine = GameEngine(board_width=8, board_height=8, food_count=6)
+        state = RolloutEngine(engine)
+        start = snapshot(state)
+        
+        for _ in range(200):
+            outcomes = []
+            for _ in range(random.randrange(1, 25)):
+                outcomes.append(state.move(random.choice(list(Direction))))
+                if outcomes[-1] == DIED:
+                    break
+            state.rewind()
+            assert snapshot(state) == start
+    
+    def test_rules_match_game_engine(self):
+        """Test that moves crash and wrap exactly as in GameEngine."""
+        random.seed(2)
+        for _ in range(20):
+            engine = GameEngine(level_map=parse_map(ROOM))
+            engine.food.place(engine.board, (1, 1))
+            state = RolloutEngine(engine)
+            while engine.get_state() == GameState.RUNNING:
+                direction = random.choice(list(Direction))
+                engine.handle_input(direction)
+                outcome = state.move(direction)
+                engine.tick()
+                
+                assert (outcome == DIED) == (engine.get_state() == GameState.GAME_OVER)
+                assert list(state.cells) == list(engine.snake.cells)
+                if outcome == ATE:
+                    assert state.score == engine.score
+                    break
+    
+    def test_extra_food_is_used_up(self):
+        """Test eating a food item that is not the main one."""
+        engine = GameEngine(board_width=10, board_height=10)
+        engine.food.place(engine.board, (0, 0))
+        head = engine.snake.get_head_cell()
+        extra = engine.board.neighbors[Direction.RIGHT][head]
+        engine.foods.add(extra)
+        state = RolloutEngine(engine)
+        
+        assert state.move(Direction.RIGHT) == ATE
+        assert not state.is_food(extra)
+        assert state.food == engine.food.get_cell()
+        state.undo()
+        assert state.is_food(extra)
+        assert state.move(Direction.UP) == MOVED
+    
+    
+    def test_hash_matches_game_engine(self):
+        """Test that the rollout hash follows the engine's state hash."""
+        random.seed(5)
+        engine = GameEngine(board_width=12, board_height=12, food_count=4)
+        state = RolloutEngine(engine)
+        hashes = [state.state_hash()]
+        assert hashes[0] == engine.state_hash()
+        
+        while engine.get_state() == GameState.RUNNING:
+            direction = random.choice(list(Direction))
+            engine.handle_input(direction)
+            outcome = state.move(direction)
+            engine.tick()
+            hashes.append(state.state_hash())
+            if outcome != MOVED or engine.food.get_cell() != state.food:
+                break
+            assert hashes[-1] == engine.state_hash()
+        
+        while state.depth:
+            hashes.pop()
+            state.undo()
+            assert state.state_hash() == hashes[-1]
+    
+    def test_unhashed_engine_refuses_hash(self):
+        """Test that hashing can be turned off for plain searches."""
+        state = RolloutEngine(GameEngine(), hashed=False)
+        state.move(Direction.UP)
+        with pytest.raises(ValueError):
+            state.state_hash()
+
+
+class TestMCTSBot:
+    """Test suite for MCTSBot class."""
+    
+    def test_budget_follows_tick_rate(self):
+        """Test that the time budget is a fraction of a tick."""
+        engine = GameEngine()
+        
+        assert MCTSBot(engine, Difficulty.HARD).budget == 0.5 / 16
+        assert MCTSBot(engine, Difficulty.EASY, budget_fraction=0.25).budget == 0.25 / 8
+        assert MCTSBot(engine, budget=0.1).budget == 0.1
+    
+    def test_search_stops_at_deadline(self):
+        """Test that a search ends when its time budget is spent."""
+        engine = GameEngine()
+        bot = MCTSBot(engine, budget=1.0, clock=FakeClock(0.125))
+        
+        bot.choose_direction()
+        
+        # One clock reading starts the search, then one per iteration
+        assert bot.iterations == 8
+    
+    def test_avoids_walls(self):
+        """Test that the bot never steers into a wall when it has room."""
+        random.seed(3)
+        engine = GameEngine(level_map=parse_map(ROOM))
+        bot = MCTSBot(engine, budget=10.0, max_iterations=100)
+        
+        for _ in range(30):
+            if engine.get_state() != GameState.RUNNING:
+                break
+            bot.step()
+            engine.tick()
+        
+        assert engine.collision is None
+        assert engine.score > 0
+    
+    def test_tree_is_reused_between_ticks(self):
+        """Test that the chosen child becomes the next root."""
+        random.seed(4)
+        engine = GameEngine(board_width=30, board_height=30)
+        engine.food.place(engine.board, (0, 0))
+        bot = MCTSBot(engine, budget=10.0, max_iterations=200)
+        
+        bot.step()
+        engine.tick()
+        root = bot._root
+        bot.choose_direction()
+        
+        assert bot.reused == 1
+        assert root.visits > 200
+    
+    def test_transposition_table_reuses_leaves(self):
+        """Test that transposed leaves hit the table and best moves are kept."""
+        random.seed(6)
+        engine = GameEngine(board_width=15, board_height=15)
+        table = TranspositionTable(1 << 12)
+        bot = MCTSBot(engine, budget=10.0, max_iterations=500, table=table)
+        
+        direction = bot.choose_direction()
+        
+        assert table.hits > 0
+        assert 0 < len(table) <= table.size
+        slot = table.probe(engine.state_hash())
+        assert slot >= 0
+        assert table.moves[slot] != NO_MOVE
+        assert table.moves[slot] == list(Direction).index(direction)
@@ -0,0 +1,108 @@
+"""Unit tests for the Minimap class."""
+
+import random
+
+import pytest
+from src.snake_game.autopilot import Autopilot
+from src.snake_game.game_engine import GameEngine
+from src.snake_game.minimap import Minimap
+from src.snake_game.render_backends import MemoryBackend, strip_ansi
+from src.snake_game.renderer import Renderer
+from src.snake_game.types import GameState
+
+
+def fresh_counts(minimap, snake):
+    """Count blocks from scratch for comparison."""
+    reference = Minimap(minimap.board, minimap.columns, minimap.rows, minimap.glyphs)
+    reference.update(snake)
+    return list(reference._counts), bytes(reference._bits)
+
+
+class TestMinimap:
+    """Test suite for Minimap class."""
+    
+    def test_size_fits_budget(self):
+        """Test that huge boards are aggregated into the character budget."""
+        engine = GameEngine(board_width=500, board_height=500)
+        minimap = Minimap(engine.board, columns=24, rows=12)
+        
+        assert minimap.columns <= 24
+        assert minimap.rows <= 12
+        assert minimap.block_width * 2 * minimap.columns >= 500
+        assert minimap.block_height * 4 * minimap.rows >= 500
+        assert len(minimap.draw(engine)) == minimap.rows + 2
+    
+    def test_small_board_uses_one_cell_blocks(self):
+        """Test that boards smaller than the budget are not upscaled."""
+        engine = GameEngine(board_width=10, board_height=8)
+        minimap = Minimap(engine.board, glyphs='half')
+        
+        assert (minimap.block_width, minimap.block_height) == (1, 1)
+        assert (minimap.columns, minimap.rows) == (10, 4)
+    
+    def test_half_block_glyphs(self):
+        """Test that snake cells light the right half-blocks."""
+        engine = GameEngine(board_width=10, board_height=10)
+        engine.snake.body = [(2, 0), (2, 1), (3, 1)]
+        engine.food.place(engine.board, (9, 9))
+        minimap = Minimap(engine.board, glyphs='half')
+        
+        row = strip_ansi(minimap.draw(engine)[1])
+        
+        assert row[1 + 2] == '█'
+        assert row[1 + 3] == '▄'
+    
+    def test_unknown_glyphs_rejected(self):
+        """Test that an unknown glyph style raises."""
+        with pytest.raises(ValueError):
+            Minimap(GameEngine().board, glyphs='ascii')
+    
+    def test_incremental_matches_rebuild(self):
+        """Test that incremental updates always equal a fresh count."""
+        random.seed(5)
+        engine = GameEngine(board_width=60, board_height=40)
+        autopilot = Autopilot(engine)
+        minimap = Minimap(engine.board, columns=8, rows=4)
+        
+        for tick in range(600):
+            if engine.get_state() != GameState.RUNNING:
+                break
+            autopilot.step()
+            engine.tick()
+            # Simulate skipped frames by only updating every few ticks
+            if tick % 2 == 0:
+                minimap.update(engine.snake)
+                assert (list(minimap._counts), bytes(minimap._bits)) == \
+                    fresh_counts(minimap, engine.snake)
+        
+        assert minimap.updates > minimap.rebuilds == 1
+    
+    def test_rebuilds_after_restart_and_body_change(self):
+        """Test that a new snake or a rewritten body triggers a recount."""
+        engine = GameEngine(board_width=30, board_height=30)
+        minimap = Minimap(engine.board)
+        minimap.update(engine.snake)
+        
+        engine.restart()
+        minimap.update(engine.snake)
+        engine.snake.body = [(1, 1), (0, 1), (29, 1)]
+        minimap.update(engine.snake)
+        
+        assert minimap.rebuilds == 3
+        assert (list(minimap._counts), bytes(minimap._bits)) == \
+            fresh_counts(minimap, engine.snake)
+    
+    def test_drawn_beside_viewport(self):
+        """Test that the renderer places the minimap right of the board."""
+        engine = GameEngine(board_width=300, board_height=300)
+        minimap = Minimap(engine.board, columns=10, rows=5)
+        backend = MemoryBackend(size=(60, 30))
+        renderer = Renderer(backend=backend, minimap=minimap)
+        
+        renderer.render(engine)
+        
+        lines = backend.text().split("\n")
+        top = next(line for line in lines if line.startswith("╔"))
+        assert top.endswith("┌" + "─" * 10 + "┐")
+        assert len(top) == 60
+        assert renderer.get_viewport(engine.board)[0] == 60 - 2 - 12 - 2
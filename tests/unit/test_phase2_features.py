@@ -226,3 +226,13 @@ class TestInputHandlerPause:
         assert handler.should_pause('r') is False
         assert handler.should_pause('w') is False
         assert handler.should_pause('a') is False
+    
+    def test_rewind_keys(self):
+        """Test that B rewinds and F fast-forwards, without clashing."""
+        from src.snake_game.input_handler import InputHandler
+        handler = InputHandler()
+        
+        assert handler.should_rewind('b') and handler.should_rewind('B')
+        assert handler.should_fast_forward('f') and handler.should_fast_forward('F')
+        assert not handler.should_rewind('p')
+        assert not handler.should_fast_forward('r')
@@ -0,0 +1,205 @@
+"""Unit tests for render backends."""
+
+import io
+import threading
+
+import pytest
+from src.snake_game.game_engine import GameEngine
+from src.snake_game.latency import LatencyTracker
+from src.snake_game.render_backends import (
+    CLEAR_SCREEN, AnsiBackend, CursesBackend, MemoryBackend, NullBackend, ThreadedBackend,
+    create_backend, strip_ansi,
+)
+from src.snake_game.renderer import Renderer
+from src.snake_game.renderer import Colors
+
+
+class FakeScreen:
+    """curses window stand-in recording drawn text, 5 columns wide."""
+    
+    width = 5
+    
+    def __init__(self, error):
+        self.error = error
+        self.cells = {}
+        self.refreshes = 0
+    
+    def erase(self):
+        self.cells.clear()
+    
+    def addstr(self, y, x, text, attr):
+        for offset, char in enumerate(text):
+            if x + offset >= self.width:
+                raise self.error('off screen')
+            self.cells[(x + offset, y)] = (char, attr)
+    
+    def refresh(self):
+        self.refreshes += 1
+    
+    def row(self, y):
+        return ''.join(self.cells.get((x, y), (' ', 0))[0] for x in range(self.width))
+
+
+class GatedBackend(MemoryBackend):
+    """Memory backend whose presents block until released."""
+    
+    def __init__(self):
+        super().__init__()
+        self.started = threading.Semaphore(0)
+        self.gate = threading.Event()
+        self.closed = False
+    
+    def present(self, lines):
+        self.started.release()
+        assert self.gate.wait(5)
+        super().present(lines)
+    
+    def close(self):
+        self.closed = True
+
+
+class FailingBackend(MemoryBackend):
+    """Memory backend that cannot present."""
+    
+    def present(self, lines):
+        raise OSError('terminal gone')
+
+
+class TestRenderBackends:
+    """Test suite for render backends."""
+    
+    def test_strip_ansi(self):
+        """Test that color codes are removed."""
+        assert strip_ansi(f"{Colors.GREEN}@{Colors.RESET} x") == "@ x"
+    
+    def test_ansi_backend_single_write(self):
+        """Test that a frame is written in one piece after a screen clear."""
+        stream = io.StringIO()
+        AnsiBackend(stream).present(["ab", "cd"])
+        
+        assert stream.getvalue() == CLEAR_SCREEN + "ab\ncd\n"
+    
+    def test_memory_backend_bounded(self):
+        """Test that only the newest frames are kept, but all are counted."""
+        backend = MemoryBackend(max_frames=2)
+        for i in range(5):
+            backend.present([str(i)])
+        
+        assert list(backend.frames) == ["3", "4"]
+        assert backend.frame_count == 5
+        assert backend.last_frame == "4"
+    
+    def test_null_backend_does_not_compose(self):
+        """Test that the null backend opts out of frame composition."""
+        assert not NullBackend.composes_frames
+        NullBackend().present(["ignored"])
+    
+    def test_create_backend(self):
+        """Test creating backends by name."""
+        assert isinstance(create_backend('memory'), MemoryBackend)
+        with pytest.raises(ValueError):
+            create_backend('braille')
+    
+    def test_curses_backend_translates_colors(self):
+        """Test that ANSI codes become attributes and rows are clipped."""
+        curses = pytest.importorskip('curses')
+        screen = FakeScreen(curses.error)
+        backend = CursesBackend(screen)
+        
+        backend.present([f"a{Colors.BOLD}b{Colors.RESET}c", "\nlonger row"])
+        
+        assert screen.row(0) == "abc  "
+        assert screen.cells[(1, 0)] == ('b', curses.A_BOLD)
+        assert screen.cells[(2, 0)] == ('c', 0)
+        assert screen.row(1) == "     "
+        assert screen.row(2) == "longe"
+        assert screen.refreshes == 1
+
+
+class TestThreadedBackend:
+    """Test suite for ThreadedBackend class."""
+    
+    def test_frames_reach_the_wrapped_backend(self):
+        """Test that published frames are displayed after a flush."""
+        inner = MemoryBackend(size=(80, 24))
+        backend = ThreadedBackend(inner)
+        
+        backend.present(['a', 'b'])
+        assert backend.flush(5)
+        backend.present(['c'])
+        backend.close()
+        
+        assert list(inner.frames) == ['a\nb', 'c']
+        assert (backend.published, backend.displayed, backend.superseded) == (2, 2, 0)
+        assert backend.get_size() == (80, 24)
+    
+    def test_latest_frame_wins_while_writing(self):
+        """Test that frames published during a slow write replace each other."""
+        inner = GatedBackend()
+        backend = ThreadedBackend(inner)
+        
+        backend.present(['first'])
+        assert inner.started.acquire(timeout=5)
+        lines = ['second']
+        backend.present(lines)
+        backend.present(['third'])
+        backend.present(['latest'])
+        # Published frames are copies; later edits are not displayed
+        lines[0] = 'edited'
+        assert not backend.flush(0.01)
+        
+        inner.gate.set()
+        backend.close()
+        
+        assert list(inner.frames) == ['first', 'latest']
+        assert (backend.published, backend.displayed, backend.superseded) == (4, 2, 2)
+        assert inner.closed
+    
+    def test_slow_frame_not_credited_with_later_keys(self):
+        """Test that keys ticked during a slow write wait for their own frame."""
+        tracker = LatencyTracker()
+        inner = GatedBackend()
+        backend = ThreadedBackend(inner, latency=tracker)
+        
+        tracker.key_applied(tracker.key_read())
+        tracker.tick_completed()
+        backend.present(['tick 1'])
+        assert inner.started.acquire(timeout=5)
+        
+        # A key reaches the next tick while 'tick 1' is still being written
+        tracker.key_applied(tracker.key_read())
+        tracker.tick_completed()
+        inner.gate.set()
+        assert backend.flush(5)
+        assert tracker.histograms[0]['total'].count == 1
+        
+        backend.present(['tick 2'])
+        backend.close()
+        assert tracker.histograms[0]['total'].count == 2
+    
+    def test_errors_surface_in_the_caller(self):
+        """Test that a failing write is raised on the next publish."""
+        backend = ThreadedBackend(FailingBackend())
+        backend.present(['x'])
+        
+        with pytest.raises(OSError):
+            backend.flush(5)
+        with pytest.raises(OSError):
+            backend.present(['y'])
+        with pytest.raises(OSError):
+            backend.close()
+    
+    def test_renderer_draws_through_the_thread(self):
+        """Test the renderer publishing to a threaded backend."""
+        inner = MemoryBackend()
+        renderer = Renderer(backend=ThreadedBackend(inner))
+        renderer.render(GameEngine(board_width=10, board_height=10), high_score=5)
+        renderer.clear_screen()
+        renderer.backend.close()
+        
+        assert 'High Score: 5' in inner.text()
+        assert inner.clears == 1
+        
+        null = ThreadedBackend(NullBackend())
+        assert not null.composes_frames
+        null.close()
@@ -0,0 +1,207 @@
+"""Unit tests for the Renderer class."""
+
+import pytest
+from src.snake_game.game_engine import GameEngine
+from src.snake_game.render_backends import AnsiBackend, MemoryBackend, NullBackend
+from src.snake_game.renderer import Renderer
+
+
+class FakeClock:
+    """Manually advanced clock returning seconds."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+
+class SlowStream:
+    """Terminal stream whose flush takes ``delay`` seconds of fake time."""
+    
+    def __init__(self, clock: FakeClock, delay: float):
+        self.clock = clock
+        self.delay = delay
+        self.frames = 0
+    
+    def write(self, text: str) -> int:
+        return len(text)
+    
+    def flush(self) -> None:
+        self.frames += 1
+        self.clock.now += self.delay
+
+
+@pytest.fixture
+def engine():
+    """A small running game."""
+    return GameEngine(board_width=10, board_height=10)
+
+
+def run_ticks(renderer, engine, clock, ticks, tick_duration):
+    """Render once per tick, advancing the clock to each tick start."""
+    start = clock.now
+    for tick in range(1, ticks + 1):
+        renderer.render(engine)
+        clock.now = max(clock.now, start + tick * tick_duration)
+
+
+class TestRenderer:
+    """Test suite for Renderer class."""
+    
+    def test_frame_written_in_one_flush(self, engine, capsys):
+        """Test that a frame contains the whole board."""
+        renderer = Renderer()
+        
+        assert renderer.render(engine, high_score=30)
+        
+        out = capsys.readouterr().out
+        assert out.startswith('\033[2J\033[H')
+        assert 'High Score: 30' in out
+        assert out.count('║') == 2 * engine.board.height
+    
+    def test_fast_terminal_never_skips(self, engine):
+        """Test that writes within budget render every frame."""
+        clock = FakeClock()
+        stream = SlowStream(clock, delay=0.005)
+        renderer = Renderer(frame_budget=0.03, clock=clock,
+                            backend=AnsiBackend(stream))
+        
+        run_ticks(renderer, engine, clock, ticks=20, tick_duration=0.0625)
+        
+        assert renderer.frames_rendered == 20
+        assert renderer.frames_dropped == 0
+        assert not renderer.backpressured
+    
+    def test_slow_terminal_skips_frames(self, engine):
+        """Test that writes over budget skip frames but keep some drawn."""
+        clock = FakeClock()
+        stream = SlowStream(clock, delay=0.1)
+        renderer = Renderer(frame_budget=0.03, clock=clock,
+                            backend=AnsiBackend(stream))
+        
+        run_ticks(renderer, engine, clock, ticks=20, tick_duration=0.0625)
+        
+        assert renderer.backpressured
+        assert renderer.frames_dropped > 0
+        assert renderer.frames_rendered == stream.frames
+        assert renderer.frames_rendered + renderer.frames_dropped == 20
+        # The terminal still sees regular updates
+        assert renderer.frames_rendered >= 5
+    
+    def test_recovers_when_terminal_speeds_up(self, engine):
+        """Test that skipping stops once writes are fast again."""
+        clock = FakeClock()
+        stream = SlowStream(clock, delay=0.1)
+        renderer = Renderer(frame_budget=0.03, clock=clock,
+                            backend=AnsiBackend(stream))
+        run_ticks(renderer, engine, clock, ticks=10, tick_duration=0.0625)
+        
+        stream.delay = 0.001
+        run_ticks(renderer, engine, clock, ticks=10, tick_duration=0.0625)
+        dropped = renderer.frames_dropped
+        run_ticks(renderer, engine, clock, ticks=10, tick_duration=0.0625)
+        
+        assert not renderer.backpressured
+        assert renderer.frames_dropped == dropped
+    
+    def test_paused_and_forced_frames_never_skipped(self, engine):
+        """Test that frames no later frame would replace are always drawn."""
+        clock = FakeClock()
+        renderer = Renderer(frame_budget=0.03, clock=clock,
+                            backend=AnsiBackend(SlowStream(clock, delay=0.1)))
+        renderer.render(engine)
+        renderer.render(engine)
+        assert renderer.backpressured
+        
+        assert renderer.render(engine, force=True)
+        engine.pause()
+        assert renderer.render(engine)
+    
+    def test_memory_backend_captures_frames(self, engine):
+        """Test rendering into memory instead of the terminal."""
+        backend = MemoryBackend()
+        renderer = Renderer(backend=backend)
+        engine.pause()
+        
+        renderer.render(engine, high_score=10)
+        renderer.display_game_over(40)
+        
+        assert backend.frame_count == 2
+        assert '*** PAUSED ***' in backend.text(0)
+        assert 'Final Score: 40' in backend.text()
+    
+    def test_null_backend_skips_composition(self, engine, monkeypatch):
+        """Test that a null backend never draws the board."""
+        renderer = Renderer(backend=NullBackend())
+        monkeypatch.setattr(renderer, '_draw_board', None)
+        
+        assert renderer.render(engine)
+        assert renderer.frames_rendered == 1
+
+
+class TestViewport:
+    """Test suite for viewport rendering of boards larger than the display."""
+    
+    @staticmethod
+    def board_rows(backend):
+        """Get the drawn board rows (between the borders) as plain text."""
+        lines = backend.text().split("\n")
+        top = next(i for i, line in enumerate(lines) if line.startswith("╔"))
+        bottom = next(i for i, line in enumerate(lines) if line.startswith("╚"))
+        return [line[1:-1] for line in lines[top + 1:bottom]]
+    
+    def test_board_that_fits_is_drawn_whole(self, engine):
+        """Test that a small board is drawn completely without a camera."""
+        backend = MemoryBackend(size=(80, 40))
+        Renderer(backend=backend).render(engine)
+        
+        rows = self.board_rows(backend)
+        assert len(rows) == engine.board.height
+        assert all(len(row) == engine.board.width for row in rows)
+    
+    def test_viewport_bounded_by_display(self):
+        """Test that a huge board only draws what fits on the display."""
+        engine = GameEngine(board_width=500, board_height=500)
+        backend = MemoryBackend(size=(40, 20))
+        renderer = Renderer(backend=backend)
+        
+        renderer.render(engine)
+        
+        rows = self.board_rows(backend)
+        assert len(rows) == 20 - 8
+        assert all(len(row) == 40 - 2 for row in rows)
+        assert sum(row.count("@") for row in rows) == 1
+    
+    def test_camera_follows_head_across_wrap(self):
+        """Test that the head stays in view as the snake wraps around."""
+        engine = GameEngine(board_width=100, board_height=100)
+        backend = MemoryBackend(size=(22, 20))
+        renderer = Renderer(backend=backend)
+        margin = 20 // 4
+        
+        for _ in range(150):
+            engine.tick()
+            renderer.render(engine)
+            row = next(row for row in self.board_rows(backend) if "@" in row)
+            column = row.index("@")
+            assert margin <= column <= 20 - 1 - margin
+        
+        # The head crossed the right edge, so the viewport straddles it
+        assert engine.snake.get_head_position()[0] < 20
+        assert renderer.camera[0] + 20 > engine.board.width
+    
+    def test_camera_recenters_on_restart(self):
+        """Test that a restarted game gets a centered camera."""
+        engine = GameEngine(board_width=100, board_height=100)
+        backend = MemoryBackend(size=(22, 20))
+        renderer = Renderer(backend=backend)
+        for _ in range(30):
+            engine.tick()
+            renderer.render(engine)
+        
+        engine.restart()
+        renderer.render(engine)
+        
+        head_x, head_y = engine.snake.get_head_position()
+        assert renderer.camera == (head_x - 10, head_y - 6)
@@ -0,0 +1,180 @@
+"""Unit tests for the replay recorder, writer and memory-mapped archive."""
+
+import random
+
+import pytest
+from src.snake_game.autopilot import Autopilot
+from src.snake_game.game_engine import GameEngine
+from src.snake_game.level_map import parse_map
+from src.snake_game.replay import GameRecorder, ReplayArchive, ReplayWriter
+from src.snake_game.types import Direction, GameState
+
+ROOM = (
+    "############\n"
+    "#..........#\n"
+    "#..######..#\n"
+    "#..........#\n"
+    "#....S.....#\n"
+    "#..........#\n"
+    "#..##..##..#\n"
+    "#..........#\n"
+    "############\n"
+)
+
+
+def snapshot(engine):
+    """Capture an engine's game state for comparison."""
+    return (list(engine.snake.cells), engine.snake.direction,
+            engine.snake.grow_pending, engine.food.get_cell(),
+            sorted(engine.foods), engine.score, engine.state,
+            engine.collision, engine.tick_count, engine.spawn_count,
+            engine.state_hash())
+
+
+def play(engine, seed, max_ticks=400, keyframe_interval=16):
+    """Play a game with a jittery autopilot, recording every tick.
+    
+    Returns:
+        The recorder and the snapshot after every tick (index = tick)
+    """
+    rng = random.Random(seed)
+    autopilot = Autopilot(engine)
+    recorder = GameRecorder(engine, keyframe_interval=keyframe_interval)
+    snapshots = [snapshot(engine)]
+    while engine.state == GameState.RUNNING and engine.tick_count < max_ticks:
+        if rng.random() < 0.2:
+            engine.handle_input(rng.choice(list(Direction)))
+        else:
+            autopilot.step()
+        engine.tick()
+        recorder.capture()
+        snapshots.append(snapshot(engine))
+    return recorder, snapshots
+
+
+@pytest.fixture
+def archive(tmp_path):
+    """Archive of three recorded games, with their live snapshots."""
+    games = [
+        play(GameEngine(12, 10, food_count=3, food_seed=7), seed=1),
+        play(GameEngine(16, 16, food_seed=8), seed=2, keyframe_interval=5),
+        play(GameEngine(level_map=parse_map(ROOM), food_count=2,
+                        food_seed=9), seed=3),
+    ]
+    path = str(tmp_path / "games.rpl")
+    with ReplayWriter(path) as writer:
+        for recorder, _ in games:
+            writer.add(recorder)
+    with ReplayArchive(path) as opened:
+        yield opened, [snapshots for _, snapshots in games]
+
+
+class TestReplayArchive:
+    """Test suite for the replay archive."""
+    
+    def test_restore_matches_live_game(self, archive):
+        """Test that every tick of every game restores exactly."""
+        opened, games = archive
+        assert len(opened) == len(games)
+        for game, snapshots in enumerate(games):
+            for tick, expected in enumerate(snapshots):
+                assert snapshot(opened.restore(game, tick)) == expected
+    
+    def test_info_reads_header(self, archive):
+        """Test that the summary reports size, length and final score."""
+        opened, games = archive
+        info = opened.info(2)
+        assert (info.width, info.height) == (12, 9)
+        assert info.start == 0
+        assert info.ticks == len(games[2]) - 1
+        assert info.score == games[2][-1][5]
+    
+    def test_restored_engine_keeps_playing(self, archive):
+        """Test that a restored game continues exactly like the original."""
+        opened, games = archive
+        engine = opened.restore(1, 3)
+        while engine.tick_count < len(games[1]) - 1:
+            engine.tick()
+            recorded = games[1][engine.tick_count]
+            if recorded[1] != engine.snake.direction:
+                break
+            assert snapshot(engine)[3:] == recorded[3:]
+    
+    def test_verify_accepts_faithful_replays(self, archive):
+        """Test that replays agree with every recorded keyframe hash."""
+        opened, games = archive
+        for game in range(len(games)):
+            assert opened.verify(game) is None
+    
+    def test_verify_reports_desync(self, archive, monkeypatch):
+        """Test that a replay whose food drifts from the recording is caught."""
+        opened, _ = archive
+        original = GameEngine.__init__
+        
+        def reseeded(self, *args, **kwargs):
+            kwargs['food_seed'] += 1
+            original(self, *args, **kwargs)
+        
+        monkeypatch.setattr(GameEngine, '__init__', reseeded)
+        assert opened.verify(1) is not None
+    
+    def test_restore_out_of_range(self, archive):
+        """Test that unknown games and ticks raise IndexError."""
+        opened, games = archive
+        with pytest.raises(IndexError):
+            opened.restore(3, 0)
+        with pytest.raises(IndexError):
+            opened.restore(0, len(games[0]))
+    
+    def test_recording_started_mid_game(self, tmp_path):
+        """Test that only the ticks after the recorder was attached exist."""
+        engine = GameEngine(12, 10, food_seed=4)
+        for _ in range(5):
+            engine.tick()
+        recorder = GameRecorder(engine)
+        snapshots = {}
+        for _ in range(3):
+            engine.tick()
+            recorder.capture()
+            snapshots[engine.tick_count] = snapshot(engine)
+        path = str(tmp_path / "late.rpl")
+        with ReplayWriter(path) as writer:
+            writer.add(recorder)
+        
+        with ReplayArchive(path) as opened:
+            info = opened.info(0)
+            assert (info.start, info.ticks) == (5, 3)
+            for tick in range(5):
+                with pytest.raises(IndexError):
+                    opened.restore(0, tick)
+            for tick, expected in snapshots.items():
+                assert snapshot(opened.restore(0, tick)) == expected
+            assert opened.verify(0) is None
+    
+    def test_capture_after_game_over_adds_no_keyframe(self):
+        """Test that capturing a finished game again keeps one keyframe."""
+        engine = GameEngine(level_map=parse_map(ROOM), food_seed=4)
+        recorder = GameRecorder(engine)
+        for _ in range(20):
+            engine.tick()
+            recorder.capture()
+        assert engine.state == GameState.GAME_OVER
+        keyframes = len(recorder.keyframes)
+        
+        recorder.capture()
+        recorder.capture()
+        
+        assert len(recorder.keyframes) == keyframes
+        assert recorder.keyframe_ticks[-1] == engine.tick_count
+    
+    def test_rejects_other_files(self, tmp_path):
+        """Test that a file without the archive header is refused."""
+        path = tmp_path / "bogus.rpl"
+        path.write_bytes(b"not a replay archive at all")
+        with pytest.raises(ValueError):
+            ReplayArchive(str(path))
+    
+    def test_recorder_needs_food_seed(self):
+        """Test that unseeded games cannot be recorded."""
+        with pytest.raises(ValueError):
+            GameRecorder(GameEngine())
@@ -0,0 +1,143 @@
+"""Unit tests for the RewindBuffer class."""
+
+import random
+
+import pytest
+from src.snake_game.autopilot import Autopilot
+from src.snake_game.game_engine import GameEngine
+from src.snake_game.rewind import RewindBuffer
+from src.snake_game.types import Direction, GameState
+
+
+def snapshot(engine):
+    """Capture an engine's game state for comparison."""
+    return (list(engine.snake.cells), bytes(engine.snake.occupancy),
+            engine.snake.direction, engine.snake.grow_pending,
+            engine.food.get_cell(), sorted(engine.foods),
+            bytes(engine.foods.mask), engine.score, engine.state,
+            engine.collision, engine.tick_count, engine.spawn_count,
+            engine.state_hash())
+
+
+def play(engine, buffer, seed, max_ticks=300):
+    """Play with a jittery autopilot through the buffer.
+    
+    Returns:
+        The snapshot after every tick (index = tick)
+    """
+    rng = random.Random(seed)
+    autopilot = Autopilot(engine)
+    snapshots = [snapshot(engine)]
+    while engine.state == GameState.RUNNING and engine.tick_count < max_ticks:
+        if rng.random() < 0.2:
+            engine.handle_input(rng.choice(list(Direction)))
+        else:
+            autopilot.step()
+        buffer.tick()
+        snapshots.append(snapshot(engine))
+    return snapshots
+
+
+class TestRewindBuffer:
+    """Test suite for RewindBuffer class."""
+    
+    @pytest.mark.parametrize('food_count', [1, 4])
+    def test_rewind_and_fast_forward_every_tick(self, food_count):
+        """Test that each tick rewinds and replays to the recorded state."""
+        random.seed(food_count)
+        engine = GameEngine(10, 8, food_count=food_count)
+        buffer = RewindBuffer(engine)
+        snapshots = play(engine, buffer, seed=food_count)
+        
+        for tick in range(len(snapshots) - 2, -1, -1):
+            assert buffer.rewind() == 1
+            assert snapshot(engine) == snapshots[tick]
+        assert buffer.rewind() == 0
+        
+        for tick in range(1, len(snapshots)):
+            assert buffer.fast_forward() == 1
+            assert snapshot(engine) == snapshots[tick]
+        assert buffer.fast_forward() == 0
+    
+    def test_board_full_promotes_extra_food(self):
+        """Test that rewinding restores food promoted on a full board."""
+        engine = GameEngine(4, 1, food_count=2)
+        engine.snake.body = [(1, 0), (0, 0)]
+        engine.food.place(engine.board, (2, 0))
+        engine.foods.clear()
+        engine.foods.add(3)
+        engine.snake.direction = Direction.RIGHT
+        engine.snake.grow()
+        engine.rehash()
+        buffer = RewindBuffer(engine)
+        before = snapshot(engine)
+        
+        buffer.tick()
+        assert engine.food.get_cell() == 3
+        assert len(engine.foods) == 0
+        buffer.rewind()
+        assert snapshot(engine) == before
+    
+    def test_capacity_bounds_history(self):
+        """Test that only the newest ``capacity`` ticks can be rewound."""
+        engine = GameEngine(30, 30)
+        buffer = RewindBuffer(engine, capacity=5)
+        snapshots = [snapshot(engine)]
+        for _ in range(12):
+            buffer.tick()
+            snapshots.append(snapshot(engine))
+        
+        assert buffer.rewind(100) == 5
+        assert snapshot(engine) == snapshots[7]
+        assert buffer.fast_forward(2) == 2
+        assert snapshot(engine) == snapshots[9]
+    
+    def test_new_tick_discards_redo_history(self):
+        """Test that playing after a rewind replaces the rewound ticks."""
+        engine = GameEngine(30, 30)
+        buffer = RewindBuffer(engine)
+        for _ in range(6):
+            buffer.tick()
+        buffer.rewind(3)
+        engine.handle_input(Direction.UP)
+        buffer.tick()
+        
+        assert (buffer.behind, buffer.ahead) == (4, 0)
+        assert buffer.fast_forward() == 0
+        buffer.rewind()
+        assert engine.snake.direction == Direction.RIGHT
+    
+    def test_rewind_revives_ended_game_but_keeps_pause(self):
+        """Test state handling: game over is undone, pause is kept."""
+        engine = GameEngine(10, 10)
+        engine.snake.body = [(5, 5), (4, 5), (4, 4), (5, 4), (6, 4), (6, 5),
+                             (6, 6)]
+        engine.snake.direction = Direction.RIGHT
+        buffer = RewindBuffer(engine)
+        buffer.tick()
+        assert engine.state == GameState.GAME_OVER
+        
+        buffer.rewind()
+        assert engine.state == GameState.RUNNING
+        assert engine.collision is None
+        engine.pause()
+        buffer.fast_forward()
+        buffer.rewind()
+        assert engine.state == GameState.RUNNING
+        
+        engine.pause()
+        assert buffer.rewind() == 0
+        assert engine.state == GameState.PAUSED
+    
+    def test_restart_clears_history(self):
+        """Test that a restarted game cannot rewind into the old one."""
+        engine = GameEngine(30, 30)
+        buffer = RewindBuffer(engine)
+        buffer.tick()
+        engine.restart()
+        assert (buffer.behind, buffer.ahead) == (0, 0)
+    
+    def test_rejects_empty_capacity(self):
+        """Test that a buffer needs room for at least one tick."""
+        with pytest.raises(ValueError):
+            RewindBuffer(GameEngine(), capacity=0)
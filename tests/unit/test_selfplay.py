@@ -0,0 +1,200 @@
+"""Unit tests for the self-play sample pipeline."""
+
+import pickle
+import random
+
+import pytest
+from src.snake_game.autopilot import Autopilot
+from src.snake_game.game_engine import GameEngine
+from src.snake_game.replay import DIRECTIONS
+from src.snake_game.selfplay import (BODY, EMPTY, FOOD, HEAD, SampleRing,
+                                     SelfPlayPipeline, encode_observation,
+                                     play_step)
+from src.snake_game.types import GameState
+
+
+def fill(ring, count, start=0):
+    """Publish samples whose fields all encode their sequence number."""
+    for i in range(start, start + count):
+        slot = ring.reserve()
+        ring.observation(slot)[:] = bytes([i % 256]) * ring.obs_size
+        ring.actions[slot] = i % 256
+        ring.rewards[slot] = float(i)
+        ring.dones[slot] = i % 2
+        ring.commit()
+
+
+class TestSampleRing:
+    """Test suite for SampleRing class."""
+    
+    def test_read_views_published_samples(self):
+        """Test that samples come back in order, viewed in place."""
+        ring = SampleRing(8, 3)
+        try:
+            assert ring.read(8) is None
+            fill(ring, 5)
+            batch = ring.read(4)
+            
+            assert len(batch) == 4
+            assert list(batch.actions) == [0, 1, 2, 3]
+            assert list(batch.rewards) == [0.0, 1.0, 2.0, 3.0]
+            assert list(batch.dones) == [0, 1, 0, 1]
+            assert [list(row) for row in batch.observations.tolist()] == [
+                [i] * 3 for i in range(4)
+            ]
+            
+            # Views alias the ring
+            ring.actions[1] = 99
+            assert batch.actions[1] == 99
+            batch.release()
+            ring.release(4)
+            assert len(ring) == 1
+        finally:
+            ring.close()
+            ring.unlink()
+    
+    def test_reads_stop_at_the_end_of_the_ring(self):
+        """Test that a wrapped run is returned as two batches."""
+        ring = SampleRing(4, 1)
+        try:
+            fill(ring, 3)
+            ring.release(3)
+            fill(ring, 3, start=3)
+            
+            first = ring.read(4)
+            assert list(first.actions) == [3]
+            first.release()
+            ring.release(1)
+            second = ring.read(4)
+            assert list(second.actions) == [4, 5]
+            second.release()
+        finally:
+            ring.close()
+            ring.unlink()
+    
+    def test_full_ring_blocks_until_stopped(self):
+        """Test flow control: a full ring stalls its producer."""
+        ring = SampleRing(2, 1)
+        try:
+            fill(ring, 2)
+            ring.stop()
+            
+            assert ring.reserve() == -1
+            assert ring.stalls == 1
+            assert ring.written == 2
+        finally:
+            ring.close()
+            ring.unlink()
+    
+    def test_finished_after_last_sample_released(self):
+        """Test that a ring is finished only once drained."""
+        ring = SampleRing(4, 1)
+        try:
+            fill(ring, 1)
+            ring.finish()
+            assert not ring.finished
+            ring.release(1)
+            assert ring.finished
+        finally:
+            ring.close()
+            ring.unlink()
+    
+    def test_pickling_attaches_to_the_same_memory(self):
+        """Test that an unpickled ring shares the original's samples."""
+        ring = SampleRing(4, 2)
+        try:
+            other = pickle.loads(pickle.dumps(ring))
+            assert other.name == ring.name
+            fill(other, 1, start=7)
+            other.close()
+            
+            assert len(ring) == 1
+            assert ring.actions[0] == 7
+        finally:
+            ring.close()
+            ring.unlink()
+    
+    def test_invalid_sizes(self):
+        """Test that empty rings are rejected."""
+        with pytest.raises(ValueError):
+            SampleRing(0, 4)
+        with pytest.raises(ValueError):
+            SampleRing(4, 0)
+
+
+class TestSelfPlay:
+    """Test suite for observation encoding and self-play steps."""
+    
+    def test_encode_observation(self):
+        """Test the cell values of an encoded board."""
+        engine = GameEngine(board_width=8, board_height=6, food_count=3)
+        out = bytearray(engine.board.size)
+        encode_observation(engine, out)
+        
+        cells = list(engine.snake.cells)
+        foods = [engine.food.get_cell()] + list(engine.foods)
+        assert out[cells[0]] == HEAD
+        assert all(out[cell] == BODY for cell in cells[1:])
+        assert all(out[cell] == FOOD for cell in foods)
+        assert out.count(EMPTY) == engine.board.size - len(cells) - len(foods)
+    
+    def test_step_rewards_food(self):
+        """Test that eating is rewarded and the move is recorded."""
+        engine = GameEngine(board_width=10, board_height=10)
+        x, y = engine.snake.get_head_position()
+        engine.food.place(engine.board, ((x + 1) % 10, y))
+        engine.rehash()
+        autopilot = Autopilot(engine)
+        
+        action, reward, done = play_step(engine, autopilot, random.Random(0),
+                                         0.0, bytearray(100))
+        
+        assert DIRECTIONS[action] == engine.snake.direction
+        assert reward == 1.0
+        assert not done
+    
+    def test_step_restarts_finished_games(self):
+        """Test that the sample ending a game restarts it."""
+        random.seed(3)
+        engine = GameEngine(board_width=5, board_height=5)
+        autopilot = Autopilot(engine)
+        rng = random.Random(3)
+        out = bytearray(25)
+        
+        for _ in range(5000):
+            _, reward, done = play_step(engine, autopilot, rng, 0.5, out)
+            if done:
+                break
+        
+        assert done
+        assert engine.state == GameState.RUNNING
+        assert engine.tick_count == 0
+        assert reward <= 1.0
+
+
+class TestSelfPlayPipeline:
+    """Test suite for SelfPlayPipeline class."""
+    
+    def test_collects_every_sample(self):
+        """Test that all workers' samples reach the consumer."""
+        with SelfPlayPipeline(workers=2, samples=300, board_size=6,
+                              capacity=64) as pipeline:
+            count = 0
+            for batch in pipeline.batches(32):
+                assert len(batch) <= 32
+                assert all(action < len(DIRECTIONS) for action in batch.actions)
+                assert all(list(row).count(HEAD) == 1
+                           for row in batch.observations.tolist())
+                count += len(batch)
+        
+        assert count == 600
+        assert pipeline.rings == []
+    
+    def test_close_stops_blocked_workers(self):
+        """Test that stopping early releases workers stalled on a full ring."""
+        with SelfPlayPipeline(workers=1, samples=100000, board_size=6,
+                              capacity=16) as pipeline:
+            for batch in pipeline.batches(4):
+                break
+        
+        assert all(not process.is_alive() for process in pipeline._processes)
@@ -1,6 +1,7 @@
 """Unit tests for the Snake class."""
 
 import pytest
+from src.snake_game.game_board import GameBoard
 from src.snake_game.snake import Snake
 from src.snake_game.types import Direction
 
@@ -129,3 +130,57 @@ class TestSnake:
         assert new_body[0] == (11, 10)
         # Second segment should be at old head position
         assert new_body[1] == initial_body[0]
+    
+    def test_snake_cells_are_packed(self):
+        """Test that body segments are stored as packed board cells."""
+        board = GameBoard(20, 20)
+        snake = Snake((10, 10), initial_length=3, board=board)
+        
+        assert list(snake.cells) == [
+            board.to_cell(10, 10),
+            board.to_cell(9, 10),
+            board.to_cell(8, 10),
+        ]
+        assert snake.get_head_cell() == board.to_cell(10, 10)
+    
+    def test_snake_occupancy_tracks_body(self):
+        """Test that the occupancy grid follows the body as it moves."""
+        board = GameBoard(20, 20)
+        snake = Snake((10, 10), initial_length=3, board=board)
+        old_tail = board.to_cell(8, 10)
+        
+        snake.move(Direction.RIGHT)
+        
+        assert snake.occupancy[board.to_cell(11, 10)] == 1
+        assert snake.occupancy[old_tail] == 0
+        assert sum(snake.occupancy) == 3
+    
+    def test_snake_move_wraps_on_board(self):
+        """Test that moving off an edge wraps the head around."""
+        board = GameBoard(10, 10)
+        snake = Snake((9, 4), initial_length=3, board=board)
+        
+        snake.move(Direction.RIGHT)
+        
+        assert snake.get_head_position() == (0, 4)
+    
+    def test_snake_body_view_write_through(self):
+        """Test that edits to the body view update the packed body."""
+        board = GameBoard(10, 10)
+        snake = Snake((5, 5), initial_length=3, board=board)
+        
+        snake.body[0] = (5, 4)
+        snake.body.append((2, 5))
+        
+        assert snake.get_body() == [(5, 4), (4, 5), (3, 5), (2, 5)]
+        assert snake.occupancy[board.to_cell(5, 5)] == 0
+        assert snake.occupancy[board.to_cell(2, 5)] == 1
+    
+    def test_snake_body_assignment_wraps_positions(self):
+        """Test that assigned positions outside the board are wrapped."""
+        board = GameBoard(10, 10)
+        snake = Snake((5, 5), initial_length=3, board=board)
+        
+        snake.body = [(-1, 3), (-2, 3), (-3, 3)]
+        
+        assert snake.get_body() == [(9, 3), (8, 3), (7, 3)]
@@ -0,0 +1,132 @@
+"""Unit tests for streaming game statistics."""
+
+import json
+import random
+import statistics
+
+import pytest
+from src.snake_game.game_engine import GameEngine
+from src.snake_game.level_map import parse_map
+from src.snake_game.stats import (
+    BOARD_FULL, OutcomeStats, StreamingStats, bucket_bounds, bucket_of,
+)
+from src.snake_game.types import Direction
+
+
+class TestStreamingStats:
+    """Test suite for StreamingStats class."""
+    
+    def test_buckets_tile_the_integers(self):
+        """Test that bucket ranges are contiguous and ordered."""
+        expected_low = 0
+        for bucket in range(bucket_of(1 << 40) + 1):
+            low, high = bucket_bounds(bucket)
+            assert low == expected_low
+            assert bucket_of(low) == bucket_of(high) == bucket
+            expected_low = high + 1
+    
+    def test_moments_match_statistics_module(self):
+        """Test Welford mean and variance against exact computation."""
+        random.seed(1)
+        values = [random.randrange(10_000) for _ in range(5000)]
+        stats = StreamingStats()
+        for value in values:
+            stats.add(value)
+        
+        assert stats.count == len(values)
+        assert stats.mean == pytest.approx(statistics.mean(values))
+        assert stats.variance == pytest.approx(statistics.variance(values))
+        assert (stats.min, stats.max) == (min(values), max(values))
+    
+    def test_quantiles_within_bucket_error(self):
+        """Test that quantiles are within the histogram's relative error."""
+        random.seed(2)
+        values = sorted(int(random.expovariate(1 / 500)) for _ in range(20_000))
+        stats = StreamingStats()
+        for value in values:
+            stats.add(value)
+        
+        for fraction in (0.1, 0.5, 0.9, 0.99):
+            exact = values[int(fraction * len(values)) - 1]
+            assert stats.quantile(fraction) == pytest.approx(exact, rel=1 / 16, abs=1)
+        assert stats.quantile(0.0) == min(values)
+        assert stats.quantile(1.0) == max(values)
+    
+    def test_merge_equals_single_stream(self):
+        """Test that merged partial summaries equal one combined summary."""
+        random.seed(3)
+        values = [random.randrange(300) for _ in range(3000)]
+        whole = StreamingStats()
+        parts = [StreamingStats() for _ in range(4)]
+        for i, value in enumerate(values):
+            whole.add(value)
+            parts[i % 3].add(value)
+        
+        merged = StreamingStats()
+        for part in parts:
+            merged.merge(part)
+        
+        assert merged.count == whole.count
+        assert merged.mean == pytest.approx(whole.mean)
+        assert merged.variance == pytest.approx(whole.variance)
+        assert (merged.min, merged.max) == (whole.min, whole.max)
+        assert merged.buckets == whole.buckets
+    
+    def test_empty(self):
+        """Test the summary of no samples."""
+        stats = StreamingStats()
+        
+        assert stats.quantile(0.5) is None
+        assert stats.variance is None
+        assert stats.to_dict()['mean'] is None
+
+
+class TestOutcomeStats:
+    """Test suite for OutcomeStats class."""
+    
+    def test_json_round_trip_and_merge(self):
+        """Test serializing collectors and merging them after a round trip."""
+        first = OutcomeStats()
+        first.record(30, 6, 120, 'self')
+        first.record(0, 3, 9, 'wall')
+        second = OutcomeStats()
+        second.record(50, 8, 300, 'self')
+        
+        restored = OutcomeStats.from_dict(json.loads(json.dumps(first.to_dict())))
+        restored.merge(OutcomeStats.from_dict(json.loads(json.dumps(second.to_dict()))))
+        
+        assert restored.games == 3
+        assert restored.causes == {'self': 2, 'wall': 1}
+        score = restored.metrics['score']
+        assert score.mean == pytest.approx(80 / 3)
+        assert (score.min, score.max) == (0, 50)
+        assert restored.metrics['ticks'].quantile(1.0) == 300
+    
+    def test_attach_records_engine_outcomes(self):
+        """Test that an attached collector records every finished game."""
+        engine = GameEngine(level_map=parse_map("#####\n#..S#\n#####\n"))
+        outcome = OutcomeStats()
+        outcome.attach(engine)
+        
+        engine.tick()
+        engine.restart()
+        engine.handle_input(Direction.UP)
+        engine.tick()
+        
+        assert outcome.games == 2
+        assert outcome.causes == {'wall': 2}
+        assert outcome.metrics['ticks'].max == 1
+        assert outcome.metrics['length'].mean == 3
+    
+    def test_board_full_cause(self):
+        """Test that a game won by filling the board is recorded as such."""
+        engine = GameEngine(board_width=4, board_height=1)
+        outcome = OutcomeStats()
+        outcome.attach(engine)
+        # Growing onto the food leaves no free cell for the next one
+        engine.snake.grow()
+        
+        engine.tick()
+        
+        assert outcome.causes == {BOARD_FULL: 1}
+        assert outcome.metrics['score'].max == 10
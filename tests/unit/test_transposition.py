@@ -0,0 +1,83 @@
+"""Unit tests for the TranspositionTable class."""
+
+import pytest
+from src.snake_game.transposition import NO_MOVE, TranspositionTable
+
+
+class TestTranspositionTable:
+    """Test suite for TranspositionTable class."""
+    
+    def test_size_rounds_up_to_power_of_two(self):
+        """Test that the slot count is a power of two fixed at creation."""
+        table = TranspositionTable(1000)
+        
+        assert table.size == 1024
+        assert table.nbytes == 1024 * 22
+        with pytest.raises(ValueError):
+            TranspositionTable(0)
+    
+    def test_store_and_probe(self):
+        """Test that stored results are found and others miss."""
+        table = TranspositionTable(64)
+        table.store(0xDEADBEEF00000001, 2.5, move=3)
+        
+        slot = table.probe(0xDEADBEEF00000001)
+        assert slot >= 0
+        assert table.values[slot] == 2.5
+        assert table.moves[slot] == 3
+        assert table.probe(0xDEADBEEF00000002) == -1
+        assert (table.probes, table.hits, len(table)) == (2, 1, 1)
+        assert table.hit_rate == 0.5
+    
+    def test_wide_keys_use_low_64_bits(self):
+        """Test that a key wider than 64 bits finds its own entry."""
+        table = TranspositionTable(64)
+        key = (0x5A << 64) | 0x1234
+        table.store(key, 1.5)
+        
+        assert table.probe(key) >= 0
+        assert table.probe(0x1234) == table.probe(key)
+    
+    def test_same_key_merges_samples(self):
+        """Test that results for one position are averaged."""
+        table = TranspositionTable(64)
+        table.store(7, 1.0)
+        table.store(7, 4.0, samples=2, move=1)
+        table.store(7, 0.0)
+        
+        slot = table.probe(7)
+        assert table.samples[slot] == 4
+        assert table.values[slot] == pytest.approx(9.0 / 4)
+        assert table.moves[slot] == 1
+        assert len(table) == 1
+    
+    def test_replacement_keeps_better_sampled_entries(self):
+        """Test the replacement policy on colliding keys."""
+        table = TranspositionTable(16)
+        table.store(5, 1.0, samples=10)
+        
+        # Same slot, fewer samples, same search: rejected
+        assert not table.store(5 + 16, 2.0)
+        assert table.rejections == 1
+        assert table.probe(5) >= 0
+        
+        # At least as many samples: replaces
+        assert table.store(5 + 32, 3.0, samples=10)
+        assert table.replacements == 1
+        assert table.probe(5) == -1
+        
+        # Entries from an earlier search give way to anything
+        table.new_search()
+        assert table.store(5 + 48, 4.0)
+        assert table.moves[table.probe(5 + 48)] == NO_MOVE
+    
+    def test_clear(self):
+        """Test that clearing drops entries and counters."""
+        table = TranspositionTable(16)
+        table.store(3, 1.0)
+        table.probe(3)
+        table.clear()
+        
+        assert len(table) == 0
+        assert table.probe(3) == -1
+        assert (table.hits, table.stores) == (0, 0)